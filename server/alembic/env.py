@@ -21,6 +21,9 @@ from app.core.database import Base # noqa: E402
 from app.models.user import User # noqa: F401, E402
 from app.models.repository import Repository # noqa: F401, E402
 from app.models.journal import Journal # noqa: F401, E402
+from app.models.journal_raw_commits import JournalRawCommits # noqa: F401
+from app.models.refresh_token import RefreshToken # noqa: F401
+from app.models.commit import Commit # noqa: F401
 # ----------------------------------------------------------------------
 
 # Interpret the config file for Python logging.
@@ -0,0 +1,98 @@
+"""Move journals.raw_commits to compressed journal_raw_commits table
+
+Revision ID: b7e1d4c90a52
+Revises: 8f4c2a91d3e7
+Create Date: 2026-10-16 22:41:08.517326
+
+"""
+import json
+import zlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e1d4c90a52'
+down_revision: str | Sequence[str] | None = '8f4c2a91d3e7'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 데이터 이동 배치 크기 (큰 JSON을 한 번에 메모리에 올리지 않도록)
+BATCH_SIZE = 500
+
+journals = sa.table(
+    'journals',
+    sa.column('id', sa.UUID()),
+    sa.column('raw_commits', postgresql.JSON()),
+)
+raw_commits = sa.table(
+    'journal_raw_commits',
+    sa.column('journal_id', sa.UUID()),
+    sa.column('codec', sa.String()),
+    sa.column('data', sa.LargeBinary()),
+    sa.column('original_size', sa.Integer()),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('journal_raw_commits',
+    sa.Column('journal_id', sa.UUID(), nullable=False),
+    sa.Column('codec', sa.String(length=16), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('original_size', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['journal_id'], ['journals.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('journal_id')
+    )
+
+    # 기존 raw_commits를 압축해 이동 (id 기준 keyset 페이지네이션)
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        stmt = (
+            sa.select(journals.c.id, journals.c.raw_commits)
+            .where(journals.c.raw_commits.isnot(None))
+            .order_by(journals.c.id)
+            .limit(BATCH_SIZE)
+        )
+        if last_id is not None:
+            stmt = stmt.where(journals.c.id > last_id)
+        rows = bind.execute(stmt).all()
+        if not rows:
+            break
+        values = []
+        for journal_id, commits in rows:
+            raw = json.dumps(commits, ensure_ascii=False, separators=(",", ":")).encode()
+            values.append({
+                'journal_id': journal_id,
+                'codec': 'zlib',
+                'data': zlib.compress(raw, 6),
+                'original_size': len(raw),
+            })
+        bind.execute(raw_commits.insert(), values)
+        last_id = rows[-1][0]
+
+    op.drop_column('journals', 'raw_commits')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('journals', sa.Column('raw_commits', postgresql.JSON(astext_type=sa.Text()), nullable=True))
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(raw_commits.c.journal_id, raw_commits.c.codec, raw_commits.c.data)).all()
+    for journal_id, codec, data in rows:
+        if codec != 'zlib':
+            raise ValueError(f"Unsupported codec: {codec}")
+        bind.execute(
+            journals.update()
+            .where(journals.c.id == journal_id)
+            .values(raw_commits=json.loads(zlib.decompress(data)))
+        )
+
+    op.drop_table('journal_raw_commits')
@@ -1,9 +1,10 @@
 from fastapi import APIRouter
-from app.api.v1 import auth, repositories, journals, stats
+from app.api.v1 import auth, repositories, journals, stats, webhooks
 
 api_router = APIRouter()
 
 api_router.include_router(auth.router, prefix="/auth", tags=["Auth"])
 api_router.include_router(repositories.router, prefix="/repositories", tags=["Repositories"])
 api_router.include_router(journals.router, prefix="/journals", tags=["Journals"])
-api_router.include_router(stats.router, prefix="/stats", tags=["Stats"])
\ No newline at end of file
+api_router.include_router(stats.router, prefix="/stats", tags=["Stats"])
+api_router.include_router(webhooks.router, prefix="/webhooks", tags=["Webhooks"])
\ No newline at end of file
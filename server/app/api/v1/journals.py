@@ -1,12 +1,21 @@
+import json
 from datetime import date as date_type
+from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 from redis.asyncio import Redis
 from uuid import UUID
 
 from app.api.deps import get_current_user, get_db, get_redis
+from app.core.config import settings
 from app.models.user import User
-from app.schemas.journal import JournalResponse, JournalUpdate, JournalListResponse, JournalStatusResponse
+from app.schemas.journal import BackfillReport, BackfillRequest, JournalResponse, JournalUpdate, JournalListResponse, JournalStatusResponse, JournalJobResponse
+from app.services import journal_job_service
+from app.services.gemini_service import GeminiServiceError
+from app.services.github_service import GithubApiError
+from app.services.journal_job_service import JobQueueUnavailableError
 from app.services.journal_service import JournalService
 
 from loguru import logger
@@ -24,10 +33,17 @@ async def check_daily_status(
     service = JournalService(db)
     return await service.check_daily_status(current_user, target_date)
 
-@router.post("", response_model=JournalResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=JournalResponse,
+    status_code=status.HTTP_201_CREATED,
+    responses={202: {"model": JournalJobResponse, "description": "async=true: 작업 등록됨"}},
+)
 async def create_journal(
     date: date_type | None = None,
     overwrite: bool = Query(True, description="이미 존재할 경우 덮어쓰기 여부"),
+    force: bool = Query(False, description="AI 생성 결과 캐시를 무시하고 새로 생성"),
+    run_async: bool = Query(False, alias="async", description="작업 큐에 등록하고 즉시 202 반환"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -35,22 +51,116 @@ async def create_journal(
     logger.info(f"[Journals APIRouter] ➡️ 오늘 일지 생성 진입: Today {date or date_type.today()}")
     
     target_date = date or date_type.today()
+
+    if run_async:
+        try:
+            job = await journal_job_service.enqueue_journal_job(current_user.id, target_date, overwrite, force)
+        except JobQueueUnavailableError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=job.model_dump(mode="json"))
+
     service = JournalService(db)
     
     try:
-        return await service.create_daily_journal(current_user, target_date, overwrite)
+        return await service.create_daily_journal(current_user, target_date, overwrite, force)
     
     except ValueError as e:
         # 서비스에서 발생한 비즈니스 에러를 HTTP 에러로 변환
         raise HTTPException(status_code=400, detail=str(e))
+
+@router.post(
+    "/backfill",
+    response_model=BackfillReport,
+    responses={202: {"model": JournalJobResponse, "description": "async=true: 작업 등록됨"}},
+)
+async def backfill_journals(
+    request: BackfillRequest,
+    run_async: bool = Query(False, alias="async", description="작업 큐에 등록하고 즉시 202 반환 (긴 기간 권장)"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """기간 일지 일괄 생성 (이미 생성된 날짜는 건너뜀, 다시 실행하면 남은 날짜부터 이어서 처리)"""
+    logger.info(f"[Journals APIRouter] ➡️ 일지 백필 진입: {request.start_date} ~ {request.end_date}")
+    if run_async:
+        try:
+            job = await journal_job_service.enqueue_backfill_job(
+                current_user.id, request.start_date, request.end_date, request.overwrite
+            )
+        except JobQueueUnavailableError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        return JSONResponse(status_code=status.HTTP_202_ACCEPTED, content=job.model_dump(mode="json"))
+
+    service = JournalService(db)
+    try:
+        return await service.backfill_journals(current_user, request.start_date, request.end_date, request.overwrite)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/jobs/{job_id}", response_model=JournalJobResponse)
+async def read_journal_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+):
+    """비동기 일지 생성 작업 상태 조회"""
+    try:
+        job = await journal_job_service.get_journal_job(current_user.id, job_id)
+    except JobQueueUnavailableError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+def _sse(event: str, data) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    payload = data.model_dump_json() if isinstance(data, BaseModel) else json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+@router.post("/stream")
+async def stream_journal(
+    date: date_type | None = None,
+    overwrite: bool = Query(True, description="이미 존재할 경우 덮어쓰기 여부"),
+    force: bool = Query(False, description="AI 생성 결과 캐시를 무시하고 새로 생성"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    개발 일지 생성 (SSE 스트리밍)
+
+    progress(started → commits_fetched → ai_started) → summary(부분 텍스트) → journal(JournalResponse)
+    순서로 이벤트를 보내며, 실패 시 error 이벤트(detail, status_code)로 종료합니다.
+    AI 스트림이 중간에 실패해 일반 호출로 대체되면 summary_reset 이벤트 이후의 summary/journal을 기준으로 표시합니다.
+    """
+    target_date = date or date_type.today()
+    logger.info(f"[Journals APIRouter] ➡️ 일지 스트리밍 생성 진입: {target_date}")
+    service = JournalService(db)
+
+    async def events():
+        try:
+            async for event, data in service.stream_daily_journal(current_user, target_date, overwrite, force):
+                yield _sse(event, data)
+        except ValueError as e:
+            yield _sse("error", {"detail": str(e), "status_code": 400})
+        except (GithubApiError, GeminiServiceError) as e:
+            yield _sse("error", {"detail": e.message, "status_code": e.status_code})
+        except Exception as e:  # noqa: BLE001 - 응답 헤더가 이미 전송되어 예외 핸들러 대신 error 이벤트로 종료
+            logger.error(f"❌ 일지 스트리밍 생성 실패: {e}")
+            yield _sse("error", {"detail": "Internal server error", "status_code": 500})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # 프록시 버퍼링으로 이벤트가 늦게 전달되지 않도록 설정
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
     
-@router.get("", response_model=JournalListResponse)
+@router.get("", response_model=JournalListResponse, response_model_exclude_unset=True)
 async def read_journals(
     page: int = Query(1, ge=1),
     size: int = Query(10, ge=1, le=100),
     repository_id: UUID = Query(..., description="저장소 ID 필터"),
     start_date: date_type | None = None,
     end_date: date_type | None = None,
+    fields: str | None = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: date,summary / id는 항상 포함)"),
     currnet_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -59,14 +169,18 @@ async def read_journals(
     
     service = JournalService(db)
     
-    items, total = await service.get_journals(
-        user_id=currnet_user.id,
-        page=page,
-        size=size,
-        start_date=start_date,
-        end_date=end_date,
-        repository_id=repository_id
-    )
+    try:
+        items, total = await service.get_journals(
+            user_id=currnet_user.id,
+            page=page,
+            size=size,
+            start_date=start_date,
+            end_date=end_date,
+            repository_id=repository_id,
+            fields=[f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
      
     return {
         'items': items,
@@ -95,6 +209,21 @@ async def read_journal(
 
     return journal
 
+@router.get("/{journal_id}/raw-commits", response_model=list[dict[str, Any]])
+async def read_journal_raw_commits(
+    journal_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """일지 생성에 사용한 원본 커밋 조회 (디버그 모드 전용)"""
+    if not settings.DEBUG:
+        raise HTTPException(status_code=404, detail="Not found")
+    service = JournalService(db)
+    raw_commits = await service.get_raw_commits(current_user.id, journal_id)
+    if raw_commits is None:
+        raise HTTPException(status_code=404, detail="Raw commits not found")
+    return raw_commits
+
 @router.patch("/{journal_id}", response_model=JournalResponse)
 async def update_journal(
     journal_id: UUID,
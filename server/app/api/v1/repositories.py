@@ -1,12 +1,11 @@
-from typing import List
+from typing import List, Literal
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
 from app.models.user import User
-from app.schemas.repository import GithubRepo, RepositorySelect, RepositoryResponse
-from app.services.github_service import get_repositories as fetch_github_repos
-from app.services import repository_service
+from app.schemas.repository import GithubRepo, RepositorySelect, RepositoryResponse, RepositorySearchResponse
+from app.services import repository_service, repo_index_service
 
 router = APIRouter()
 
@@ -17,17 +16,37 @@ async def get_repositories(
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 크기")
 ):
-    """GitHub 저장소 목록 조회"""
-    github_repos = await fetch_github_repos(
+    """GitHub 저장소 목록 조회 (사용자별 캐시, 만료 시 백그라운드 갱신)"""
+    return await repository_service.get_repositories(
+        user_id=current_user.id,
         access_token=current_user.decrypted_access_token,
         page=page,
-        per_page=size
+        per_page=size,
+        db=db
     )
-    
-    return await repository_service.get_merged_repositories(
+
+@router.get("/search", response_model=RepositorySearchResponse)
+async def search_repositories(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    q: str = Query("", max_length=100, description="저장소 이름/설명 검색어"),
+    private: bool | None = Query(None, description="공개/비공개 필터"),
+    language: str | None = Query(None, description="주 언어 필터"),
+    sort: Literal["relevance", "updated", "name", "stars"] = Query("relevance", description="정렬 기준"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    size: int = Query(20, ge=1, le=100, description="페이지 크기")
+):
+    """전체 저장소 검색 (인덱스가 없으면 생성을 시작하고 status=building 반환)"""
+    return await repo_index_service.search_repositories(
         user_id=current_user.id,
-        github_repos=github_repos,
-        db=db
+        access_token=current_user.decrypted_access_token,
+        db=db,
+        query=q,
+        private=private,
+        language=language,
+        sort=sort,
+        page=page,
+        size=size
     )
 
 @router.post("/select", response_model=RepositoryResponse)
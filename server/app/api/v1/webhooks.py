@@ -0,0 +1,49 @@
+import json
+
+from fastapi import APIRouter, BackgroundTasks, Header, HTTPException, Request, status
+from loguru import logger
+
+from app.core.config import settings
+from app.services import commit_service
+
+router = APIRouter()
+
+@router.post("/github", status_code=status.HTTP_202_ACCEPTED)
+async def github_webhook(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    x_github_event: str | None = Header(None),
+    x_hub_signature_256: str | None = Header(None),
+):
+    """
+    GitHub push Webhook 수신 (커밋을 로컬 저장소에 적재)
+
+    GitHub 전달 타임아웃(10초) 안에 응답하도록 페이로드만 대기열에 저장하고,
+    커밋 상세 조회/저장은 응답 후 백그라운드에서 수행합니다.
+    """
+    if not settings.GITHUB_WEBHOOK_SECRET:
+        raise HTTPException(status_code=503, detail="Webhook is not configured")
+
+    body = await request.body()
+    if not commit_service.verify_signature(body, x_hub_signature_256, settings.GITHUB_WEBHOOK_SECRET):
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    if x_github_event != "push":
+        return {"event": x_github_event, "queued": False}
+
+    try:
+        payload = json.loads(body)
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+
+    repo_name = commit_service.push_repo_name(payload)
+    if not repo_name:
+        return {"event": x_github_event, "queued": False}
+
+    if await commit_service.enqueue_push(payload):
+        background_tasks.add_task(commit_service.process_push_queue)
+    else:
+        # Redis 미연결: 대기열 없이 이 페이로드만 백그라운드 처리
+        background_tasks.add_task(commit_service.process_push, payload)
+    logger.info(f"[Webhooks APIRouter] push 수신: {repo_name} | 커밋 {len(payload.get('commits', []))}건")
+    return {"event": x_github_event, "queued": True}
@@ -0,0 +1,47 @@
+"""
+기간 일지 백필 CLI
+
+    python -m app.backfill --user <github_username> --start 2025-01-01 --end 2025-03-31 [--overwrite] [--concurrency N]
+
+중단된 경우 같은 명령을 다시 실행하면 이미 생성된 날짜는 건너뛰고 이어서 처리합니다.
+"""
+import argparse
+import asyncio
+from datetime import date
+
+from loguru import logger
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.github_client import close_github_client, init_github_client
+from app.core.redis import close_shared_redis, init_shared_redis
+from app.models import User
+from app.services.journal_service import JournalService
+
+
+async def main(args: argparse.Namespace):
+    await init_github_client()
+    await init_shared_redis()
+    try:
+        async with AsyncSessionLocal() as db:
+            user = (await db.execute(select(User).where(User.github_username == args.user))).scalar_one_or_none()
+            if user is None:
+                logger.error(f"❌ 사용자를 찾을 수 없습니다: {args.user}")
+                return
+            report = await JournalService(db).backfill_journals(
+                user, args.start, args.end, args.overwrite, args.concurrency
+            )
+            print(report.model_dump_json(indent=2))
+    finally:
+        await close_github_client()
+        await close_shared_redis()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DevLog AI 기간 일지 백필")
+    parser.add_argument("--user", required=True, help="GitHub 사용자명")
+    parser.add_argument("--start", required=True, type=date.fromisoformat)
+    parser.add_argument("--end", required=True, type=date.fromisoformat)
+    parser.add_argument("--overwrite", action="store_true", help="이미 존재하는 일지도 다시 생성")
+    parser.add_argument("--concurrency", type=int, default=settings.JOURNAL_BACKFILL_CONCURRENCY)
+    asyncio.run(main(parser.parse_args()))
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -31,11 +33,101 @@ class Settings(BaseSettings):
     GITHUB_CLIENT_ID: str | None = None
     GITHUB_CLIENT_SECRET: str | None = None
     GITHUB_REDIRECT_URI: str = "http://localhost:8000/api/v1/auth/github/callback"
+    GITHUB_WEBHOOK_SECRET: str | None = None  # push Webhook 서명(X-Hub-Signature-256) 검증용
+    # Webhook 수집 커버리지 유지 시간 (만료 후 다음 push부터 다시 시작, 전달되지 않은 push의 영향을 이 시간으로 제한)
+    GITHUB_WEBHOOK_COVERAGE_SECONDS: int = 3 * 86400
+
+    # GitHub 공용 HTTP 클라이언트 (커넥션 풀)
+    GITHUB_HTTP2: bool = True
+    GITHUB_HTTP_MAX_CONNECTIONS: int = 100
+    GITHUB_HTTP_MAX_KEEPALIVE: int = 20
+    GITHUB_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    GITHUB_HTTP_TIMEOUT: float = 10.0
+    GITHUB_HTTP_CONNECT_TIMEOUT: float = 5.0
+    GITHUB_HTTP_POOL_TIMEOUT: float = 10.0
+
+    # GitHub 동시성 / Rate Limit 제어
+    GITHUB_MAX_CONCURRENCY: int = 20
+    GITHUB_PER_TOKEN_CONCURRENCY: int = 5
+    GITHUB_RATE_LIMIT_LOW_WATERMARK: int = 100
+    GITHUB_RATE_LIMIT_MAX_WAIT: float = 10.0
+    GITHUB_RATE_LIMIT_MAX_RETRIES: int = 2
+    # 일지 생성(HIGH)용으로 남겨 둘 할당량. 이하로 떨어지면 LOW 요청은 리셋까지 지연/거절
+    GITHUB_QUOTA_RESERVE: int = 500
+    GITHUB_LOW_PRIORITY_CONCURRENCY: int = 2
+    GITHUB_LOW_PRIORITY_MAX_WAIT: float = 2.0
+
+    # GitHub 조건부 요청(ETag) 캐시
+    GITHUB_ETAG_TTL_SECONDS: int = 86400
+    GITHUB_ETAG_MAX_BODY_BYTES: int = 512 * 1024
+
+    # 커밋 상세 캐시 (SHA 기반, 프로세스 LRU + Redis)
+    GITHUB_COMMIT_CACHE_MAX_ENTRIES: int = 2048
+    GITHUB_COMMIT_CACHE_TTL_SECONDS: int = 7 * 86400
+
+    # 커밋 상세에서 분석 제외할 파일 (확장자 + fnmatch glob 패턴, '*'는 '/'도 매칭)
+    GITHUB_IGNORED_EXTENSIONS: list[str] = [".lock", ".png", ".jpg", ".svg", ".pdf", ".min.js"]
+    GITHUB_IGNORED_GLOBS: list[str] = ["vendor/*", "*/vendor/*", "node_modules/*", "*/node_modules/*"]
+
+    # 커밋 히스토리 조회 방식: "rest" (목록 + 커밋별 상세) | "graphql" (페이지당 1회 왕복)
+    GITHUB_COMMIT_BACKEND: Literal["rest", "graphql"] = "rest"
+    GITHUB_GRAPHQL_URL: str = "https://api.github.com/graphql"
+
+    # 커밋 존재 여부 확인(daily-status) 캐시 TTL: 오늘/미래 날짜는 짧게, 지난 날짜는 길게
+    GITHUB_PROBE_TTL_SECONDS: int = 60
+    GITHUB_PROBE_PAST_TTL_SECONDS: int = 86400
+
+    # 저장소 선택 목록 캐시 (soft TTL 경과 시 기존 값을 반환하고 백그라운드 갱신, hard TTL 경과 시 삭제)
+    REPO_CACHE_SOFT_TTL_SECONDS: int = 300
+    REPO_CACHE_HARD_TTL_SECONDS: int = 86400
+
+    # 저장소 전체 인덱스 (검색용, soft TTL 경과 시 백그라운드 재생성)
+    REPO_INDEX_SOFT_TTL_SECONDS: int = 3600
+    REPO_INDEX_HARD_TTL_SECONDS: int = 7 * 86400
+    REPO_INDEX_LOCAL_MAX_USERS: int = 256
 
     GEMINI_API_KEY: str | None = None
     GEMINI_MODEL: str = "gemini-2.0-flash"
     GEMINI_MAX_TOKENS: int = 1000
     GEMINI_TEMPERATURE: float = 0.7
+    # 동일 입력(커밋/모델 설정/프롬프트 버전) 생성 결과 캐시 TTL
+    GEMINI_CACHE_TTL_SECONDS: int = 7 * 86400
+    # 프롬프트에 넣을 커밋 데이터의 입력 토큰 예산 (초과분은 중요도 낮은 patch/파일/커밋부터 제외)
+    GEMINI_INPUT_TOKEN_BUDGET: int = 12000
+    # 커밋 데이터가 이 토큰 수를 넘으면 청크별 요약(map) 후 통합(reduce)
+    GEMINI_MAP_REDUCE_THRESHOLD_TOKENS: int = 36000
+    GEMINI_MAP_CHUNK_TOKENS: int = 8000
+    GEMINI_MAP_CONCURRENCY: int = 4
+    # 프로세스 내 동시 호출 수 / 대기열 길이 (초과 시 503)
+    GEMINI_MAX_CONCURRENCY: int = 4
+    GEMINI_MAX_QUEUE: int = 32
+    GEMINI_QUEUE_TIMEOUT_SECONDS: float = 30.0
+    # 전체 워커 합산 동시 호출 수 (Redis 조율, 0이면 사용하지 않음)
+    GEMINI_GLOBAL_CONCURRENCY: int = 0
+    # 재시도 (할당량 초과는 서버 힌트가 이 시간 이하일 때만 재시도)
+    GEMINI_RETRY_ATTEMPTS: int = 3
+    GEMINI_RETRY_MAX_WAIT_SECONDS: float = 10.0
+    # 연속 일시 장애 N회 시 서킷 오픈, 일정 시간 후 시험 호출
+    GEMINI_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    GEMINI_CIRCUIT_RECOVERY_SECONDS: float = 30.0
+
+    # 비동기 일지 생성 작업 (python -m app.worker)
+    JOURNAL_JOB_CONCURRENCY: int = 4
+    JOURNAL_JOB_MAX_ATTEMPTS: int = 3
+    JOURNAL_JOB_RETRY_BASE_SECONDS: int = 10
+    # 처리 중 작업의 리스 유지 시간: 하트비트가 이 시간 동안 없으면 워커 종료로 보고 재시작 시 복구
+    JOURNAL_JOB_TIMEOUT_SECONDS: int = 600
+    JOURNAL_JOB_HEARTBEAT_SECONDS: int = 60
+    # 처리 중 목록에서 리스가 끊긴 작업을 찾는 주기 (워커 재시작 없이도 다른 워커의 비정상 종료 복구)
+    JOURNAL_JOB_RECOVERY_INTERVAL_SECONDS: int = 60
+    JOURNAL_JOB_TTL_SECONDS: int = 86400
+    # 같은 (사용자, 저장소, 날짜) 일지 생성은 한 번만 수행 (워커 간 Redis 락 유지 시간)
+    JOURNAL_SINGLE_FLIGHT_LOCK_SECONDS: int = 300
+
+    # 기간 일지 백필
+    JOURNAL_BACKFILL_MAX_DAYS: int = 366
+    JOURNAL_BACKFILL_CONCURRENCY: int = 3
+    JOURNAL_BACKFILL_BATCH_SIZE: int = 10
 
     # --- Utils ---
     FRONTEND_URL: str = "http://localhost:4173"
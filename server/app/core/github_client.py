@@ -0,0 +1,131 @@
+import time
+
+import httpx
+from loguru import logger
+
+from app.core.config import settings
+
+# 프로세스 단위로 공유하는 GitHub HTTP 클라이언트 (lifespan에서 생성/종료)
+_client: httpx.AsyncClient | None = None
+
+# 커넥션 풀 사이징용 누적 지표
+_pool_metrics = {
+    "requests": 0,
+    "connections_opened": 0,
+    "wait_samples": 0,
+    "wait_ms_total": 0.0,
+    "wait_ms_max": 0.0,
+}
+
+def _build_client() -> httpx.AsyncClient:
+    """커넥션 제한, HTTP/2, Keep-Alive가 설정된 AsyncClient 생성"""
+    limits = httpx.Limits(
+        max_connections=settings.GITHUB_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.GITHUB_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=settings.GITHUB_HTTP_KEEPALIVE_EXPIRY,
+    )
+    timeout = httpx.Timeout(
+        settings.GITHUB_HTTP_TIMEOUT,
+        connect=settings.GITHUB_HTTP_CONNECT_TIMEOUT,
+        pool=settings.GITHUB_HTTP_POOL_TIMEOUT,
+    )
+    return httpx.AsyncClient(
+        http2=settings.GITHUB_HTTP2,
+        limits=limits,
+        timeout=timeout,
+        headers={"User-Agent": f"{settings.PROJECT_NAME}/{settings.VERSION}"},
+    )
+
+async def init_github_client() -> httpx.AsyncClient:
+    """앱 시작 시 공용 클라이언트 생성"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+        logger.info(f"✅ GitHub HTTP client ready (http2={settings.GITHUB_HTTP2})")
+    return _client
+
+def get_github_client() -> httpx.AsyncClient:
+    """
+    공용 클라이언트 반환
+    lifespan 밖(스크립트, 테스트)에서 호출되면 지연 생성합니다.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+async def close_github_client():
+    """앱 종료 시 커넥션 풀 정리"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+async def github_request(
+    method: str,
+    url: str,
+    *,
+    timeout: float | None = None,
+    stream: bool = False,
+    **kwargs
+) -> httpx.Response:
+    """
+    공용 클라이언트로 GitHub 요청 수행 (호출별 타임아웃 지원)
+
+    요청 시작부터 헤더 전송 직전까지의 시간을 커넥션 대기 시간으로 기록합니다.
+    (풀 대기 + 신규 연결 시 TCP/TLS 핸드셰이크 포함)
+
+    stream=True면 본문을 읽지 않은 응답을 반환하므로 호출자가 aclose()로 닫아야 합니다.
+    """
+    client = get_github_client()
+    started = time.perf_counter()
+    waited = False
+
+    async def trace(event_name: str, info: dict):
+        nonlocal waited
+        if event_name == "connection.connect_tcp.complete":
+            _pool_metrics["connections_opened"] += 1
+        elif event_name.endswith("send_request_headers.started") and not waited:
+            waited = True
+            wait_ms = (time.perf_counter() - started) * 1000
+            _pool_metrics["wait_samples"] += 1
+            _pool_metrics["wait_ms_total"] += wait_ms
+            _pool_metrics["wait_ms_max"] = max(_pool_metrics["wait_ms_max"], wait_ms)
+
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+
+    _pool_metrics["requests"] += 1
+    if stream:
+        request = client.build_request(method, url, extensions={"trace": trace}, **kwargs)
+        return await client.send(request, stream=True)
+    return await client.request(method, url, extensions={"trace": trace}, **kwargs)
+
+def get_pool_stats() -> dict:
+    """커넥션 풀 상태 (열린/유휴 커넥션, 대기 요청, 평균/최대 대기 시간)"""
+    open_connections = 0
+    idle_connections = 0
+    queued_requests = 0
+
+    # httpx가 공개 API로 풀 상태를 노출하지 않아 transport 내부 풀을 조회
+    pool = getattr(getattr(_client, "_transport", None), "_pool", None)
+    if pool is not None:
+        connections = list(getattr(pool, "connections", []))
+        open_connections = sum(1 for c in connections if not c.is_closed())
+        idle_connections = sum(1 for c in connections if c.is_idle())
+        queued_requests = sum(1 for r in getattr(pool, "_requests", []) if r.is_queued())
+
+    samples = _pool_metrics["wait_samples"]
+    return {
+        "started": _client is not None and not _client.is_closed,
+        "http2": settings.GITHUB_HTTP2,
+        "max_connections": settings.GITHUB_HTTP_MAX_CONNECTIONS,
+        "max_keepalive_connections": settings.GITHUB_HTTP_MAX_KEEPALIVE,
+        "open_connections": open_connections,
+        "idle_connections": idle_connections,
+        "queued_requests": queued_requests,
+        "requests": _pool_metrics["requests"],
+        "connections_opened": _pool_metrics["connections_opened"],
+        "wait_ms_avg": round(_pool_metrics["wait_ms_total"] / samples, 2) if samples else 0.0,
+        "wait_ms_max": round(_pool_metrics["wait_ms_max"], 2),
+    }
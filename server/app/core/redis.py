@@ -2,6 +2,9 @@ from redis.asyncio import Redis, from_url
 from app.core.config import settings
 from loguru import logger
 
+# 서비스 계층(GitHub 캐시 등)이 공유하는 프로세스 단위 Redis 클라이언트
+_shared_redis: Redis | None = None
+
 async def get_redis_client() -> Redis | None:
     """Redis 클라이언트 생성 및 반환"""
     # 테스트 환경 등에서 REDIS_URL이 없을 경우를 대비해 예외처리 가능
@@ -28,4 +31,21 @@ async def get_redis_client() -> Redis | None:
 async def close_redis_client(redis: Redis):
     """Redis 연결 종료"""
     if redis:
-        await redis.close()
\ No newline at end of file
+        await redis.close()
+
+async def init_shared_redis() -> Redis | None:
+    """앱 시작 시 공용 Redis 클라이언트 생성"""
+    global _shared_redis
+    if _shared_redis is None:
+        _shared_redis = await get_redis_client()
+    return _shared_redis
+
+def get_shared_redis() -> Redis | None:
+    """공용 Redis 클라이언트 반환 (미연결 시 None → 캐시 비활성)"""
+    return _shared_redis
+
+async def close_shared_redis():
+    """앱 종료 시 공용 Redis 연결 종료"""
+    global _shared_redis
+    await close_redis_client(_shared_redis)
+    _shared_redis = None
@@ -1,14 +1,35 @@
 import json
+import math
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from app.core.config import settings
 from app.api.v1 import api_router
+from app.core.github_client import init_github_client, close_github_client, get_pool_stats
+from app.core.redis import init_shared_redis, close_shared_redis
+from app.services.github_cache import get_etag_stats, commit_detail_cache
+from app.services.github_scheduler import github_scheduler
 from app.services.github_service import GithubApiError
+from app.services.gemini_limiter import gemini_limiter
+from app.services.gemini_service import GeminiServiceError, get_gemini_error_stats, get_generation_cache_stats
+from app.services.journal_service import journal_flight
+from app.services.prompt_builder import get_prompt_stats
 from loguru import logger
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 공용 리소스(GitHub 커넥션 풀, Redis) 관리"""
+    await init_github_client()
+    await init_shared_redis()
+    yield
+    await close_github_client()
+    await close_shared_redis()
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    version=settings.VERSION
+    version=settings.VERSION,
+    lifespan=lifespan
 )
 
 try:
@@ -37,9 +58,24 @@ app.include_router(api_router, prefix="/api/v1")
 
 @app.exception_handler(GithubApiError)
 async def github_exception_handler(request: Request, exc: GithubApiError):
+    headers = None
+    if getattr(exc, "retry_after", None):
+        headers = {"Retry-After": str(math.ceil(exc.retry_after))}
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"detail": exc.message},
+        headers=headers,
+    )
+
+@app.exception_handler(GeminiServiceError)
+async def gemini_exception_handler(request: Request, exc: GeminiServiceError):
+    headers = None
+    if getattr(exc, "retry_after", None):
+        headers = {"Retry-After": str(math.ceil(exc.retry_after))}
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.message},
+        headers=headers,
     )
 
 @app.get("/health")
@@ -51,6 +87,21 @@ def health_check():
         "version": settings.VERSION
     }
 
+@app.get("/metrics")
+def metrics():
+    """운영 지표 (커넥션 풀 사이징용)"""
+    return {
+        "github_http": get_pool_stats(),
+        "github_etag": get_etag_stats(),
+        "github_commit_cache": commit_detail_cache.stats(),
+        "github_scheduler": github_scheduler.stats(),
+        "gemini_cache": get_generation_cache_stats(),
+        "gemini_prompt": get_prompt_stats(),
+        "gemini_limiter": gemini_limiter.stats(),
+        "gemini_errors": get_gemini_error_stats(),
+        "journal_single_flight": journal_flight.stats(),
+    }
+
 @app.get("/")
 def root():
     return {"message": "Welcome to DevLog AI API"}
@@ -1,7 +1,9 @@
 from .user import User
 from .repository import Repository
 from .journal import Journal
+from .journal_raw_commits import JournalRawCommits
 from .refresh_token import RefreshToken
+from .commit import Commit
 # 모델들이 서로 참조(relationship)하므로, 
 # 여기서 한 번에 임포트하여 SQLAlchemy가 레지스트리에 등록하게 합니다.
-__all__ = ["User", "Repository", "Journal", "RefreshToken"]
\ No newline at end of file
+__all__ = ["User", "Repository", "Journal", "JournalRawCommits", "RefreshToken", "Commit"]
\ No newline at end of file
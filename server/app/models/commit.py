@@ -0,0 +1,39 @@
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class Commit(Base):
+    """
+    로컬 커밋 저장소 (Webhook 수집 + API 조회 결과 write-through)
+
+    커밋 내용은 SHA가 같으면 변하지 않으므로 사용자와 무관하게 저장소+SHA 단위로 보관합니다.
+    """
+    __tablename__ = "commits"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # 저장소 풀네임 (소문자로 정규화, 예: "octocat/hello-world")
+    repo_name: Mapped[str] = mapped_column(String(255))
+    sha: Mapped[str] = mapped_column(String(40))
+    committed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))  # UTC
+
+    # 정제된 커밋 상세 (fetch_commits 결과와 동일한 형식)
+    message: Mapped[str] = mapped_column(Text)
+    additions: Mapped[int] = mapped_column(Integer, default=0)
+    deletions: Mapped[int] = mapped_column(Integer, default=0)
+    changed_files: Mapped[int] = mapped_column(Integer, default=0)
+    files: Mapped[list[dict[str, Any]]] = mapped_column(JSON)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('repo_name', 'sha', name='uq_commit_repo_sha'),
+        Index('ix_commit_repo_committed_at', 'repo_name', 'committed_at'),
+    )
@@ -1,6 +1,5 @@
 import uuid
 from datetime import date as dateType, datetime
-from typing import Any
 
 from sqlalchemy import String, Integer, Date, DateTime, ForeignKey, UniqueConstraint, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSON
@@ -31,9 +30,6 @@ class Journal(Base):
     lines_added: Mapped[int] = mapped_column(Integer, default=0)
     lines_deleted: Mapped[int] = mapped_column(Integer, default=0)
     
-    # Debug Data (Nullable)
-    raw_commits: Mapped[dict[str, Any] | None] = mapped_column(JSON)
-    
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,31 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, LargeBinary, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class JournalRawCommits(Base):
+    """
+    일지 생성에 사용한 원본 커밋 (디버깅/재생성용, 압축 저장)
+
+    일지 목록/상세/통계 조회가 읽는 journals 행을 가볍게 유지하기 위해 별도 테이블에 둡니다.
+    관계(relationship)를 두지 않으므로 명시적으로 조회할 때만 로드됩니다.
+    """
+    __tablename__ = "journal_raw_commits"
+
+    journal_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("journals.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # 압축 방식 (app.utils.compression)
+    codec: Mapped[str] = mapped_column(String(16))
+    data: Mapped[bytes] = mapped_column(LargeBinary)
+    # 압축 전 JSON 바이트 수 (압축률 확인용)
+    original_size: Mapped[int] = mapped_column(Integer)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now())
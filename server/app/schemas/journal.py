@@ -1,6 +1,6 @@
 from uuid import UUID
 from datetime import date as date_type, datetime
-from typing import Any
+from typing import Any, Literal
 from pydantic import BaseModel, ConfigDict, Field
 
 class JournalBase(BaseModel):
@@ -36,8 +36,31 @@ class JournalResponse(JournalBase):
     
     model_config = ConfigDict(from_attributes=True)
     
+class JournalListItem(BaseModel):
+    """
+    일지 목록 행 (필요한 컬럼만 조회해 바로 생성하는 DTO)
+
+    ?fields=로 요청한 필드만 설정되며, 응답에서는 설정되지 않은 필드를 제외합니다.
+    """
+    id: UUID
+    date: date_type | None = None
+    summary: str | None = None
+    main_tasks: list[str] | None = None
+    learned_things: list[str] | None = None
+    commit_count: int | None = None
+    files_changed: int | None = None
+    lines_added: int | None = None
+    lines_deleted: int | None = None
+    user_id: UUID | None = None
+    repository_id: UUID | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+# 목록에서 선택 가능한 필드 (id는 항상 포함)
+JOURNAL_LIST_FIELDS = tuple(JournalListItem.model_fields)
+
 class JournalListResponse(BaseModel):
-    items: list[JournalResponse] = Field(..., description="현재 페이지의 일지 목록")
+    items: list[JournalListItem] = Field(..., description="현재 페이지의 일지 목록")
     total: int = Field(..., description="전체 일지 개수")
     page: int = Field(..., description="현재 페이지 번호")
     size: int = Field(..., description="페이지 크기")
@@ -47,4 +70,36 @@ class JournalStatusResponse(BaseModel):
     date: date_type
     has_journal: bool = Field(..., description="오늘 일지 이미 생성됨 여부")
     has_commits: bool = Field(..., description="오늘 커밋 존재 여부")
-    can_generate: bool = Field(..., description="일지 생성 가능 여부 (커밋O AND 일지X)")
\ No newline at end of file
+    can_generate: bool = Field(..., description="일지 생성 가능 여부 (커밋O AND 일지X)")
+
+class BackfillRequest(BaseModel):
+    start_date: date_type
+    end_date: date_type
+    overwrite: bool = Field(False, description="이미 존재하는 일지도 다시 생성")
+
+class BackfillReport(BaseModel):
+    """백필 결과 및 처리량"""
+    start_date: date_type
+    end_date: date_type
+    days_total: int = 0
+    days_existing: int = Field(0, description="이미 일지가 있어 건너뛴 날짜 수")
+    days_without_commits: int = 0
+    days_generated: int = 0
+    failed_days: int = 0
+    list_calls: int = Field(0, description="커밋 목록 요청(페이지) 수")
+    calls_saved: int = Field(0, description="날짜별 요청 대비 절감한 목록 요청 수")
+    elapsed_seconds: float = 0.0
+    days_per_minute: float = 0.0
+
+class JournalJobResponse(BaseModel):
+    """비동기 일지 생성 작업 상태"""
+    id: str
+    kind: Literal["daily", "backfill"] = "daily"
+    status: Literal["queued", "running", "succeeded", "failed"]
+    date: date_type = Field(..., description="대상 날짜 (backfill: 시작 날짜)")
+    attempts: int = Field(0, description="시도 횟수 (재시도 포함)")
+    journal_id: UUID | None = Field(None, description="생성된 일지 ID (daily, succeeded)")
+    result: BackfillReport | None = Field(None, description="백필 결과 (backfill, succeeded)")
+    error: str | None = Field(None, description="마지막 실패 사유")
+    created_at: datetime
+    updated_at: datetime
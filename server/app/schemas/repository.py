@@ -1,5 +1,6 @@
 from uuid import UUID
 from datetime import datetime
+from typing import Literal
 from pydantic import BaseModel, HttpUrl, ConfigDict, Field
 
 # 1. GitHub API에서 받아오는 순수 데이터 구조
@@ -13,6 +14,17 @@ class GithubRepo(BaseModel):
     # UI 편의를 위해 DB 상태와 병합될 필드
     is_selected: bool = False
 
+# 1-1. 검색 인덱스에 저장되는 저장소 (정렬/필터용 필드 포함)
+class IndexedRepo(GithubRepo):
+    language: str | None = None
+    stargazers_count: int = 0
+    updated_at: datetime | None = None
+
+class RepositorySearchResponse(BaseModel):
+    status: Literal["ready", "building"]  # building: 인덱스 생성 중 (잠시 후 재요청)
+    total: int
+    items: list[IndexedRepo]
+
 # 2. 클라이언트가 저장소 선택 요청 시 보낼 데이터
 class RepositorySelect(BaseModel):
     repo_name: str = Field(..., description="GitHub 저장소 전체 이름 (예: user/repo)")
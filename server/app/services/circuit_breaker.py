@@ -0,0 +1,75 @@
+import time
+
+from loguru import logger
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출을 즉시 거절"""
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after  # 다음 시험 호출까지 남은 시간(초)
+        super().__init__(f"circuit open (retry after {retry_after:.0f}s)")
+
+class CircuitBreaker:
+    """
+    프로세스 단위 서킷 브레이커
+
+    - closed: 정상 호출, 연속 실패가 failure_threshold에 도달하면 open
+    - open: recovery_seconds 동안 호출을 즉시 거절 (CircuitOpenError)
+    - half_open: 시험 호출 1건만 허용, 성공하면 closed / 실패하면 다시 open
+
+    상태 전환 횟수는 stats()로 노출합니다.
+    """
+    def __init__(self, name: str, failure_threshold: int, recovery_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_started_at: float | None = None
+        self._stats = {"rejected": 0, "transitions": {}}
+
+    def _transition(self, state: str):
+        key = f"{self.state}_to_{state}"
+        self._stats["transitions"][key] = self._stats["transitions"].get(key, 0) + 1
+        log = logger.warning if state == "open" else logger.info
+        log(f"🔌 서킷 브레이커 상태 변경 ({self.name}): {self.state} → {state}")
+        self.state = state
+
+    def before_call(self):
+        """호출 가능 여부 확인 (거절 시 CircuitOpenError)"""
+        now = time.monotonic()
+        if self.state == "open":
+            remaining = self.opened_at + self.recovery_seconds - now
+            if remaining > 0:
+                self._stats["rejected"] += 1
+                raise CircuitOpenError(remaining)
+            self._transition("half_open")
+            self.probe_started_at = None
+
+        if self.state == "half_open":
+            # 시험 호출이 결과 없이 끝난 경우(취소 등)를 대비해 오래된 시험 호출은 무시
+            if self.probe_started_at is not None and now - self.probe_started_at < self.recovery_seconds:
+                self._stats["rejected"] += 1
+                raise CircuitOpenError(self.recovery_seconds - (now - self.probe_started_at))
+            self.probe_started_at = now
+
+    def record_success(self):
+        self.failures = 0
+        if self.state != "closed":
+            self._transition("closed")
+        self.probe_started_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.state == "half_open" or (self.state == "closed" and self.failures >= self.failure_threshold):
+            self._transition("open")
+            self.opened_at = time.monotonic()
+        self.probe_started_at = None
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            **self._stats,
+        }
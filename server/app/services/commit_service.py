@@ -0,0 +1,322 @@
+import hashlib
+import hmac
+import json
+import time as time_module
+from datetime import date, datetime, time, timedelta, timezone
+from uuid import uuid4
+
+from loguru import logger
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.redis import get_shared_redis
+from app.models import Commit, Repository, User
+from app.services.github_service import GithubApiError, fetch_commit_details
+
+# 저장소별 Webhook 수집 시작 시각 (이 시각 이후의 커밋은 DB에 모두 있다고 간주, GITHUB_WEBHOOK_COVERAGE_SECONDS 후 만료)
+WEBHOOK_SINCE_KEY = "github:webhook:since:{repo_name}"
+# 상세 정보 보강을 기다리는 push (List, 왼쪽에 넣고 오른쪽에서 꺼냄)
+PUSH_QUEUE_KEY = "github:webhook:pushes"
+# 저장소별 보강 대기 중인 push ID (Set, 비어 있지 않으면 DB가 아직 불완전)
+PENDING_PUSHES_KEY = "github:webhook:pending:{repo_name}"
+# 보강 전에 프로세스가 종료되어 남은 대기 표시는 이 시간이 지나면 만료
+PENDING_TTL_SECONDS = 600
+
+def verify_signature(body: bytes, signature: str | None, secret: str) -> bool:
+    """X-Hub-Signature-256 (HMAC-SHA256) 검증"""
+    if not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(signature.removeprefix("sha256="), expected)
+
+def _parse_utc(value: str) -> datetime:
+    """ISO 8601 문자열을 UTC datetime으로 변환 ("Z" 접미사 포함)"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+def _day_range(target_date: date) -> tuple[datetime, datetime]:
+    """GitHub 목록 조회(since/until)와 같은 UTC 하루 범위"""
+    start = datetime.combine(target_date, time.min, tzinfo=timezone.utc)
+    return start, start + timedelta(days=1)
+
+def _to_detail(commit: Commit) -> dict:
+    """저장된 커밋을 fetch_commits 결과와 같은 정제 형식으로 변환"""
+    return {
+        "message": commit.message,
+        "additions": commit.additions,
+        "deletions": commit.deletions,
+        "changed_files": commit.changed_files,
+        "files": commit.files,
+    }
+
+async def load_commits(repo_name: str, target_date: date, db: AsyncSession) -> dict[str, dict]:
+    """특정 날짜에 저장된 커밋 (SHA -> 정제 커밋, 최신순)"""
+    return await load_commits_between(repo_name, target_date, target_date, db)
+
+async def load_commits_between(
+    repo_name: str,
+    start_date: date,
+    end_date: date,
+    db: AsyncSession
+) -> dict[str, dict]:
+    """기간(양 끝 포함)에 저장된 커밋 (SHA -> 정제 커밋, 최신순)"""
+    start, _ = _day_range(start_date)
+    _, end = _day_range(end_date)
+    stmt = (
+        select(Commit)
+        .where(
+            Commit.repo_name == repo_name.lower(),
+            Commit.committed_at >= start,
+            Commit.committed_at < end
+        )
+        .order_by(Commit.committed_at.desc())
+    )
+    result = await db.execute(stmt)
+    return {commit.sha: _to_detail(commit) for commit in result.scalars().all()}
+
+async def has_stored_commits(repo_name: str, target_date: date, db: AsyncSession) -> bool:
+    """특정 날짜에 저장된 커밋이 하나라도 있는지 확인"""
+    start, end = _day_range(target_date)
+    stmt = select(func.count()).select_from(Commit).where(
+        Commit.repo_name == repo_name.lower(),
+        Commit.committed_at >= start,
+        Commit.committed_at < end
+    )
+    return ((await db.execute(stmt)).scalar() or 0) > 0
+
+async def save_commits(repo_name: str, commits: dict[str, dict], db: AsyncSession) -> int:
+    """
+    SHA별 정제 커밋 저장 (이미 있는 SHA는 건너뜀, 커밋은 호출자가 수행)
+
+    Args:
+        commits: SHA -> {"committed_at": ISO 문자열, message, additions, ...}
+
+    Returns:
+        새로 추가한 커밋 수
+    """
+    repo_key = repo_name.lower()
+    candidates = {sha: c for sha, c in commits.items() if c.get("committed_at")}
+    if not candidates:
+        return 0
+
+    stmt = select(Commit.sha).where(Commit.repo_name == repo_key, Commit.sha.in_(candidates))
+    existing = set((await db.execute(stmt)).scalars().all())
+
+    added = 0
+    for sha, commit in candidates.items():
+        if sha in existing:
+            continue
+        db.add(Commit(
+            repo_name=repo_key,
+            sha=sha,
+            committed_at=_parse_utc(commit["committed_at"]),
+            message=commit["message"],
+            additions=commit.get("additions", 0),
+            deletions=commit.get("deletions", 0),
+            changed_files=commit.get("changed_files", 0),
+            files=commit.get("files", []),
+        ))
+        added += 1
+    await db.flush()
+    return added
+
+async def is_webhook_covered(repo_name: str, target_date: date) -> bool:
+    """
+    해당 날짜 전체가 Webhook 수집 이후인지 확인
+
+    Redis 정보가 없거나, 수집 기록이 만료되었거나, 보강 대기 중인 push가 있으면 False입니다.
+    """
+    redis = get_shared_redis()
+    if not redis:
+        return False
+    repo_key = repo_name.lower()
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.get(WEBHOOK_SINCE_KEY.format(repo_name=repo_key))
+            pipe.scard(PENDING_PUSHES_KEY.format(repo_name=repo_key))
+            since, pending = await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Redis get error (webhook since): {e}")
+        return False
+    if pending:
+        return False
+    return since is not None and float(since) <= _day_range(target_date)[0].timestamp()
+
+async def _mark_webhook_since(repo_name: str, reset: bool = False):
+    """
+    Webhook 수집 시작 시각 기록
+
+    reset=True면 지금부터 다시 시작한 것으로 간주합니다.
+    (누락 가능성이 있는 push 이후에는 API 조회로 빈틈을 메우도록)
+    기록은 GITHUB_WEBHOOK_COVERAGE_SECONDS 후 만료되므로, 전달되지 않은 push가 있어도
+    DB만 신뢰하는 기간은 그 시간으로 제한됩니다.
+    """
+    redis = get_shared_redis()
+    if not redis:
+        return
+    try:
+        await redis.set(
+            WEBHOOK_SINCE_KEY.format(repo_name=repo_name.lower()),
+            str(time_module.time()),
+            nx=not reset,
+            ex=settings.GITHUB_WEBHOOK_COVERAGE_SECONDS
+        )
+    except RedisError as e:
+        logger.warning(f"Redis set error (webhook since): {e}")
+
+async def _find_access_token(repo_name: str, db: AsyncSession) -> str | None:
+    """저장소를 등록한 사용자 중 한 명의 GitHub 토큰 (상세 정보 보강용)"""
+    stmt = (
+        select(User)
+        .join(Repository, Repository.user_id == User.id)
+        .where(func.lower(Repository.repo_name) == repo_name.lower())
+        .order_by(Repository.is_selected.desc())
+        .limit(1)
+    )
+    user = (await db.execute(stmt)).scalar_one_or_none()
+    return user.decrypted_access_token if user else None
+
+def push_repo_name(payload: dict) -> str | None:
+    """수집 대상(기본 브랜치) push면 저장소 이름, 아니면 None"""
+    repository = payload.get("repository") or {}
+    repo_name = repository.get("full_name")
+    if not repo_name or payload.get("ref") != f"refs/heads/{repository.get('default_branch')}":
+        return None
+    return repo_name
+
+async def enqueue_push(payload: dict) -> bool:
+    """
+    push 페이로드를 보강 대기열에 저장 (Webhook 응답 전에 수행, 보강은 process_push_queue)
+
+    보강에 필요한 필드만 저장하며, 보강이 끝날 때까지 해당 저장소의 Webhook 커버리지는 사용하지 않습니다.
+
+    Returns:
+        대기열에 저장했으면 True (Redis 미연결/장애 시 False)
+    """
+    redis = get_shared_redis()
+    repo_name = push_repo_name(payload)
+    if not redis or not repo_name:
+        return False
+
+    push = {
+        "id": uuid4().hex,
+        "ref": payload.get("ref"),
+        "forced": payload.get("forced", False),
+        "size": payload.get("size"),
+        "repository": {"full_name": repo_name, "default_branch": payload["repository"].get("default_branch")},
+        "commits": [
+            {"id": c["id"], "distinct": c.get("distinct", True), "timestamp": c["timestamp"]}
+            for c in payload.get("commits", [])
+        ],
+    }
+    pending_key = PENDING_PUSHES_KEY.format(repo_name=repo_name.lower())
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.sadd(pending_key, push["id"])
+            pipe.expire(pending_key, PENDING_TTL_SECONDS)
+            pipe.lpush(PUSH_QUEUE_KEY, json.dumps(push))
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Redis push error (webhook queue): {e}")
+        return False
+    return True
+
+async def process_push_queue() -> int:
+    """
+    보강 대기열의 push를 모두 꺼내 상세 정보와 함께 저장 (Webhook 응답 후 백그라운드에서 실행)
+
+    Returns:
+        새로 저장한 커밋 수
+    """
+    redis = get_shared_redis()
+    if not redis:
+        return 0
+    stored = 0
+    async with AsyncSessionLocal() as db:
+        while True:
+            try:
+                raw = await redis.rpop(PUSH_QUEUE_KEY)
+            except RedisError as e:
+                logger.warning(f"Redis pop error (webhook queue): {e}")
+                break
+            if raw is None:
+                break
+            push = json.loads(raw)
+            try:
+                stored += await _ingest_logged(push, db)
+            finally:
+                pending_key = PENDING_PUSHES_KEY.format(repo_name=push["repository"]["full_name"].lower())
+                try:
+                    await redis.srem(pending_key, push["id"])
+                except RedisError as e:
+                    logger.warning(f"Redis srem error (webhook queue): {e}")
+    return stored
+
+async def process_push(payload: dict) -> int:
+    """대기열 없이 push 1건 보강 후 저장 (Redis 미연결 시 Webhook 백그라운드 작업)"""
+    async with AsyncSessionLocal() as db:
+        return await _ingest_logged(payload, db)
+
+async def _ingest_logged(payload: dict, db: AsyncSession) -> int:
+    """백그라운드 보강용 ingest_push (실패는 기록만 하고 다음 push 계속 처리)"""
+    try:
+        return await ingest_push(payload, db)
+    except (GithubApiError, SQLAlchemyError) as e:
+        logger.error(f"❌ Webhook 커밋 저장 실패: {e}")
+        return 0
+
+async def ingest_push(payload: dict, db: AsyncSession) -> int:
+    """
+    push 이벤트의 커밋을 상세 정보와 함께 저장
+
+    push 페이로드에는 patch/변경량이 없으므로 저장소를 등록한 사용자의 토큰으로
+    상세 정보를 조회(캐시 우선)해 보강합니다. 기본 브랜치 push만 수집합니다.
+    보강하거나 저장하지 못한 커밋이 있으면 Webhook 커버리지를 지금부터 다시 시작합니다.
+
+    Returns:
+        새로 저장한 커밋 수
+    """
+    repo_name = push_repo_name(payload)
+    if not repo_name:
+        return 0
+
+    # distinct=false(다른 브랜치에서 이미 push된 커밋, 예: 머지로 들어온 커밋)도 기본 브랜치 히스토리이므로 모두 저장
+    commits = payload.get("commits", [])
+    # 페이로드는 커밋을 최대 20개까지만 담고, force push는 히스토리가 바뀔 수 있음
+    complete = not payload.get("forced") and payload.get("size", len(commits)) <= len(commits)
+    if not commits:
+        await _mark_webhook_since(repo_name, reset=not complete)
+        return 0
+
+    access_token = await _find_access_token(repo_name, db)
+    if not access_token:
+        logger.warning(f"⚠️ Webhook 커밋 보강 불가 (등록 사용자 없음): {repo_name}")
+        await _mark_webhook_since(repo_name, reset=True)
+        return 0
+
+    shas = [c["id"] for c in commits]
+    result = await fetch_commit_details(repo_name, shas, access_token)
+    details = iter(result.commits)
+    # push의 timestamp는 author date이므로 목록 조회/백필과 같은 committer date(상세 응답)로 날짜를 정함
+    records = {
+        sha: {"committed_at": result.committed_at.get(sha), **next(details)}
+        for sha in shas
+        if sha not in result.failed_shas
+    }
+    undated = [sha for sha, record in records.items() if not record["committed_at"]]
+
+    try:
+        added = await save_commits(repo_name, records, db)
+        await db.commit()
+    except SQLAlchemyError:
+        await db.rollback()
+        await _mark_webhook_since(repo_name, reset=True)
+        raise
+
+    # 상세 조회에 실패했거나 커밋 시각을 모르는 커밋(이전 캐시 항목)이 있으면 DB만으로는 불완전하므로 커버리지 재시작
+    await _mark_webhook_since(repo_name, reset=not complete or bool(result.failed_shas) or bool(undated))
+    logger.info(f"📥 Webhook 커밋 저장: {repo_name} | {added}/{len(commits)}건")
+    return added
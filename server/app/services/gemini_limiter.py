@@ -0,0 +1,180 @@
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import get_shared_redis
+
+# 프로세스 간 동시 호출 수 제한 (Sorted Set: 호출 토큰 → 시작 시각)
+GLOBAL_SLOTS_KEY = "gemini:slots"
+# 비정상 종료로 반납되지 않은 슬롯은 이 시간이 지나면 회수
+GLOBAL_LEASE_SECONDS = 180
+# 호출 중인 슬롯은 이 주기로 시작 시각을 갱신해, 리스보다 오래 걸리는 호출(스트리밍/재시도)도 회수되지 않게 함
+GLOBAL_HEARTBEAT_SECONDS = 60
+GLOBAL_POLL_SECONDS = 0.2
+
+class GeminiLimiter:
+    """
+    Gemini 호출 동시성 제한
+
+    프로세스 내 동시 호출을 GEMINI_MAX_CONCURRENCY로 제한하고, 초과 요청은 사용자별 대기열에
+    넣어 사용자 간 라운드로빈으로 슬롯을 넘겨줍니다. (한 사용자의 연속 요청이 다른 사용자를 밀어내지 않음)
+    대기열이 가득 차면 asyncio.QueueFull, 대기 시간이 초과되면 asyncio.TimeoutError를 발생시킵니다.
+    GEMINI_GLOBAL_CONCURRENCY가 설정되면 Redis로 여러 워커의 전체 동시 호출 수도 제한합니다.
+    """
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._active = 0
+        self._queued = 0
+        self._queues: OrderedDict[str, deque[asyncio.Future]] = OrderedDict()
+        self._stats = {"admitted": 0, "queued": 0, "rejected": 0, "timeouts": 0, "wait_ms_total": 0.0, "wait_ms_max": 0.0}
+
+    def _ensure_loop(self):
+        # asyncio 동기화 객체는 이벤트 루프에 묶이므로 루프가 바뀌면 상태 초기화
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._active = 0
+            self._queued = 0
+            self._queues.clear()
+
+    async def _acquire_local(self, user_key: str):
+        self._ensure_loop()
+        if self._active < settings.GEMINI_MAX_CONCURRENCY and not self._queued:
+            self._active += 1
+            self._stats["admitted"] += 1
+            return
+        if self._queued >= settings.GEMINI_MAX_QUEUE:
+            self._stats["rejected"] += 1
+            raise asyncio.QueueFull()
+
+        future = self._loop.create_future()
+        self._queues.setdefault(user_key, deque()).append(future)
+        self._queued += 1
+        self._stats["queued"] += 1
+        started = time.perf_counter()
+        try:
+            # wait_for는 슬롯 이양과 취소가 겹치면 취소를 삼킬 수 있으므로 asyncio.wait로 대기
+            await asyncio.wait((future,), timeout=settings.GEMINI_QUEUE_TIMEOUT_SECONDS)
+            if not future.done():
+                raise asyncio.TimeoutError()
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # 대기 종료와 동시에 슬롯을 넘겨받은 경우 다음 대기자에게 반납
+                self._release_local()
+            else:
+                self._discard(user_key, future)
+            if isinstance(e, asyncio.TimeoutError):
+                self._stats["timeouts"] += 1
+            raise
+        finally:
+            self._record_wait((time.perf_counter() - started) * 1000)
+        self._stats["admitted"] += 1
+
+    def _discard(self, user_key: str, future: asyncio.Future):
+        queue = self._queues.get(user_key)
+        if queue and future in queue:
+            queue.remove(future)
+            self._queued -= 1
+            if not queue:
+                del self._queues[user_key]
+
+    def _release_local(self):
+        """슬롯 반납 (대기자가 있으면 다음 사용자에게 라운드로빈으로 이양)"""
+        while self._queues:
+            user_key, queue = next(iter(self._queues.items()))
+            future = queue.popleft()
+            self._queued -= 1
+            if queue:
+                self._queues.move_to_end(user_key)
+            else:
+                del self._queues[user_key]
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    def _record_wait(self, wait_ms: float):
+        self._stats["wait_ms_total"] += wait_ms
+        self._stats["wait_ms_max"] = max(self._stats["wait_ms_max"], wait_ms)
+
+    async def _acquire_global(self) -> str | None:
+        """Redis 전역 슬롯 확보 (Redis 장애 시에는 제한 없이 진행)"""
+        redis = get_shared_redis()
+        limit = settings.GEMINI_GLOBAL_CONCURRENCY
+        if not redis or limit <= 0:
+            return None
+
+        token = uuid4().hex
+        deadline = time.monotonic() + settings.GEMINI_QUEUE_TIMEOUT_SECONDS
+        while True:
+            now = time.time()
+            try:
+                async with redis.pipeline(transaction=True) as pipe:
+                    pipe.zremrangebyscore(GLOBAL_SLOTS_KEY, 0, now - GLOBAL_LEASE_SECONDS)
+                    pipe.zadd(GLOBAL_SLOTS_KEY, {token: now})
+                    pipe.zrank(GLOBAL_SLOTS_KEY, token)
+                    _, _, rank = await pipe.execute()
+                if rank < limit:
+                    return token
+                await redis.zrem(GLOBAL_SLOTS_KEY, token)
+            except RedisError as e:
+                logger.warning(f"Redis semaphore error (gemini): {e}")
+                return None
+            if time.monotonic() >= deadline:
+                self._stats["timeouts"] += 1
+                raise asyncio.TimeoutError()
+            await asyncio.sleep(GLOBAL_POLL_SECONDS)
+
+    async def _heartbeat_global(self, token: str):
+        """호출이 끝날 때까지 전역 슬롯 리스 갱신 (이미 반납/회수된 슬롯은 다시 넣지 않음)"""
+        redis = get_shared_redis()
+        while redis:
+            await asyncio.sleep(GLOBAL_HEARTBEAT_SECONDS)
+            try:
+                await redis.zadd(GLOBAL_SLOTS_KEY, {token: time.time()}, xx=True)
+            except RedisError as e:
+                logger.warning(f"Redis semaphore error (gemini): {e}")
+
+    async def _release_global(self, token: str | None):
+        redis = get_shared_redis()
+        if token is None or not redis:
+            return
+        try:
+            await redis.zrem(GLOBAL_SLOTS_KEY, token)
+        except RedisError as e:
+            logger.warning(f"Redis semaphore error (gemini): {e}")
+
+    @asynccontextmanager
+    async def slot(self, user_key: str):
+        """프로세스 슬롯 → 전역 슬롯 순으로 확보한 뒤 Gemini 호출 수행"""
+        await self._acquire_local(user_key)
+        try:
+            token = await self._acquire_global()
+            heartbeat = asyncio.create_task(self._heartbeat_global(token)) if token else None
+            try:
+                yield
+            finally:
+                if heartbeat:
+                    heartbeat.cancel()
+                await self._release_global(token)
+        finally:
+            self._release_local()
+
+    def stats(self) -> dict:
+        """대기열 지표 (대기 시간은 대기열을 거친 요청 기준)"""
+        queued = self._stats["queued"]
+        return {
+            **self._stats,
+            "wait_ms_avg": round(self._stats["wait_ms_total"] / queued, 1) if queued else 0.0,
+            "active": self._active,
+            "waiting": self._queued,
+            "waiting_users": len(self._queues),
+        }
+
+gemini_limiter = GeminiLimiter()
@@ -1,11 +1,40 @@
+import asyncio
+import functools
+import hashlib
 import json
+import re
 import textwrap
-import google.generativeai as genai
-from google.api_core import exceptions as google_exceptions
-from tenacity import retry, stop_after_attempt, wait_exponential
-from app.core.config import settings
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from uuid import UUID
 
 from loguru import logger
+from redis.exceptions import RedisError
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from app.core.config import settings
+from app.core.redis import get_shared_redis
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.gemini_limiter import gemini_limiter
+from app.services.prompt_builder import (
+    BudgetReport,
+    chunk_commits,
+    estimate_json_tokens,
+    fit_commits,
+    record_report,
+)
+from app.utils.json_stream import partial_string_value
+
+# 프롬프트(지시문/출력 형식)를 바꾸면 올려서 기존 생성 결과 캐시를 무효화
+PROMPT_VERSION = 2
 
 JOURNAL_SCHEMA = {
     "type": "object",
@@ -17,10 +46,195 @@ JOURNAL_SCHEMA = {
     "required": ["summary", "main_tasks", "learned_things"],
 }
 
-class GeminiService:
-    def __init__(self):
+class GeminiServiceError(Exception):
+    """Gemini 호출 관련 기본 에러"""
+    def __init__(self, message: str, status_code: int = 500):
+        self.message = message
+        self.status_code = status_code
+        super().__init__(message)
+
+class GeminiBusyError(GeminiServiceError):
+    """503: 생성 대기열 포화 / 대기 시간 초과"""
+    def __init__(self, message: str = "AI 생성 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.", retry_after: float | None = None):
+        self.retry_after = retry_after  # 다시 시도할 수 있을 때까지 권장 대기 시간(초)
+        super().__init__(message, status_code=503)
+
+class GeminiQuotaError(GeminiServiceError):
+    """429: 할당량 초과"""
+    def __init__(self, message: str = "AI 할당량 초과로 인해 요약을 생성할 수 없습니다. 잠시 후 다시 시도해주세요.", retry_after: float | None = None):
+        self.retry_after = retry_after  # 서버가 알려준 재시도 대기 시간(초)
+        super().__init__(message, status_code=429)
+
+class GeminiUnavailableError(GeminiServiceError):
+    """503: 일시 장애 (5xx, 타임아웃) 또는 서킷 브레이커 열림"""
+    def __init__(self, message: str = "AI 서비스가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도해주세요.", retry_after: float | None = None):
+        self.retry_after = retry_after
+        super().__init__(message, status_code=503)
+
+class GeminiResponseError(GeminiServiceError):
+    """502: 응답을 JSON으로 파싱할 수 없음"""
+    def __init__(self, message: str = "❌GEMINI reponse를 json으로 파싱하는데 실패"):
+        super().__init__(message, status_code=502)
+
+# 연속 일시 장애 시 일정 시간 호출을 막아 빠르게 실패 (프로세스 단위)
+gemini_circuit = CircuitBreaker(
+    "gemini",
+    failure_threshold=settings.GEMINI_CIRCUIT_FAILURE_THRESHOLD,
+    recovery_seconds=settings.GEMINI_CIRCUIT_RECOVERY_SECONDS,
+)
+
+# 에러 유형별 발생 횟수 / 재시도 횟수
+_error_stats = {"quota": 0, "transient": 0, "parse": 0, "other": 0, "retries": 0}
+
+# "Please retry in 31.2s" 형태의 재시도 힌트
+_RETRY_IN = re.compile(r"retry in ([\d.]+)\s*s", re.IGNORECASE)
+
+def _retry_hint(error: Exception) -> float | None:
+    """할당량 에러의 재시도 대기 시간 (RetryInfo → 메시지 순)"""
+    for detail in getattr(error, "details", None) or []:
+        delay = detail.get("retryDelay") if isinstance(detail, dict) else getattr(detail, "retry_delay", None)
+        if isinstance(delay, str):
+            try:
+                return float(delay.rstrip("s"))
+            except ValueError:
+                continue
+        if delay is not None and hasattr(delay, "seconds"):
+            return delay.seconds + delay.nanos / 1e9
+    match = _RETRY_IN.search(str(error))
+    return float(match.group(1)) if match else None
+
+@functools.cache
+def _call_errors() -> tuple[type[Exception], ...]:
+    """
+    Gemini 호출에서 _classify로 분류할 에러 유형 (SDK는 첫 생성 시점에 로드되므로 지연 import)
+
+    API/네트워크 에러와 차단·중단된 응답(response.text 접근 시 ValueError 포함)
+    """
+    from google.api_core import exceptions as google_exceptions
+    from google.generativeai.types import BlockedPromptException, StopCandidateException
+
+    return (
+        google_exceptions.GoogleAPIError,
+        BlockedPromptException,
+        StopCandidateException,
+        asyncio.TimeoutError,
+        OSError,
+        ValueError,
+    )
+
+def _classify(error: Exception) -> GeminiServiceError:
+    """SDK/네트워크 에러를 재시도 정책 단위로 분류"""
+    from google.api_core import exceptions as google_exceptions
+
+    if isinstance(error, google_exceptions.TooManyRequests):
+        return GeminiQuotaError(retry_after=_retry_hint(error))
+    if isinstance(error, (google_exceptions.ServerError, asyncio.TimeoutError, ConnectionError)):
+        return GeminiUnavailableError()
+    return GeminiServiceError(f"AI 요청 실패: {error}", status_code=502)
+
+def _before_call():
+    try:
+        gemini_circuit.before_call()
+    except CircuitOpenError as e:
+        raise GeminiUnavailableError(retry_after=e.retry_after)
+
+def _record_failure(error: Exception) -> GeminiServiceError:
+    """에러 분류 및 기록 (일시 장애만 서킷 브레이커 실패로 집계)"""
+    classified = _classify(error)
+    if isinstance(classified, GeminiQuotaError):
+        _error_stats["quota"] += 1
+        logger.error(f"Gemini API Quota Exceeded (429) | retry hint: {classified.retry_after}")
+    elif isinstance(classified, GeminiUnavailableError):
+        _error_stats["transient"] += 1
+        gemini_circuit.record_failure()
+    else:
+        _error_stats["other"] += 1
+    classified.__cause__ = error
+    return classified
+
+def _is_retryable(error: BaseException) -> bool:
+    if isinstance(error, GeminiQuotaError):
+        return error.retry_after is not None and error.retry_after <= settings.GEMINI_RETRY_MAX_WAIT_SECONDS
+    if isinstance(error, GeminiUnavailableError):
+        # 서킷이 열려 거절된 경우는 재시도하지 않음
+        return gemini_circuit.state == "closed"
+    return isinstance(error, GeminiResponseError)
+
+_backoff = wait_exponential_jitter(initial=1, max=8)
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """서버 재시도 힌트 우선, 파싱 실패는 즉시, 일시 장애는 지수 백오프 + 지터"""
+    error = retry_state.outcome.exception()
+    if isinstance(error, GeminiQuotaError):
+        return error.retry_after
+    if isinstance(error, GeminiResponseError):
+        return 0
+    return _backoff(retry_state)
+
+def _log_retry(retry_state: RetryCallState):
+    _error_stats["retries"] += 1
+    error = retry_state.outcome.exception()
+    logger.warning(
+        f"🔁 Gemini 재시도 {retry_state.attempt_number}/{settings.GEMINI_RETRY_ATTEMPTS} "
+        f"({type(error).__name__}, {retry_state.upcoming_sleep:.1f}초 후)"
+    )
+
+def get_gemini_error_stats() -> dict:
+    """에러 유형별 집계 및 서킷 브레이커 상태"""
+    return {**_error_stats, "circuit": gemini_circuit.stats()}
+
+EMPTY_JOURNAL = {
+    "summary": "작업 내역이 없습니다.",
+    "main_tasks": [],
+    "learned_things": [],
+}
+
+# 생성 결과 캐시 지표
+_cache_stats = {"lookups": 0, "hits": 0, "stored": 0, "errors": 0}
+
+def get_generation_cache_stats() -> dict:
+    """생성 결과 캐시 적중률"""
+    lookups = _cache_stats["lookups"]
+    return {
+        **_cache_stats,
+        "hit_ratio": round(_cache_stats["hits"] / lookups, 3) if lookups else 0.0,
+    }
+
+def generation_cache_key(commits: list[dict], date: str) -> str:
+    """정규화한 커밋 + 날짜 + 모델 설정 + 프롬프트 버전의 해시 키"""
+    payload = json.dumps(
+        {
+            "commits": commits,
+            "date": str(date),
+            "model": settings.GEMINI_MODEL,
+            "temperature": settings.GEMINI_TEMPERATURE,
+            "max_tokens": settings.GEMINI_MAX_TOKENS,
+            "input_budget": settings.GEMINI_INPUT_TOKEN_BUDGET,
+            "map_reduce": [settings.GEMINI_MAP_REDUCE_THRESHOLD_TOKENS, settings.GEMINI_MAP_CHUNK_TOKENS],
+            "prompt_version": PROMPT_VERSION,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return f"gemini:journal:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+# 프로세스 공용 Gemini 모델 (첫 생성 요청 시 생성)
+_model = None
+
+def get_gemini_model():
+    """
+    공용 GenerativeModel 반환
+
+    SDK(google.generativeai)는 import 비용이 커서 첫 생성 시점에 불러옵니다.
+    조회 전용 요청만 처리하는 워커는 SDK를 로드하지 않습니다.
+    """
+    global _model
+    if _model is None:
+        import google.generativeai as genai
+
         genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel(
+        _model = genai.GenerativeModel(
             model_name=settings.GEMINI_MODEL,
             generation_config={
                 "temperature": settings.GEMINI_TEMPERATURE,
@@ -29,54 +243,368 @@ class GeminiService:
                 "response_schema": JOURNAL_SCHEMA,
             }
         )
+        logger.info(f"🤖 Gemini 클라이언트 생성: {settings.GEMINI_MODEL}")
+    return _model
+
+class GeminiService:
+    @property
+    def model(self):
+        return get_gemini_model()
     
-    @retry(
-        stop=stop_after_attempt(3), # 최대 3회 재시도
-        wait = wait_exponential(multiplier=1, min=1, max=4) # 1초 -> 2초 -> 4초
-    )
-    async def generate_journal(self, commits: list[dict], date: str = "Today") -> dict:
+    async def generate_journal(
+        self,
+        commits: list[dict],
+        date: str = "Today",
+        force: bool = False,
+        user_id: UUID | None = None
+    ) -> tuple[dict, BudgetReport | None]:
         """
         커밋 데이터를 분석하여 개발 일지를 생성
+
+        같은 커밋/모델 설정/프롬프트 버전이면 Redis에 캐시된 결과를 반환합니다.
+        force=True면 캐시를 무시하고 새로 생성합니다. (결과는 다시 캐시)
+        Gemini 호출마다 사용자별 공정 대기열(gemini_limiter)을 거치며, 포화 시 GeminiBusyError를 발생시킵니다.
+
+        Returns:
+            (일지, 프롬프트 예산 적용 결과) - 커밋이 없거나 캐시에 적중해 프롬프트를 만들지 않았으면 예산 결과는 None
         """
         logger.info(f"커밋 데이터 분석 및 개발 일지 생성 진입: {len(commits)} | Date:{date}")
         
         if not commits:
-            return {
-                "summary": "작업 내역이 없습니다.",
-                "main_tasks": [],
-                "learned_things": [],
-            }
-        
-        # 커밋 수 및 메타데이터 추출
-        commit_count = len(commits)
-        
+            return dict(EMPTY_JOURNAL), None
+
+        cache_key = generation_cache_key(commits, date)
+        if not force:
+            cached = await self._load_cached(cache_key)
+            if cached:
+                return cached, None
+
+        result, report = await self._generate(commits, date, user_id)
+
+        await self._store_cached(cache_key, result)
+        return result, report
+
+    async def stream_journal(
+        self,
+        commits: list[dict],
+        date: str = "Today",
+        force: bool = False,
+        user_id: UUID | None = None
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        개발 일지 스트리밍 생성
+
+        프롬프트를 만들면 ("budget", BudgetReport)를 먼저 내보내고,
+        ("summary", 부분 텍스트) 이벤트를 생성되는 대로 내보낸 뒤 마지막에 ("result", 일지)를 내보냅니다.
+        스트림이 중간에 실패해 일반 호출로 대체되면 그 전에 ("summary_reset", None)을 내보냅니다.
+        커밋이 없거나 캐시에 적중하면 result만 내보냅니다. (캐시/대기열 정책은 generate_journal과 동일)
+        """
+        if not commits:
+            yield "result", dict(EMPTY_JOURNAL)
+            return
+
+        cache_key = generation_cache_key(commits, date)
+        if not force:
+            cached = await self._load_cached(cache_key)
+            if cached:
+                yield "result", cached
+                return
+
+        result = None
+        if estimate_json_tokens(commits) > settings.GEMINI_MAP_REDUCE_THRESHOLD_TOKENS:
+            # 대용량은 map 단계까지 마친 뒤 reduce 호출만 스트리밍
+            partials, report = await self._map(commits, date, user_id)
+            prompt = self._build_reduce_prompt(partials, date, len(commits))
+        else:
+            prompt, report = self._build_prompt(commits, date)
+        yield "budget", report
+        async for event, data in self._stream_call(prompt, user_id):
+            if event == "result":
+                result = data
+            else:
+                yield event, data
+
+        await self._store_cached(cache_key, result)
+        yield "result", result
+
+    @asynccontextmanager
+    async def _limited(self, user_id: UUID | None):
+        """gemini_limiter 슬롯 확보 (대기열 포화/대기 시간 초과는 GeminiBusyError)"""
+        try:
+            async with gemini_limiter.slot(str(user_id or "anonymous")):
+                yield
+        except asyncio.QueueFull:
+            logger.warning(f"🚦 Gemini 대기열 포화로 요청 거절 | User:{user_id}")
+            raise GeminiBusyError(retry_after=settings.GEMINI_QUEUE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(f"🚦 Gemini 대기 시간 초과 | User:{user_id}")
+            raise GeminiBusyError(retry_after=settings.GEMINI_QUEUE_TIMEOUT_SECONDS)
+
+    async def _load_cached(self, cache_key: str) -> dict | None:
+        redis = get_shared_redis()
+        if not redis:
+            return None
+        _cache_stats["lookups"] += 1
+        try:
+            cached = await redis.get(cache_key)
+            if cached:
+                _cache_stats["hits"] += 1
+                logger.info(f"⚡ Gemini 생성 결과 캐시 적중: {cache_key[-12:]}")
+                return json.loads(cached)
+        except RedisError as e:
+            _cache_stats["errors"] += 1
+            logger.warning(f"Redis get error (gemini): {e}")
+        return None
+
+    async def _store_cached(self, cache_key: str, result: dict):
+        redis = get_shared_redis()
+        if not redis:
+            return
+        try:
+            await redis.set(cache_key, json.dumps(result, ensure_ascii=False), ex=settings.GEMINI_CACHE_TTL_SECONDS)
+            _cache_stats["stored"] += 1
+        except RedisError as e:
+            _cache_stats["errors"] += 1
+            logger.warning(f"Redis set error (gemini): {e}")
+
+    async def _generate(
+        self,
+        commits: list[dict],
+        date: str,
+        user_id: UUID | None = None
+    ) -> tuple[dict, BudgetReport]:
+        """커밋 분량에 따라 단일 호출 또는 map-reduce로 생성 (map-reduce는 청크별 예산 결과를 합산해 반환)"""
+        if estimate_json_tokens(commits) > settings.GEMINI_MAP_REDUCE_THRESHOLD_TOKENS:
+            return await self._map_reduce(commits, date, user_id)
         # 브랜치 정보는 GitHub API 커밋 응답에 직접적으로 포함되지 않을 수 있음 
         # (필요하다면 상위 호출에서 전달받아야 함. 일단 제거하거나 'main'으로 고정)
-        prompt = self._build_prompt(commits, date, commit_count)
+        prompt, report = self._build_prompt(commits, date)
+        return await self._call(prompt, user_id), report
+
+    async def _map_reduce(
+        self,
+        commits: list[dict],
+        date: str,
+        user_id: UUID | None = None
+    ) -> tuple[dict, BudgetReport]:
+        """
+        대용량 커밋 일지 생성
+
+        커밋을 청크로 나눠 동시에 요약(map, 최대 GEMINI_MAP_CONCURRENCY개)한 뒤
+        청크 요약들을 하나의 일지로 통합(reduce)합니다.
+        """
+        partials, report = await self._map(commits, date, user_id)
+        return await self._call(self._build_reduce_prompt(partials, date, len(commits)), user_id), report
+
+    async def _map(
+        self,
+        commits: list[dict],
+        date: str,
+        user_id: UUID | None = None
+    ) -> tuple[list[dict], BudgetReport]:
+        """
+        청크별 요약을 동시에 수행 (최대 GEMINI_MAP_CONCURRENCY개)
+
+        청크 호출마다 gemini_limiter 슬롯을 따로 확보하므로 전체 동시 호출 제한과 사용자 간 공정성이 유지됩니다.
+        한 청크가 실패하면 남은 청크 호출은 취소합니다.
+        """
+        chunks = chunk_commits(commits, settings.GEMINI_MAP_CHUNK_TOKENS)
+        prompts, reports = [], []
+        for index, chunk in enumerate(chunks, 1):
+            prompt, report = self._build_map_prompt(chunk, date, index, len(chunks))
+            prompts.append(prompt)
+            reports.append(report)
+        semaphore = asyncio.Semaphore(settings.GEMINI_MAP_CONCURRENCY)
+        started = time.perf_counter()
+
+        async def summarize(prompt: str) -> dict:
+            async with semaphore:
+                return await self._call(prompt, user_id)
+
+        tasks = [asyncio.create_task(summarize(prompt)) for prompt in prompts]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception():
+                    raise task.exception()
+        finally:
+            for task in tasks:
+                task.cancel()
+        partials = [task.result() for task in tasks]
+        logger.info(
+            f"🧩 map 단계 완료: 커밋 {len(commits)}개 → 청크 {len(chunks)}개 "
+            f"| {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+        return partials, BudgetReport.combine(reports)
+
+    async def _call(self, prompt: str, user_id: UUID | None = None) -> dict:
+        """Gemini 호출 (gemini_limiter 슬롯 1개를 확보한 뒤 재시도 포함 수행)"""
+        async with self._limited(user_id):
+            return await self._call_with_retry(prompt)
+
+    async def _call_with_retry(self, prompt: str) -> dict:
+        """
+        Gemini 호출 (에러 유형별 재시도)
+
+        - 일시 장애(5xx, 타임아웃, 연결 오류): 지수 백오프 + 지터로 재시도
+        - 할당량 초과(429): 서버가 알려준 대기 시간이 GEMINI_RETRY_MAX_WAIT_SECONDS 이하일 때만 그만큼 기다렸다 재시도
+        - JSON 파싱 실패: 즉시 재시도
+        - 그 외(잘못된 요청, 권한 등): 재시도하지 않음
+        """
         logger.debug(prompt)
-        
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(settings.GEMINI_RETRY_ATTEMPTS),
+            retry=retry_if_exception(_is_retryable),
+            wait=_retry_wait,
+            before_sleep=_log_retry,
+            reraise=True,
+        ):
+            with attempt:
+                result = await self._call_once(prompt)
+        return result
+
+    async def _call_once(self, prompt: str) -> dict:
+        """Gemini 호출 1회 (서킷 브레이커 확인 및 결과 기록, 에러는 GeminiServiceError로 분류)"""
+        _before_call()
         try:
             response = await self.model.generate_content_async(prompt)
-            return json.loads(response.text)
-        
-        except google_exceptions.ResourceExhausted:
-            logger.error("Gemini API Quota Exceeded (429)")
-            raise ValueError("AI 할당량 초과로 인해 요약을 생성할 수 없습니다. 잠시 후 다시 시도해주세요.")
-        
+            text = response.text
+        except _call_errors() as e:
+            raise _record_failure(e)
+        gemini_circuit.record_success()
+        try:
+            return json.loads(text)
         except json.JSONDecodeError:
-            # 재시도 트리커를 위해 에러 발생
-            raise ValueError("❌GEMINI reponse를 json으로 파싱하는데 실패")
-        
-    def _build_prompt(self, commits: list[dict], date: str, commit_count: int) -> str:
+            _error_stats["parse"] += 1
+            raise GeminiResponseError()
+
+    async def _stream_call(self, prompt: str, user_id: UUID | None = None) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Gemini 스트리밍 호출 (대체 호출까지 gemini_limiter 슬롯 1개 안에서 수행)
+
+        응답 JSON의 summary를 받는 대로 ("summary", 추가된 텍스트)로 내보내고, 마지막에 ("result", 전체)를 내보냅니다.
+        스트림이 실패하거나 JSON이 깨지면 재시도가 있는 일반 호출(_call_with_retry)의 결과로 대체합니다.
+        이미 내보낸 summary는 대체 결과와 다르므로 ("summary_reset", None)으로 폐기를 알린 뒤 대체합니다.
+        (할당량 초과/서킷 열림은 대체 호출 없이 그대로 실패)
+        """
+        logger.debug(prompt)
+        async with self._limited(user_id):
+            _before_call()
+            text, emitted = "", 0
+            try:
+                response = await self.model.generate_content_async(prompt, stream=True)
+                async for chunk in response:
+                    text += chunk.text
+                    summary = partial_string_value(text, "summary")
+                    if summary and len(summary) > emitted:
+                        yield "summary", summary[emitted:]
+                        emitted = len(summary)
+            except _call_errors() as e:
+                error = _record_failure(e)
+                if isinstance(error, GeminiQuotaError):
+                    raise error
+                logger.warning(f"⚠️ Gemini 스트리밍 실패, 일반 호출로 대체: {e}")
+            else:
+                gemini_circuit.record_success()
+                try:
+                    yield "result", json.loads(text)
+                    return
+                except json.JSONDecodeError:
+                    _error_stats["parse"] += 1
+                    logger.warning("⚠️ Gemini 스트리밍 응답 JSON 파싱 실패, 일반 호출로 대체")
+            if emitted:
+                yield "summary_reset", None
+            yield "result", await self._call_with_retry(prompt)
+
+    def _build_map_prompt(self, commits: list[dict], date: str, index: int, total: int) -> tuple[str, BudgetReport]:
+        """청크 요약 프롬프트 (최종 일지 통합용 중간 결과)"""
+        selected, report = fit_commits(commits, settings.GEMINI_MAP_CHUNK_TOKENS)
+        record_report(report)
+        logger.debug(f"🧮 map 청크 {index}/{total} 프롬프트 {report.describe()}")
+        commits_text = json.dumps(selected, ensure_ascii=False)
+        prompt = textwrap.dedent(f"""
+            # Role
+            Senior Backend Architect & Tech Writer
+
+            # Context
+            다음은 {date}의 Git 커밋 로그 중 {index}/{total}번째 구간입니다.
+            - 구간 커밋 수: {len(commits)}개
+
+            [Commits Data]
+            {commits_text}
+
+            # Task
+            이 구간의 커밋만 분석하여 중간 요약을 작성하세요. 이후 다른 구간의 요약과 합쳐 최종 일지를 만듭니다.
+
+            # Output Format (JSON)
+            {{
+            "summary": "이 구간의 작업 흐름 (2문장 이내)",
+            "main_tasks": ["기술적 성과 (구체적 수치/효과 포함)", "..."],
+            "learned_things": ["코드 변화에서 도출된 인사이트", "..."]
+            }}
+
+            # Constraints
+            - main_tasks: 중요도 순 정렬, 최대 5개, trivial 커밋 제외
+            - 수치가 있다면 반드시 포함
+            - JSON 형식을 엄격히 준수
+            """
+        ).strip()
+        return prompt, report
+
+    def _build_reduce_prompt(self, partials: list[dict], date: str, commit_count: int) -> str:
+        """청크 요약들을 최종 일지로 통합하는 프롬프트"""
+        partials_text = json.dumps(partials, ensure_ascii=False)
+        prompt = textwrap.dedent(f"""
+            # Role
+            Senior Backend Architect & Tech Writer
+
+            # Context
+            다음은 {date}의 Git 커밋 {commit_count}개를 {len(partials)}개 구간으로 나눠 요약한 결과입니다.
+
+            [Partial Summaries]
+            {partials_text}
+
+            # Task
+            구간별 요약을 종합하여 하루 전체의 개발 일지를 작성하세요.
+            중복되는 작업은 합치고, 하루 전체에서 중요도가 높은 작업을 우선합니다.
+
+            # Output Format (JSON)
+            {{
+            "summary": "3문장으로 작성 (경어체)",
+            "main_tasks": ["기술적 성과 1 (구체적 수치/효과 포함)", "..."],
+            "learned_things": ["코드 변화에서 도출된 인사이트", "..."]
+            }}
+
+            # Constraints
+            - summary: 정확히 3문장 (작업 흐름 → 주요 성과 → 기술적 의의 순서 권장)
+            - main_tasks: 중요도 순 정렬, 최대 5개, trivial 커밋 제외
+            - learned_things: 반드시 구간 요약 내용 기반, 최소 1개 이상
+            - 기술 용어는 한글(영문) 형태로 병기
+            - 수치가 있다면 반드시 포함
+            - JSON 형식을 엄격히 준수
+            """
+        ).strip()
+        return prompt
+
+    def _build_prompt(self, commits: list[dict], date: str) -> tuple[str, BudgetReport]:
+        # 입력 토큰 예산 안에서 중요도 순으로 커밋/파일/patch 선별 (일지별 기록은 호출한 쪽에서 사용자/저장소/날짜와 함께 남김)
+        selected, report = fit_commits(commits, settings.GEMINI_INPUT_TOKEN_BUDGET)
+        record_report(report)
+
+        commit_count = len(commits)
+        omitted = ""
+        if report.commits_kept < commit_count:
+            omitted = f" (분량 제한으로 중요도 순 {report.commits_kept}개만 포함)"
+
         # 커밋 메시지들을 문자열로 변환
-        commits_text = json.dumps(commits, ensure_ascii=False)
+        commits_text = json.dumps(selected, ensure_ascii=False)
         prompt = textwrap.dedent(f"""
             # Role
             Senior Backend Architect & Tech Writer
 
             # Context
             다음은 {date}의 Git 커밋 로그입니다.
-            - 총 커밋 수: {commit_count}개
+            - 총 커밋 수: {commit_count}개{omitted}
 
             [Commits Data]
             {commits_text}
@@ -120,4 +648,4 @@ class GeminiService:
             }}
             """
         ).strip()
-        return prompt
\ No newline at end of file
+        return prompt, report
\ No newline at end of file
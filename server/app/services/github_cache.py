@@ -0,0 +1,181 @@
+import hashlib
+import json
+from collections import OrderedDict
+
+import httpx
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import get_shared_redis
+from app.services.github_scheduler import token_key
+
+# 정제 결과 형식이 바뀌면 올려서 기존 캐시를 무효화
+COMMIT_CACHE_VERSION = 3
+
+# ETag 캐시 지표 (304 응답은 GitHub Rate Limit에 포함되지 않음)
+_etag_stats = {
+    "lookups": 0,
+    "hits": 0,            # 저장된 ETag로 조건부 요청을 보낸 횟수
+    "not_modified": 0,    # 304 응답으로 캐시 본문을 재사용한 횟수
+    "stored": 0,
+    "skipped_large": 0,
+    "errors": 0,
+}
+
+def _etag_key(url: str, params: dict | None, access_token: str) -> str:
+    """URL(쿼리 포함) + 토큰 해시 기반 캐시 키"""
+    full_url = str(httpx.URL(url, params=params))
+    url_hash = hashlib.sha256(full_url.encode()).hexdigest()[:32]
+    return f"github:etag:{token_key(access_token)}:{url_hash}"
+
+async def load_etag_entry(
+    redis: Redis,
+    url: str,
+    params: dict | None,
+    access_token: str
+) -> dict | None:
+    """저장된 ETag/본문 조회"""
+    _etag_stats["lookups"] += 1
+    try:
+        cached = await redis.get(_etag_key(url, params, access_token))
+    except RedisError as e:
+        _etag_stats["errors"] += 1
+        logger.warning(f"Redis get error (etag): {e}")
+        return None
+
+    if not cached:
+        return None
+    _etag_stats["hits"] += 1
+    return json.loads(cached)
+
+async def store_etag_entry(
+    redis: Redis,
+    url: str,
+    params: dict | None,
+    access_token: str,
+    response: httpx.Response
+):
+    """ETag가 있는 200 응답의 본문 저장 (너무 큰 본문은 제외)"""
+    etag = response.headers.get("etag")
+    if not etag:
+        return
+    if len(response.content) > settings.GITHUB_ETAG_MAX_BODY_BYTES:
+        _etag_stats["skipped_large"] += 1
+        return
+
+    entry = {
+        "etag": etag,
+        "link": response.headers.get("link"),
+        "body": response.text,
+    }
+    try:
+        await redis.set(
+            _etag_key(url, params, access_token),
+            json.dumps(entry),
+            ex=settings.GITHUB_ETAG_TTL_SECONDS
+        )
+        _etag_stats["stored"] += 1
+    except RedisError as e:
+        _etag_stats["errors"] += 1
+        logger.warning(f"Redis set error (etag): {e}")
+
+def replay_etag_entry(entry: dict, not_modified: httpx.Response) -> httpx.Response:
+    """304 응답을 캐시된 본문으로 200 응답처럼 복원 (Link 헤더 포함)"""
+    _etag_stats["not_modified"] += 1
+    headers = {"content-type": "application/json", "etag": entry["etag"]}
+    if entry.get("link"):
+        headers["link"] = entry["link"]
+    # Rate Limit 헤더는 실제 응답 값을 유지
+    for name, value in not_modified.headers.items():
+        if name.startswith("x-ratelimit-"):
+            headers[name] = value
+    return httpx.Response(
+        200,
+        content=entry["body"].encode(),
+        headers=headers,
+        request=not_modified.request
+    )
+
+def get_etag_stats() -> dict:
+    """ETag 캐시 적중/304 지표"""
+    return dict(_etag_stats)
+
+class CommitDetailCache:
+    """
+    정제된 커밋 상세 2단 캐시 (프로세스 LRU → Redis)
+
+    커밋 내용은 SHA가 같으면 변하지 않으므로 저장소+SHA만으로 키를 만들어
+    같은 저장소를 쓰는 사용자끼리 공유합니다. SHA는 호출자 본인 토큰으로 조회한
+    커밋 목록에서만 얻으므로 접근 권한은 목록 조회 단계에서 확인됩니다.
+    """
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._lru: OrderedDict[str, dict] = OrderedDict()
+        self._stats = {"lru_hits": 0, "redis_hits": 0, "misses": 0, "stored": 0, "errors": 0}
+
+    @staticmethod
+    def _key(repo_name: str, sha: str) -> str:
+        return f"github:commit:v{COMMIT_CACHE_VERSION}:{repo_name.lower()}:{sha}"
+
+    def _remember(self, key: str, detail: dict):
+        self._lru[key] = detail
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    async def get_many(self, repo_name: str, shas: list[str]) -> dict[str, dict]:
+        """캐시된 커밋 상세 조회 (LRU 미스분은 Redis MGET 한 번으로 조회)"""
+        found: dict[str, dict] = {}
+        missing: list[str] = []
+        for sha in shas:
+            key = self._key(repo_name, sha)
+            if key in self._lru:
+                self._lru.move_to_end(key)
+                found[sha] = self._lru[key]
+                self._stats["lru_hits"] += 1
+            else:
+                missing.append(sha)
+
+        redis = get_shared_redis()
+        if missing and redis:
+            try:
+                values = await redis.mget([self._key(repo_name, sha) for sha in missing])
+            except RedisError as e:
+                self._stats["errors"] += 1
+                logger.warning(f"Redis mget error (commit cache): {e}")
+                values = [None] * len(missing)
+
+            for sha, value in zip(missing, values):
+                if value:
+                    detail = json.loads(value)
+                    self._remember(self._key(repo_name, sha), detail)
+                    found[sha] = detail
+                    self._stats["redis_hits"] += 1
+
+        self._stats["misses"] += len(shas) - len(found)
+        return found
+
+    async def set(self, repo_name: str, sha: str, detail: dict):
+        """커밋 상세 저장 (LRU + Redis)"""
+        key = self._key(repo_name, sha)
+        self._remember(key, detail)
+        self._stats["stored"] += 1
+
+        redis = get_shared_redis()
+        if redis:
+            try:
+                await redis.set(key, json.dumps(detail), ex=settings.GITHUB_COMMIT_CACHE_TTL_SECONDS)
+            except RedisError as e:
+                self._stats["errors"] += 1
+                logger.warning(f"Redis set error (commit cache): {e}")
+
+    def clear_local(self):
+        """프로세스 LRU 비우기"""
+        self._lru.clear()
+
+    def stats(self) -> dict:
+        return {**self._stats, "lru_size": len(self._lru)}
+
+commit_detail_cache = CommitDetailCache(settings.GITHUB_COMMIT_CACHE_MAX_ENTRIES)
@@ -0,0 +1,85 @@
+from datetime import date, datetime, time
+
+# 하루치 커밋 히스토리 (기본 브랜치 기준, REST /commits 목록과 동일한 범위)
+# GraphQL Commit 객체는 변경 파일 목록을 제공하지 않으므로 파일명/patch는 REST 상세에서 보강
+COMMIT_HISTORY_QUERY = """
+query($owner: String!, $name: String!, $since: GitTimestamp!, $until: GitTimestamp!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 100, since: $since, until: $until, after: $after) {
+            pageInfo { hasNextPage endCursor }
+            nodes {
+              oid
+              committedDate
+              message
+              additions
+              deletions
+              changedFilesIfAvailable
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+class GraphQLError(Exception):
+    """GraphQL 응답의 errors 필드"""
+    def __init__(self, messages: list[str], not_found: bool = False):
+        self.messages = messages
+        self.not_found = not_found
+        super().__init__("; ".join(messages))
+
+def build_history_variables(repo_name: str, target_date: date, after: str | None = None) -> dict:
+    """커밋 히스토리 쿼리 변수 생성"""
+    owner, name = repo_name.split("/", 1)
+    return {
+        "owner": owner,
+        "name": name,
+        "since": datetime.combine(target_date, time.min).isoformat() + "Z",
+        "until": datetime.combine(target_date, time.max).isoformat() + "Z",
+        "after": after,
+    }
+
+def _node_to_commit(node: dict) -> dict:
+    """GraphQL 커밋 노드를 정제 커밋 형식으로 변환 (REST 상세 보강용 sha, 커밋 시각 포함)"""
+    return {
+        "sha": node["oid"],
+        "committed_at": node.get("committedDate"),
+        "message": node["message"],
+        "additions": node.get("additions") or 0,
+        "deletions": node.get("deletions") or 0,
+        "changed_files": node.get("changedFilesIfAvailable") or 0,
+        "files": [],
+    }
+
+def parse_history_page(payload: dict) -> tuple[list[dict], str | None]:
+    """
+    히스토리 응답 파싱
+
+    Returns:
+        (커밋 목록, 다음 페이지 커서 또는 None)
+
+    Raises:
+        GraphQLError: 응답에 errors가 포함된 경우
+    """
+    if payload.get("errors"):
+        errors = payload["errors"]
+        raise GraphQLError(
+            [err.get("message", "") for err in errors],
+            not_found=any(err.get("type") == "NOT_FOUND" for err in errors),
+        )
+
+    repository = (payload.get("data") or {}).get("repository")
+    branch = (repository or {}).get("defaultBranchRef")
+    if not branch:
+        # 빈 저장소(기본 브랜치 없음)
+        return [], None
+
+    history = branch["target"]["history"]
+    commits = [_node_to_commit(node) for node in history["nodes"]]
+    page_info = history["pageInfo"]
+    return commits, page_info["endCursor"] if page_info["hasNextPage"] else None
@@ -0,0 +1,185 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+
+import httpx
+
+from app.core.config import settings
+
+# 토큰별 상태를 무한정 보관하지 않도록 최근 사용 순으로 제한
+MAX_TRACKED_TOKENS = 1000
+
+class Priority(IntEnum):
+    """GitHub 요청 우선순위"""
+    HIGH = 0  # 일지 생성 (사용자가 결과를 기다리는 작업)
+    LOW = 1   # 상태 확인, 저장소 목록 등 (할당량이 부족하면 미루거나 거절)
+
+def token_key(access_token: str) -> str:
+    """토큰 원문 대신 사용하는 식별자 (캐시 키, 지표용)"""
+    return hashlib.sha256(access_token.encode()).hexdigest()[:16]
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더 파싱 (초 단위 또는 HTTP-date)"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+class TokenQuota:
+    """토큰 단위 할당량 상태 및 동시성 제한"""
+    def __init__(self):
+        self.semaphore = asyncio.Semaphore(settings.GITHUB_PER_TOKEN_CONCURRENCY)
+        # 낮은 우선순위 작업이 토큰 슬롯을 독점하지 않도록 별도 상한
+        self.low_priority_semaphore = asyncio.Semaphore(settings.GITHUB_LOW_PRIORITY_CONCURRENCY)
+        # 잔여 할당량이 적을 때는 요청을 직렬화
+        self.low_quota_lock = asyncio.Lock()
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset_at: float | None = None
+        self.pause_until: float = 0.0
+        self.in_flight = {Priority.HIGH: 0, Priority.LOW: 0}
+
+    @property
+    def low_quota(self) -> bool:
+        return self.remaining is not None and self.remaining < settings.GITHUB_RATE_LIMIT_LOW_WATERMARK
+
+    def admission_wait(self, priority: Priority) -> float:
+        """
+        요청 전 대기해야 하는 시간(초)
+
+        - 공통: Retry-After / 할당량 소진으로 인한 일시 정지
+        - LOW: 잔여 할당량이 예약분(GITHUB_QUOTA_RESERVE) 이하이면 리셋 시각까지 대기
+        """
+        now = time.time()
+        wait = max(self.pause_until - now, 0.0)
+        if (
+            priority is Priority.LOW
+            and self.remaining is not None
+            and self.remaining <= settings.GITHUB_QUOTA_RESERVE
+            and self.reset_at
+        ):
+            wait = max(wait, self.reset_at - now)
+        return wait
+
+    def update(self, response: httpx.Response) -> bool:
+        """
+        응답 헤더로 할당량 상태 갱신
+
+        Returns:
+            Rate Limit에 걸린 응답(재시도 대상)이면 True
+        """
+        headers = response.headers
+        if "x-ratelimit-remaining" in headers:
+            self.remaining = int(headers["x-ratelimit-remaining"])
+        if "x-ratelimit-limit" in headers:
+            self.limit = int(headers["x-ratelimit-limit"])
+        if "x-ratelimit-reset" in headers:
+            self.reset_at = float(headers["x-ratelimit-reset"])
+
+        if response.status_code not in (403, 429):
+            return False
+
+        # 403은 권한 문제일 수도 있으므로 Rate Limit 신호가 있을 때만 재시도
+        retry_after = _parse_retry_after(headers.get("retry-after"))
+        if retry_after is not None:
+            self.pause_until = max(self.pause_until, time.time() + retry_after)
+            return True
+        if self.remaining == 0 and self.reset_at:
+            self.pause_until = max(self.pause_until, self.reset_at)
+            return True
+        return response.status_code == 429
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "reset_at": self.reset_at,
+            "paused_for": round(max(self.pause_until - time.time(), 0.0), 1),
+            "in_flight_high": self.in_flight[Priority.HIGH],
+            "in_flight_low": self.in_flight[Priority.LOW],
+        }
+
+class GithubScheduler:
+    """
+    GitHub 요청 스케줄러
+
+    전역/토큰별 동시성을 제한하고, 응답 헤더로 토큰별 잔여 할당량과 리셋 시각을 추적합니다.
+    할당량이 예약분 이하로 떨어지면 낮은 우선순위 요청을 리셋까지 미뤄
+    일지 생성(HIGH)에 쓸 여유분을 남겨 둡니다.
+    """
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._global: asyncio.Semaphore | None = None
+        self._tokens: OrderedDict[str, TokenQuota] = OrderedDict()
+        self._stats = {"delayed_high": 0, "delayed_low": 0, "rejected_high": 0, "rejected_low": 0}
+
+    def _ensure_loop(self):
+        # asyncio 동기화 객체는 이벤트 루프에 묶이므로 루프가 바뀌면 재생성
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._global = asyncio.Semaphore(settings.GITHUB_MAX_CONCURRENCY)
+            self._tokens.clear()
+
+    def for_token(self, access_token: str) -> TokenQuota:
+        self._ensure_loop()
+        key = token_key(access_token)
+        quota = self._tokens.get(key)
+        if quota is None:
+            quota = TokenQuota()
+            self._tokens[key] = quota
+            if len(self._tokens) > MAX_TRACKED_TOKENS:
+                self._tokens.popitem(last=False)
+        else:
+            self._tokens.move_to_end(key)
+        return quota
+
+    def max_wait(self, priority: Priority) -> float:
+        """우선순위별 허용 대기 시간 (초과 시 즉시 실패)"""
+        if priority is Priority.LOW:
+            return settings.GITHUB_LOW_PRIORITY_MAX_WAIT
+        return settings.GITHUB_RATE_LIMIT_MAX_WAIT
+
+    def record(self, event: str, priority: Priority):
+        self._stats[f"{event}_{priority.name.lower()}"] += 1
+
+    @asynccontextmanager
+    async def slot(self, access_token: str, priority: Priority = Priority.HIGH):
+        """전역/토큰 슬롯을 모두 확보한 뒤 요청 수행 (LOW는 우선순위 슬롯을 먼저 확보)"""
+        quota = self.for_token(access_token)
+        # LOW 대기 중에 토큰 슬롯을 점유하지 않도록 우선순위 슬롯부터 확보
+        if priority is Priority.LOW:
+            await quota.low_priority_semaphore.acquire()
+        try:
+            async with self._global, quota.semaphore:
+                quota.in_flight[priority] += 1
+                try:
+                    if quota.low_quota:
+                        async with quota.low_quota_lock:
+                            yield quota
+                    else:
+                        yield quota
+                finally:
+                    quota.in_flight[priority] -= 1
+        finally:
+            if priority is Priority.LOW:
+                quota.low_priority_semaphore.release()
+
+    def stats(self) -> dict:
+        """스케줄러 지표 및 토큰(사용자)별 할당량 상태"""
+        return {
+            **self._stats,
+            "tokens": {key: quota.snapshot() for key, quota in self._tokens.items()},
+        }
+
+github_scheduler = GithubScheduler()
@@ -1,8 +1,26 @@
 import httpx
 import asyncio
-from datetime import date, datetime, time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
 from loguru import logger
+from redis.exceptions import RedisError
 from app.core.config import settings
+from app.core.github_client import github_request
+from app.core.redis import get_shared_redis
+from app.services import github_cache
+from app.services.github_cache import commit_detail_cache
+from app.services.github_graphql import (
+    COMMIT_HISTORY_QUERY,
+    GraphQLError,
+    build_history_variables,
+    parse_history_page,
+)
+from app.services.github_scheduler import Priority, github_scheduler
+from app.services.prompt_builder import detail_candidates, estimate_json_tokens
+from app.utils.file_filter import compile_ignore_matcher
+from app.utils.json_stream import JsonStreamError, iter_object_events
 
 # --- 사용자 정의 예외 클래스 ---
 class GithubApiError(Exception):
@@ -19,7 +37,8 @@ class GithubAuthError(GithubApiError):
 
 class GithubRateLimitError(GithubApiError):
     """403/429: API 요청 제한 초과"""
-    def __init__(self, message: str = "GitHub API rate limit exceeded"):
+    def __init__(self, message: str = "GitHub API rate limit exceeded", retry_after: float | None = None):
+        self.retry_after = retry_after  # 다시 시도할 수 있을 때까지 남은 시간(초)
         super().__init__(message, status_code=429)
 
 class GithubResourceNotFoundError(GithubApiError):
@@ -35,6 +54,9 @@ class GithubNoCommitsError(GithubApiError):
 GITHUB_TOKEN_URL = "https://github.com/login/oauth/access_token"
 GITHUB_USER_URL = "https://api.github.com/user"
 
+# 상세 커밋 조회는 응답이 커서 기본 타임아웃보다 넉넉하게 설정
+COMMIT_FETCH_TIMEOUT = 30.0
+
 def _handle_github_error(e: httpx.HTTPStatusError):
     """HTTP 상태 코드에 따른 예외 매핑"""
     status_code = e.response.status_code
@@ -54,47 +76,73 @@ def _handle_github_error(e: httpx.HTTPStatusError):
 
 async def get_access_token(code: str) -> str:
     """GitHub 인증 코드를 Access Token으로 교환"""
-    async with httpx.AsyncClient() as client:
-        headers = {"Accept": "application/json"}
-        data = {
-            "client_id": settings.GITHUB_CLIENT_ID,
-            "client_secret": settings.GITHUB_CLIENT_SECRET,
-            "code": code,
-        }
-        try:
-            response = await client.post(GITHUB_TOKEN_URL, headers=headers, json=data)
-            response.raise_for_status()
-            data = response.json()
-            
-            if "error" in data:
-                raise GithubAuthError(message=data["error_description"])
-            
-            return data["access_token"]
+    headers = {"Accept": "application/json"}
+    data = {
+        "client_id": settings.GITHUB_CLIENT_ID,
+        "client_secret": settings.GITHUB_CLIENT_SECRET,
+        "code": code,
+    }
+    try:
+        response = await github_request("POST", GITHUB_TOKEN_URL, headers=headers, json=data)
+        response.raise_for_status()
+        data = response.json()
         
-        except httpx.HTTPStatusError as e:
-            _handle_github_error(e)
-            
-        except httpx.RequestError as e:
-            raise GithubApiError(message=f"Network error: {str(e)}")
+        if "error" in data:
+            raise GithubAuthError(message=data["error_description"])
+        
+        return data["access_token"]
+    
+    except httpx.HTTPStatusError as e:
+        _handle_github_error(e)
+        
+    except httpx.RequestError as e:
+        raise GithubApiError(message=f"Network error: {str(e)}")
 
 async def get_user_info(access_token: str) -> dict:
     """Access Token으로 GitHub 사용자 정보 조회"""
-    async with httpx.AsyncClient() as client:
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-        try:
-            response = await client.get(GITHUB_USER_URL, headers=headers)
-            response.raise_for_status()
-            return response.json()
+    headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    try:
+        response = await _cached_get(GITHUB_USER_URL, access_token, headers=headers)
+        response.raise_for_status()
+        return response.json()
+    
+    except httpx.HTTPStatusError as e:
+        _handle_github_error(e)
         
-        except httpx.HTTPStatusError as e:
-            _handle_github_error(e)
-            
-        except httpx.RequestError as e:
-            raise GithubApiError(message=f"Network error: {str(e)}")
+    except httpx.RequestError as e:
+        raise GithubApiError(message=f"Network error: {str(e)}")
         
+async def _get_repositories_page(access_token: str, page: int, per_page: int) -> httpx.Response:
+    """저장소 목록 단일 페이지 조회 (최근 업데이트순, 본인 소유)"""
+    headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    
+    safe_per_page = min(per_page, 100)
+    
+    params = {
+        "sort": "updated",
+        "direction": "desc",
+        "type": "owner",
+        "page": page,
+        "per_page": safe_per_page
+    }
+    try:
+        response = await _cached_get(
+            "https://api.github.com/user/repos", access_token,
+            headers=headers, params=params, priority=Priority.LOW
+        )
+        response.raise_for_status()
+        return response
+    except httpx.HTTPStatusError as e:
+        _handle_github_error(e)
+    except httpx.RequestError as e:
+        raise GithubApiError(message=f"Network error: {str(e)}")
+
 async def get_repositories(
     access_token: str,
     page: int = 1,
@@ -103,34 +151,454 @@ async def get_repositories(
     """
     사용자의 GitHub 저장소 목록 조회
     """
-    async with httpx.AsyncClient() as client:
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-        
-        safe_per_page = min(per_page, 100)
-        
-        params = {
-            "sort": "updated",
-            "direction": "desc",
-            "type": "owner",
-            "page": page,
-            "per_page": safe_per_page
-        }
+    response = await _get_repositories_page(access_token, page, per_page)
+    return response.json()
+
+async def get_all_repositories(access_token: str) -> list[dict]:
+    """
+    사용자의 GitHub 저장소 전체 조회
+
+    첫 페이지의 Link(rel="last")로 전체 페이지 수를 확인한 뒤 나머지 페이지를 동시에 조회합니다.
+    (동시성은 스케줄러가 토큰별로 제한)
+    """
+    first = await _get_repositories_page(access_token, 1, 100)
+    last_url = first.links.get("last", {}).get("url")
+    last_page = int(httpx.URL(last_url).params.get("page", 1)) if last_url else 1
+
+    rest = await asyncio.gather(
+        *(_get_repositories_page(access_token, page, 100) for page in range(2, last_page + 1))
+    )
+    repos = first.json()
+    for response in rest:
+        repos.extend(response.json())
+    return repos
+
+async def _request_with_limits(
+    method: str,
+    url: str,
+    access_token: str,
+    priority: Priority = Priority.HIGH,
+    **kwargs
+) -> httpx.Response:
+    """
+    스케줄러(동시성 제한 + 토큰별 할당량 추적)를 거친 요청
+
+    Retry-After 또는 X-RateLimit-Remaining=0 응답은 허용 대기 시간 내에서 재시도합니다.
+    LOW 요청은 잔여 할당량이 예약분 이하이면 리셋까지 미뤄지며,
+    허용 대기 시간을 넘기면 GithubRateLimitError(retry_after 포함)를 발생시킵니다.
+    """
+    quota = github_scheduler.for_token(access_token)
+
+    for _ in range(settings.GITHUB_RATE_LIMIT_MAX_RETRIES + 1):
+        wait = quota.admission_wait(priority)
+        if wait > github_scheduler.max_wait(priority):
+            github_scheduler.record("rejected", priority)
+            raise GithubRateLimitError(retry_after=wait)
+        if wait:
+            github_scheduler.record("delayed", priority)
+            logger.warning(f"⏳ GitHub Rate Limit 대기 ({priority.name}): {wait:.1f}s")
+            await asyncio.sleep(wait)
+
+        async with github_scheduler.slot(access_token, priority):
+            response = await github_request(method, url, **kwargs)
+
+        if not quota.update(response):
+            return response
+        if kwargs.get("stream"):
+            await response.aclose()
+
+    return response
+
+async def _cached_get(
+    url: str,
+    access_token: str,
+    *,
+    headers: dict,
+    params: dict | None = None,
+    timeout: float | None = None,
+    priority: Priority = Priority.HIGH
+) -> httpx.Response:
+    """
+    ETag 조건부 요청을 적용한 GET
+
+    저장된 ETag가 있으면 If-None-Match로 요청하고, 304 응답 시 캐시된 본문을 반환합니다.
+    Redis가 없으면 일반 요청과 동일하게 동작합니다.
+    """
+    redis = get_shared_redis()
+    entry = None
+    if redis:
+        entry = await github_cache.load_etag_entry(redis, url, params, access_token)
+        if entry:
+            headers = {**headers, "If-None-Match": entry["etag"]}
+
+    response = await _request_with_limits(
+        "GET", url, access_token, priority, headers=headers, params=params, timeout=timeout
+    )
+
+    if response.status_code == 304 and entry:
+        return github_cache.replay_etag_entry(entry, response)
+    if redis and response.status_code == 200:
+        await github_cache.store_etag_entry(redis, url, params, access_token, response)
+    return response
+
+# 분석 가치가 없는 파일(Lock 파일, 이미지, 바이너리, 벤더 디렉터리 등) 판별
+_is_ignored_file = compile_ignore_matcher(
+    settings.GITHUB_IGNORED_EXTENSIONS, settings.GITHUB_IGNORED_GLOBS
+)
+
+# 상세 응답 스트리밍 중 파일 항목의 문자열(patch 등)을 보관할 최대 길이
+# (_trim_file의 patch 절단 길이보다 길어 정제 결과는 같고, 거대한 patch 하나가 메모리에 통째로 올라가지 않음)
+FILE_STRING_SCAN_LIMIT = 4096
+
+def _trim_file(f: dict) -> dict | None:
+    """AI 분석용 파일 데이터 정제 (제외 대상이면 None)"""
+    filename = f["filename"]
+    if _is_ignored_file(filename):
+        return None
+
+    patch = f.get("patch", "")
+    status = f["status"]
+
+    # Patch 길이 제한 (토큰 폭발 방지)
+    # 새로 추가된 파일이거나 내용이 너무 길면 요약 처리
+    if status == 'added' and len(patch) > 300:
+        patch = "(new file content hidden)"
+    elif len(patch) > 500:
+        patch = patch[:500] + "\n...(truncated)"
+
+    return {
+        "filename": filename,
+        "status": status,
+        "additions": f.get("additions", 0),
+        "deletions": f.get("deletions", 0),
+        "patch": patch
+    }
+
+async def _read_commit_detail(chunks: AsyncIterator[str]) -> dict:
+    """
+    커밋 상세 응답을 스트리밍으로 읽으며 정제
+
+    files 배열은 원소 단위로 디코딩해 바로 필터링/patch 절단 후 버리고, 원소 안의 문자열도
+    스캔 중에 FILE_STRING_SCAN_LIMIT로 자르므로 커밋이 아무리 커도 메모리 사용량이 제한됩니다.
+    """
+    message = ""
+    committed_at = None
+    stats: dict = {}
+    changed_files = 0
+    optimized_files = []
+
+    events = iter_object_events(
+        chunks, keep_keys=("commit", "stats"), stream_keys=("files",), max_item_string=FILE_STRING_SCAN_LIMIT
+    )
+    async for key, value in events:
+        if key == "files":
+            changed_files += 1
+            trimmed = _trim_file(value)
+            if trimmed:
+                optimized_files.append(trimmed)
+        elif key == "commit":
+            message = value["message"]
+            committed_at = (value.get("committer") or {}).get("date")
+        elif key == "stats":
+            stats = value
+
+    # ✨ [최적화] 핵심 정보만 남김 (sha, author 등 제거)
+    return {
+        "message": message,
+        "additions": stats.get("additions", 0),
+        "deletions": stats.get("deletions", 0),
+        "changed_files": changed_files,
+        "files": optimized_files,
+        "committed_at": committed_at
+    }
+
+def _split_commit_time(detail: dict) -> tuple[dict, str | None]:
+    """
+    캐시된 상세에서 커밋 시각(committer date)을 분리
+
+    커밋 시각은 로컬 커밋 저장소용이며 프롬프트에는 넣지 않습니다. (이전 캐시 항목에는 없을 수 있음)
+    """
+    if "committed_at" not in detail:
+        return detail, None
+    detail = dict(detail)
+    return detail, detail.pop("committed_at")
+
+@dataclass
+class CommitDetailsResult:
+    """커밋 상세 조회 결과 (실패한 SHA 포함)"""
+    commits: list[dict] = field(default_factory=list)
+    failed_shas: dict[str, str] = field(default_factory=dict)  # sha -> 실패 사유
+    committed_at: dict[str, str] = field(default_factory=dict)  # sha -> 커밋 시각 (committer date)
+
+async def _fetch_commit_detail(repo_name: str, sha: str, access_token: str) -> dict:
+    """
+    단일 커밋 상세 조회 후 정제 및 캐시 저장
+
+    정제본을 SHA 기반 캐시에 보관하므로 원본 본문에 대한 ETag 캐시는 사용하지 않습니다.
+    응답 본문은 전체를 읽지 않고 스트리밍으로 정제합니다.
+    """
+    headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    response = await _request_with_limits(
+        "GET",
+        f"https://api.github.com/repos/{repo_name}/commits/{sha}",
+        access_token,
+        headers=headers,
+        timeout=COMMIT_FETCH_TIMEOUT,
+        stream=True
+    )
+    try:
+        response.raise_for_status()
+        detail = await _read_commit_detail(response.aiter_text())
+    except JsonStreamError as e:
+        raise GithubApiError(message=f"Invalid commit detail response: {e}", status_code=502)
+    finally:
+        await response.aclose()
+    await commit_detail_cache.set(repo_name, sha, detail)
+    return detail
+
+async def fetch_commit_details(
+    repo_name: str,
+    shas: list[str],
+    access_token: str
+) -> CommitDetailsResult:
+    """
+    커밋 SHA 목록의 상세 정보를 제한된 동시성으로 조회 (캐시된 SHA는 요청 생략)
+
+    Returns:
+        SHA 순서를 유지한 정제 커밋 목록, 실패한 SHA별 사유, SHA별 커밋 시각
+    """
+    cached = await commit_detail_cache.get_many(repo_name, shas)
+    missing = [sha for sha in shas if sha not in cached]
+    responses = await asyncio.gather(
+        *(_fetch_commit_detail(repo_name, sha, access_token) for sha in missing),
+        return_exceptions=True
+    )
+    fetched = dict(zip(missing, responses))
+
+    result = CommitDetailsResult()
+    for sha in shas:
+        detail = cached[sha] if sha in cached else fetched[sha]
+        if isinstance(detail, Exception):
+            result.failed_shas[sha] = str(detail) or type(detail).__name__
+            continue
+        detail, committed_at = _split_commit_time(detail)
+        result.commits.append(detail)
+        if committed_at:
+            result.committed_at[sha] = committed_at
+    return result
+
+async def _iter_rest_pages(
+    repo_name: str,
+    target_date: date,
+    access_token: str,
+    end_date: date | None = None
+) -> AsyncIterator[list[dict]]:
+    """REST 커밋 목록을 Link 헤더를 따라 페이지 단위로 조회 (sha, 커밋 시각만 사용, end_date 지정 시 기간 조회)"""
+    headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    since = datetime.combine(target_date, time.min).isoformat() + "Z"
+    until = datetime.combine(end_date or target_date, time.max).isoformat() + "Z"
+
+    url: str | None = f"https://api.github.com/repos/{repo_name}/commits"
+    params: dict | None = {"since": since, "until": until, "per_page": 100}
+
+    while url:
         try:
-            response = await client.get("https://api.github.com/user/repos", headers=headers, params=params)
+            response = await _cached_get(
+                url, access_token, headers=headers, params=params, timeout=COMMIT_FETCH_TIMEOUT
+            )
             response.raise_for_status()
-            return response.json()
         except httpx.HTTPStatusError as e:
             _handle_github_error(e)
         except httpx.RequestError as e:
             raise GithubApiError(message=f"Network error: {str(e)}")
 
-async def fetch_commits(
+        yield [
+            {"sha": commit["sha"], "committed_at": commit.get("commit", {}).get("committer", {}).get("date")}
+            for commit in response.json()
+        ]
+
+        # 다음 페이지 URL에 쿼리가 모두 포함되어 있으므로 params는 첫 요청에만 사용
+        url = response.links.get("next", {}).get("url")
+        params = None
+
+async def _iter_graphql_pages(
     repo_name: str,
     target_date: date,
     access_token: str
+) -> AsyncIterator[list[dict]]:
+    """GraphQL 커밋 히스토리를 페이지(최대 100개) 단위로 조회 (메시지, 변경 라인/파일 수 포함)"""
+    headers = {"Authorization": f"Bearer {access_token}"}
+    cursor: str | None = None
+
+    while True:
+        try:
+            response = await _request_with_limits(
+                "POST",
+                settings.GITHUB_GRAPHQL_URL,
+                access_token,
+                headers=headers,
+                json={
+                    "query": COMMIT_HISTORY_QUERY,
+                    "variables": build_history_variables(repo_name, target_date, cursor),
+                },
+                timeout=COMMIT_FETCH_TIMEOUT
+            )
+            response.raise_for_status()
+            commits, cursor = parse_history_page(response.json())
+        except httpx.HTTPStatusError as e:
+            _handle_github_error(e)
+        except httpx.RequestError as e:
+            raise GithubApiError(message=f"Network error: {str(e)}")
+        except GraphQLError as e:
+            logger.error(f"❌ GitHub GraphQL 오류: {e}")
+            if e.not_found:
+                raise GithubResourceNotFoundError()
+            raise GithubApiError(message=f"GitHub GraphQL Error: {e}", status_code=502)
+
+        yield commits
+        if cursor is None:
+            return
+
+async def list_commit_range(
+    repo_name: str,
+    start_date: date,
+    end_date: date,
+    access_token: str
+) -> tuple[list[dict], int]:
+    """
+    기간 내 커밋 목록 (sha, committed_at만, 최신순)
+
+    날짜별로 나누지 않고 기간 전체를 페이지네이션된 목록 요청으로 조회합니다. (백필용)
+
+    Returns:
+        커밋 목록과 사용한 목록 요청(페이지) 수
+    """
+    commits, pages = [], 0
+    async for page in _iter_rest_pages(repo_name, start_date, access_token, end_date):
+        commits.extend(page)
+        pages += 1
+    return commits, pages
+
+async def _iter_listed(pages: list[list[dict]]) -> AsyncIterator[list[dict]]:
+    for page in pages:
+        yield page
+
+async def _graphql_summary_only(pages: AsyncIterator[list[dict]], detail_budget: int) -> tuple[list[list[dict]], set[str]]:
+    """
+    GraphQL 목록을 모두 받은 뒤, 프롬프트 예산상 파일/patch가 쓰이지 않을 커밋 SHA 선별
+
+    메타데이터만으로도 map-reduce 임계치를 넘는 날은 모든 커밋이 청크 프롬프트에 쓰이므로 전부 상세 조회합니다.
+    """
+    async with aclosing(pages):
+        listed = [page async for page in pages]
+    commits = [commit for page in listed for commit in page]
+    if estimate_json_tokens(commits) > settings.GEMINI_MAP_REDUCE_THRESHOLD_TOKENS:
+        return listed, set()
+    needed = detail_candidates(commits, detail_budget)
+    return listed, {commit["sha"] for i, commit in enumerate(commits) if i not in needed}
+
+async def iter_commits(
+    repo_name: str,
+    target_date: date,
+    access_token: str,
+    failed_shas: dict[str, str] | None = None,
+    include_patches: bool = True,
+    known: dict[str, dict] | None = None,
+    fetched: dict[str, dict] | None = None,
+    detail_budget: int | None = None
+) -> AsyncIterator[dict]:
+    """
+    특정 날짜의 커밋을 페이지 단위로 스트리밍
+
+    페이지마다 상세 조회를 동시에 시작하고, 목록 순서대로 정제된 커밋을 yield 합니다.
+    호출자가 중간에 순회를 멈추면 남은 상세 조회는 취소되고 다음 페이지는 요청하지 않습니다.
+
+    GITHUB_COMMIT_BACKEND가 "graphql"이면 메시지/변경량을 GraphQL로 한 번에 받고,
+    include_patches=True일 때만 파일명/patch를 위해 REST 상세(캐시 우선)를 조회합니다.
+    detail_budget을 주면 그 프롬프트 예산에서 파일/patch가 들어갈 커밋만 REST 상세를 조회합니다.
+
+    Args:
+        failed_shas: 전달 시 상세 조회에 실패한 SHA와 사유를 기록
+        include_patches: False면 GraphQL 백엔드에서 REST 상세 조회를 생략 (files는 빈 목록)
+        known: 이미 보유한 SHA별 정제 커밋 (로컬 커밋 저장소 등, 상세 조회 생략)
+        fetched: 전달 시 known 외에 새로 얻은 상세 커밋을 SHA별로 기록 (committed_at 포함)
+        detail_budget: GraphQL 백엔드에서 상세 조회 대상을 고를 프롬프트 입력 토큰 예산
+    """
+    known = known or {}
+    use_graphql = settings.GITHUB_COMMIT_BACKEND == "graphql"
+    pages = (
+        _iter_graphql_pages(repo_name, target_date, access_token)
+        if use_graphql
+        else _iter_rest_pages(repo_name, target_date, access_token)
+    )
+    summary_only: set[str] = set()
+    if use_graphql and include_patches and detail_budget is not None:
+        listed, summary_only = await _graphql_summary_only(pages, detail_budget)
+        pages = _iter_listed(listed)
+
+    async with aclosing(pages):
+        async for page in pages:
+            if use_graphql and not include_patches:
+                for commit in page:
+                    yield {k: v for k, v in commit.items() if k not in ("sha", "committed_at")}
+                continue
+
+            shas = [commit["sha"] for commit in page]
+            committed_at = {commit["sha"]: commit["committed_at"] for commit in page}
+            cached = {sha: known[sha] for sha in shas if sha in known}
+            cached.update(
+                await commit_detail_cache.get_many(repo_name, [sha for sha in shas if sha not in cached])
+            )
+            # 예산상 파일/patch가 쓰이지 않는 커밋은 GraphQL 메타데이터만 사용 (저장소 write-through 제외)
+            summaries = {
+                commit["sha"]: {k: v for k, v in commit.items() if k not in ("sha", "committed_at")}
+                for commit in page
+                if commit["sha"] in summary_only and commit["sha"] not in cached
+            }
+            logger.debug(
+                f"📶 {len(shas)}개 커밋 중 {len(shas) - len(cached) - len(summaries)}개 상세 정보 병렬 조회 중..."
+            )
+            tasks = {
+                sha: asyncio.create_task(_fetch_commit_detail(repo_name, sha, access_token))
+                for sha in shas
+                if sha not in cached and sha not in summaries
+            }
+            try:
+                for sha in shas:
+                    if sha in summaries:
+                        yield summaries[sha]
+                        continue
+                    if sha in cached:
+                        detail = cached[sha]
+                    else:
+                        try:
+                            detail = await tasks[sha]
+                        except (GithubApiError, httpx.HTTPError) as e:
+                            if failed_shas is not None:
+                                failed_shas[sha] = str(e) or type(e).__name__
+                            continue
+                    detail, _ = _split_commit_time(detail)
+                    if fetched is not None and sha not in known:
+                        fetched[sha] = {"committed_at": committed_at[sha], **detail}
+                    yield detail
+            finally:
+                for task in tasks.values():
+                    task.cancel()
+
+async def fetch_commits(
+    repo_name: str,
+    target_date: date,
+    access_token: str,
+    include_patches: bool = True,
+    known: dict[str, dict] | None = None,
+    fetched: dict[str, dict] | None = None,
+    detail_budget: int | None = None
 ) -> list[dict]:
     """
     특정 날짜의 커밋 목록 수집 및 상세 정보(patch) 포함 (R-BIZ-3)
@@ -139,90 +607,93 @@ async def fetch_commits(
         repo_name: 저장소 풀네임 (예: "user/repo")
         target_date: 조회 대상 날짜
         access_token: GitHub OAuth 토큰
+        include_patches: False면 GraphQL 백엔드에서 파일/patch 조회 생략
+        known: 이미 보유한 SHA별 정제 커밋 (상세 조회 생략)
+        fetched: 전달 시 새로 얻은 커밋을 SHA별로 기록 (저장소 write-through용)
+        detail_budget: GraphQL 백엔드에서 이 프롬프트 예산에 들어갈 커밋만 상세 조회
 
     Returns:
         상세 정보(files, patch, stats)가 포함된 커밋 리스트
 
     Raises:
         GithubNoCommitsError: 커밋이 없는 경우
-        GithubApiError: API 호출 실패 시
+        GithubApiError: API 호출 실패 시 (상세 조회가 전부 실패한 경우 포함)
     """
     logger.info(f"🔍 [GitHub] 상세 커밋 수집 시작: {repo_name} | 날짜: {target_date}")
 
-    # 상세 조회를 위해 타임아웃을 넉넉하게 설정
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-
-        # 1. 커밋 목록(SHA) 조회
-        since = datetime.combine(target_date, time.min).isoformat() + "Z"
-        until = datetime.combine(target_date, time.max).isoformat() + "Z"
+    failed_shas: dict[str, str] = {}
+    commits = [
+        commit async for commit in iter_commits(
+            repo_name, target_date, access_token, failed_shas, include_patches, known, fetched, detail_budget
+        )
+    ]
 
-        list_url = f"https://api.github.com/repos/{repo_name}/commits"
-        params = {"since": since, "until": until, "per_page": 100}
+    if failed_shas:
+        logger.warning(
+            f"⚠️ 커밋 상세 조회 실패 {len(failed_shas)}건: "
+            + ", ".join(f"{sha[:7]}({reason})" for sha, reason in failed_shas.items())
+        )
+        if not commits:
+            raise GithubApiError(
+                message=f"Failed to fetch commit details: {', '.join(failed_shas)}",
+                status_code=502
+            )
 
-        try:
-            response = await client.get(list_url, headers=headers, params=params)
-            response.raise_for_status()
-            base_commits = response.json()
+    if not commits:
+        raise GithubNoCommitsError(f"No commits found for {target_date}")
 
-            if not base_commits:
-                raise GithubNoCommitsError(f"No commits found for {target_date}")
+    logger.info(f"✅ {len(commits)}개의 상세 커밋 데이터 수집 완료 (AI 최적화됨)")
+    return commits
 
-            # 2. 각 커밋 SHA에 대해 상세 정보 병렬 수집 (asyncio.gather)
-            logger.debug(f"📶 {len(base_commits)}개 커밋 상세 정보 병렬 조회 중...")
-
-            tasks = [
-                client.get(f"{list_url}/{commit['sha']}", headers=headers)
-                for commit in base_commits
-            ]
-
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-            detailed_commits = []
-            for resp in responses:
-                if isinstance(resp, httpx.Response) and resp.status_code == 200:
-                    data = resp.json()
-
-                    # ✨ [최적화] AI 분석용 파일 데이터 정제
-                    optimized_files = []
-                    for f in data.get("files", []):
-                        filename = f["filename"]
-                        patch = f.get("patch", "")
-                        status = f["status"]
-
-                        # 1. 분석 가치가 없는 파일 제외 (Lock 파일, 이미지, 바이너리 등)
-                        if any(filename.endswith(ext) for ext in ['.lock', '.png', '.jpg', '.svg', '.pdf', '.min.js']):
-                            continue
-
-                        # 2. Patch 길이 제한 (토큰 폭발 방지)
-                        # 새로 추가된 파일이거나 내용이 너무 길면 요약 처리
-                        if status == 'added' and len(patch) > 300:
-                            patch = "(new file content hidden)"
-                        elif len(patch) > 500:
-                            patch = patch[:500] + "\n...(truncated)"
+async def has_commits(
+    repo_name: str,
+    target_date: date,
+    access_token: str
+) -> bool:
+    """
+    특정 날짜의 커밋 존재 여부만 확인 (daily-status용)
 
-                        optimized_files.append({
-                            "filename": filename,
-                            "status": status,
-                            "patch": patch
-                        })
+    per_page=1 목록 요청 한 번으로 판단하고, 결과를 (저장소, 날짜) 단위로 캐시합니다.
+    지난 날짜는 결과가 거의 바뀌지 않으므로 TTL을 길게 둡니다.
+    """
+    cache_key = f"github:probe:{repo_name.lower()}:{target_date.isoformat()}"
+    redis = get_shared_redis()
 
-                    # ✨ [최적화] 핵심 정보만 남김 (sha, author 등 제거)
-                    detailed_commits.append({
-                        "message": data["commit"]["message"],
-                        "files": optimized_files
-                    })
+    if redis:
+        try:
+            cached = await redis.get(cache_key)
+            if cached is not None:
+                return cached == "1"
+        except RedisError as e:
+            logger.warning(f"Redis get error (probe): {e}")
 
-                elif isinstance(resp, Exception):
-                    logger.error(f"❌ 커밋 상세 조회 실패: {str(resp)}")
+    headers = {
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    params = {
+        "since": datetime.combine(target_date, time.min).isoformat() + "Z",
+        "until": datetime.combine(target_date, time.max).isoformat() + "Z",
+        "per_page": 1,
+    }
+    try:
+        response = await _cached_get(
+            f"https://api.github.com/repos/{repo_name}/commits", access_token,
+            headers=headers, params=params, priority=Priority.LOW
+        )
+        response.raise_for_status()
+        exists = bool(response.json())
+    except httpx.HTTPStatusError as e:
+        _handle_github_error(e)
+    except httpx.RequestError as e:
+        raise GithubApiError(message=f"Network error: {e!s}")
 
-            logger.info(f"✅ {len(detailed_commits)}개의 상세 커밋 데이터 수집 완료 (AI 최적화됨)")
-            return detailed_commits
+    if redis:
+        is_past = target_date < datetime.now(timezone.utc).date()
+        ttl = settings.GITHUB_PROBE_PAST_TTL_SECONDS if is_past else settings.GITHUB_PROBE_TTL_SECONDS
+        try:
+            await redis.set(cache_key, "1" if exists else "0", ex=ttl)
+        except RedisError as e:
+            logger.warning(f"Redis set error (probe): {e}")
 
-        except httpx.HTTPStatusError as e:
-            _handle_github_error(e)
-        except httpx.RequestError as e:
-            raise GithubApiError(message=f"Network error: {str(e)}")
\ No newline at end of file
+    return exists
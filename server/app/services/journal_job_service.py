@@ -0,0 +1,272 @@
+import asyncio
+import json
+import time
+from datetime import date as date_type
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.redis import get_shared_redis
+from app.models import User
+from app.schemas.journal import JournalJobResponse
+from app.services.gemini_service import GeminiServiceError
+from app.services.github_service import GithubApiError
+from app.services.journal_service import JournalService
+
+# 일지 생성 작업 큐
+JOB_KEY = "journals:job:{job_id}"            # 작업 상태 (JSON)
+LEASE_KEY = "journals:job:{job_id}:lease"    # 처리 중 작업의 워커 생존 표시 (하트비트로 TTL 갱신)
+QUEUE_KEY = "journals:jobs:queue"            # 대기 (List, 왼쪽에 넣고 오른쪽에서 꺼냄)
+PROCESSING_KEY = "journals:jobs:processing"  # 처리 중 (워커 비정상 종료 시 복구용)
+DELAYED_KEY = "journals:jobs:delayed"        # 재시도 대기 (Sorted Set: 작업 ID → 실행 시각)
+DEAD_LETTER_KEY = "journals:jobs:dead"       # 최종 실패 (List)
+SUSPECT_KEY = "journals:jobs:suspect"        # 리스 없이 처리 중 목록에 있는 작업 (Sorted Set: 작업 ID → 처음 발견 시각)
+
+# 큐 대기(BLMOVE) 타임아웃: 종료 신호/재시도 대기열 확인 주기
+POLL_SECONDS = 1
+# BLMOVE 직후 리스를 잡기 전의 작업을 복구하지 않도록, 리스 없는 상태가 이 시간 이상 이어져야 복구
+CLAIM_GRACE_SECONDS = 30
+
+class JobQueueUnavailableError(Exception):
+    """Redis 미연결로 작업 큐를 사용할 수 없음"""
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+def _require_redis() -> Redis:
+    redis = get_shared_redis()
+    if redis is None:
+        raise JobQueueUnavailableError("Job queue is unavailable")
+    return redis
+
+async def _load_job(redis: Redis, job_id: str) -> dict | None:
+    raw = await redis.get(JOB_KEY.format(job_id=job_id))
+    return json.loads(raw) if raw else None
+
+async def _save_job(redis: Redis, job: dict):
+    job["updated_at"] = _now()
+    await redis.set(JOB_KEY.format(job_id=job["id"]), json.dumps(job), ex=settings.JOURNAL_JOB_TTL_SECONDS)
+
+async def _enqueue(user_id: UUID, kind: str, date: date_type, **options) -> JournalJobResponse:
+    redis = _require_redis()
+    now = _now()
+    job = {
+        "id": uuid4().hex,
+        "kind": kind,
+        "user_id": str(user_id),
+        "date": date.isoformat(),
+        **options,
+        "status": "queued",
+        "attempts": 0,
+        "journal_id": None,
+        "result": None,
+        "error": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+    await _save_job(redis, job)
+    await redis.lpush(QUEUE_KEY, job["id"])
+    logger.info(f"📥 일지 생성 작업 등록 ({kind}): {job['id']} | User:{user_id} | Date:{date}")
+    return JournalJobResponse(**job)
+
+async def enqueue_journal_job(
+    user_id: UUID,
+    date: date_type,
+    overwrite: bool = True,
+    force: bool = False
+) -> JournalJobResponse:
+    """일지 생성 작업 등록 (워커가 처리)"""
+    return await _enqueue(user_id, "daily", date, overwrite=overwrite, force=force)
+
+async def enqueue_backfill_job(
+    user_id: UUID,
+    start_date: date_type,
+    end_date: date_type,
+    overwrite: bool = False
+) -> JournalJobResponse:
+    """기간 백필 작업 등록 (재시도 시 이미 생성된 날짜는 건너뜀)"""
+    return await _enqueue(user_id, "backfill", start_date, end_date=end_date.isoformat(), overwrite=overwrite)
+
+async def get_journal_job(user_id: UUID, job_id: str) -> JournalJobResponse | None:
+    """작업 상태 조회 (본인 작업만)"""
+    redis = _require_redis()
+    job = await _load_job(redis, job_id)
+    if job is None or job["user_id"] != str(user_id):
+        return None
+    return JournalJobResponse(**job)
+
+def _is_retryable(error: Exception) -> bool:
+    """입력/권한 문제(4xx, ValueError)는 재시도해도 같은 결과이므로 제외"""
+    if isinstance(error, (GithubApiError, GeminiServiceError)):
+        return error.status_code == 429 or error.status_code >= 500
+    return not isinstance(error, ValueError)
+
+async def _run(job: dict) -> dict:
+    """작업 1건 수행 (요청 처리와 같은 JournalService 경로), 작업 상태에 반영할 결과 반환"""
+    async with AsyncSessionLocal() as db:
+        user = (await db.execute(select(User).where(User.id == UUID(job["user_id"])))).scalar_one_or_none()
+        if user is None:
+            raise ValueError("User not found")
+        service = JournalService(db)
+        if job.get("kind") == "backfill":
+            report = await service.backfill_journals(
+                user,
+                date_type.fromisoformat(job["date"]),
+                date_type.fromisoformat(job["end_date"]),
+                job["overwrite"],
+            )
+            return {"result": report.model_dump(mode="json")}
+        journal = await service.create_daily_journal(
+            user,
+            date_type.fromisoformat(job["date"]),
+            job["overwrite"],
+            job["force"],
+        )
+        return {"journal_id": str(journal.id)}
+
+async def _heartbeat(redis: Redis, job_id: str):
+    """작업이 진행되는 동안 리스 TTL을 주기적으로 갱신 (워커가 죽으면 만료되어 복구 대상이 됨)"""
+    lease = LEASE_KEY.format(job_id=job_id)
+    while True:
+        await asyncio.sleep(settings.JOURNAL_JOB_HEARTBEAT_SECONDS)
+        try:
+            await redis.set(lease, 1, ex=settings.JOURNAL_JOB_TIMEOUT_SECONDS)
+        except RedisError as e:
+            logger.warning(f"⚠️ 일지 생성 작업 하트비트 실패: {job_id} | {e}")
+
+async def process_job(job_id: str):
+    """
+    작업 처리 및 상태 기록
+
+    실패 시 재시도 가능한 에러면 지수 백오프로 재시도 대기열에 넣고,
+    JOURNAL_JOB_MAX_ATTEMPTS를 넘기거나 재시도 불가 에러면 dead-letter 목록으로 보냅니다.
+    """
+    redis = _require_redis()
+    # 처리 중 목록으로 옮긴 직후 바로 리스를 잡아 복구 대상에서 제외
+    lease = LEASE_KEY.format(job_id=job_id)
+    await redis.set(lease, 1, ex=settings.JOURNAL_JOB_TIMEOUT_SECONDS)
+    job = await _load_job(redis, job_id)
+    if job is None:
+        # TTL 만료 등으로 상태가 사라진 작업
+        await redis.delete(lease)
+        await redis.lrem(PROCESSING_KEY, 0, job_id)
+        return
+
+    job["status"] = "running"
+    job["attempts"] += 1
+    job["started_at"] = time.time()
+    await _save_job(redis, job)
+    heartbeat = asyncio.create_task(_heartbeat(redis, job_id))
+
+    started = time.perf_counter()
+    try:
+        outcome = await _run(job)
+    except Exception as e:  # noqa: BLE001 - 어떤 실패든 작업 상태에 기록하고 재시도/dead-letter로 처리
+        job["error"] = getattr(e, "message", None) or str(e)
+        if _is_retryable(e) and job["attempts"] < settings.JOURNAL_JOB_MAX_ATTEMPTS:
+            delay = settings.JOURNAL_JOB_RETRY_BASE_SECONDS * 2 ** (job["attempts"] - 1)
+            job["status"] = "queued"
+            await _save_job(redis, job)
+            await redis.zadd(DELAYED_KEY, {job_id: time.time() + delay})
+            logger.warning(f"🔁 일지 생성 작업 재시도 예약 ({job['attempts']}회 실패, {delay}초 후): {job_id} | {e}")
+        else:
+            job["status"] = "failed"
+            await _save_job(redis, job)
+            await redis.lpush(DEAD_LETTER_KEY, job_id)
+            logger.error(f"☠️ 일지 생성 작업 실패 (dead-letter): {job_id} | {e}")
+    else:
+        job["status"] = "succeeded"
+        job.update(outcome)
+        job["error"] = None
+        await _save_job(redis, job)
+        logger.info(f"✅ 일지 생성 작업 완료: {job_id} | {(time.perf_counter() - started) * 1000:.0f}ms")
+    finally:
+        heartbeat.cancel()
+        await redis.delete(lease)
+        await redis.lrem(PROCESSING_KEY, 0, job_id)
+        await redis.zrem(SUSPECT_KEY, job_id)
+
+async def _promote_delayed(redis: Redis):
+    """실행 시각이 된 재시도 작업을 대기열로 이동 (여러 워커가 동시에 옮겨도 한 번만 이동)"""
+    for job_id in await redis.zrangebyscore(DELAYED_KEY, 0, time.time()):
+        if await redis.zrem(DELAYED_KEY, job_id):
+            await redis.lpush(QUEUE_KEY, job_id)
+
+async def recover_stalled_jobs():
+    """
+    처리 중 목록에 남은 작업 복구 (워커 시작 시 및 JOURNAL_JOB_RECOVERY_INTERVAL_SECONDS마다)
+
+    처리 중인 워커는 하트비트로 리스를 갱신하므로, 리스가 남아 있으면 실행 시간과 관계없이 건너뜁니다.
+    리스 없는 상태가 CLAIM_GRACE_SECONDS 이상 이어진 작업만 워커가 종료된 것으로 보고 대기열로 되돌리며,
+    (꺼낸 직후 리스를 잡기 전인 작업 제외) 이미 완료/실패했거나 재시도 대기 중인 작업은 목록에서만 제거합니다.
+    """
+    redis = _require_redis()
+    now = time.time()
+    processing = await redis.lrange(PROCESSING_KEY, 0, -1)
+    # 목록에서 빠진 작업의 발견 기록 정리
+    gone = set(await redis.zrange(SUSPECT_KEY, 0, -1)) - set(processing)
+    if gone:
+        await redis.zrem(SUSPECT_KEY, *gone)
+    for job_id in processing:
+        if await redis.exists(LEASE_KEY.format(job_id=job_id)):
+            await redis.zrem(SUSPECT_KEY, job_id)
+            continue
+        await redis.zadd(SUSPECT_KEY, {job_id: now}, nx=True)
+        if now - await redis.zscore(SUSPECT_KEY, job_id) < CLAIM_GRACE_SECONDS:
+            continue
+        await redis.zrem(SUSPECT_KEY, job_id)
+        job = await _load_job(redis, job_id)
+        if not await redis.lrem(PROCESSING_KEY, 0, job_id) or job is None:
+            continue
+        if job["status"] in ("succeeded", "failed") or await redis.zscore(DELAYED_KEY, job_id) is not None:
+            continue
+        await redis.rpush(QUEUE_KEY, job_id)
+        logger.warning(f"♻️ 중단된 일지 생성 작업 복구: {job_id}")
+
+async def run_worker(concurrency: int | None = None, stop: asyncio.Event | None = None):
+    """
+    작업 큐 소비 루프
+
+    concurrency개의 소비자가 대기열에서 작업을 꺼내 처리 중 목록으로 옮긴 뒤(BLMOVE) 수행하고,
+    다른 워커가 비정상 종료해 남긴 작업은 주기적으로 복구합니다.
+    stop이 설정되면 진행 중인 작업을 마치고 종료합니다.
+    """
+    redis = _require_redis()
+    concurrency = concurrency or settings.JOURNAL_JOB_CONCURRENCY
+    stop = stop or asyncio.Event()
+    await recover_stalled_jobs()
+    logger.info(f"👷 일지 생성 워커 시작 (동시성 {concurrency})")
+
+    async def consume():
+        while not stop.is_set():
+            try:
+                await _promote_delayed(redis)
+                job_id = await redis.blmove(QUEUE_KEY, PROCESSING_KEY, POLL_SECONDS, "RIGHT", "LEFT")
+                if job_id:
+                    await process_job(job_id)
+            except Exception as e:  # noqa: BLE001 - 작업 하나의 오류로 소비 루프가 멈추지 않도록 함
+                logger.error(f"❌ 일지 생성 워커 오류: {e}")
+                await asyncio.sleep(POLL_SECONDS)
+
+    async def recover():
+        # 워커 재시작을 기다리지 않고 다른 워커의 비정상 종료도 복구
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.JOURNAL_JOB_RECOVERY_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            if stop.is_set():
+                break
+            try:
+                await recover_stalled_jobs()
+            except RedisError as e:
+                logger.error(f"❌ 일지 생성 작업 복구 오류: {e}")
+
+    await asyncio.gather(recover(), *(consume() for _ in range(concurrency)))
+    logger.info("👷 일지 생성 워커 종료")
@@ -1,19 +1,72 @@
+import asyncio
 import json
-from datetime import date as date_type
+import time
+from collections.abc import AsyncIterator
+from datetime import date as date_type, timedelta
+from typing import Any
 from uuid import UUID
 
 from redis.asyncio import Redis
 from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from app.models import Journal, User, Repository
-from app.schemas.journal import JournalCreate, JournalUpdate, JournalResponse, JournalStatusResponse
-from app.services.gemini_service import GeminiService
-from app.services.github_service import fetch_commits, GithubNoCommitsError
+from app.core.config import settings
+from app.models import Journal, JournalRawCommits, User, Repository
+from app.schemas.journal import (
+    JOURNAL_LIST_FIELDS,
+    BackfillReport,
+    JournalCreate,
+    JournalListItem,
+    JournalUpdate,
+    JournalResponse,
+    JournalStatusResponse,
+)
+from app.services import commit_service
+from app.services.gemini_service import GeminiService, GeminiServiceError
+from app.services.github_service import (
+    GithubApiError,
+    fetch_commit_details,
+    fetch_commits,
+    has_commits as probe_commits,
+    list_commit_range,
+)
+from app.services.prompt_builder import BudgetReport
+from app.services.single_flight import SingleFlight
+from app.utils.compression import DEFAULT_CODEC, compress_json, decompress_json
 
 from loguru import logger
 
+# 중복 클릭/재시도/여러 탭의 동시 생성 요청을 하나로 합침
+journal_flight = SingleFlight("journals", settings.JOURNAL_SINGLE_FLIGHT_LOCK_SECONDS)
+
+# 일지 Upsert 충돌 기준 (uq_user_repo_date)
+_JOURNAL_KEYS = ["user_id", "repository_id", "date"]
+
+def _upsert(db: AsyncSession, model: type, rows: list[dict], keys: list[str], overwrite: bool):
+    """
+    INSERT ... ON CONFLICT (keys) 문 생성
+
+    overwrite면 DO UPDATE, 아니면 DO NOTHING. PostgreSQL(asyncpg)과 SQLite(aiosqlite, 테스트) 방언을 지원합니다.
+    """
+    insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = insert(model).values(rows)
+    if not overwrite:
+        return stmt.on_conflict_do_nothing(index_elements=keys)
+    updates = {key: stmt.excluded[key] for key in rows[0] if key not in keys}
+    return stmt.on_conflict_do_update(
+        index_elements=keys,
+        set_={**updates, "updated_at": func.now()},
+    )
+
+def _log_budget(user_id: UUID, repo_name: str, date: date_type, report: BudgetReport | None):
+    """일지 1건의 프롬프트 예산 적용 결과 기록 (캐시 적중 등 프롬프트를 만들지 않았으면 생략)"""
+    if report is None:
+        return
+    logger.info(f"🧮 일지 프롬프트 {report.describe()} | User:{user_id} | Repo:{repo_name} | Date:{date}")
+
 class JournalService:
     def __init__(self, db: AsyncSession, redis: Redis = None):
         self.db = db
@@ -43,17 +96,17 @@ class JournalService:
             repo_result = await self.db.execute(repo_stmt)
             repo = repo_result.scalar_one_or_none()
 
-            if repo:
+            if repo and await commit_service.has_stored_commits(repo.repo_name, date, self.db):
+                # Webhook/이전 조회로 저장된 커밋이 있으면 GitHub 호출 생략
+                has_commits = True
+            elif repo:
                 try:
-                    # 커밋 조회 시도 (에러 발생 시 커밋 없음으로 처리)
-                    await fetch_commits(
+                    # 커밋 존재 여부만 확인 (목록 1건 조회 + 캐시, 에러 발생 시 커밋 없음으로 처리)
+                    has_commits = await probe_commits(
                         repo_name=repo.repo_name,
                         target_date=date,
                         access_token=user.decrypted_access_token
                     )
-                    has_commits = True
-                except GithubNoCommitsError:
-                    has_commits = False
                 except Exception as e:
                     logger.warning(f"커밋 확인 중 에러: {e}")
                     has_commits = False
@@ -69,67 +122,327 @@ class JournalService:
         self,
         user: User,
         date: date_type,
-        overwrite: bool = True
+        overwrite: bool = True,
+        force: bool = False
     ) -> Journal:
         """
         1. 저장소 정보 확인
         2. GitHub 커밋 수집
         3. Gemini AI 분석
         4. DB Upsert (트랜잭션)
+
+        같은 (사용자, 저장소, 날짜, overwrite, force)의 생성이 이미 진행 중이면(다른 워커 포함) 새로 수행하지 않고
+        먼저 시작한 생성이 끝나기를 기다려 그 결과(또는 같은 에러)를 반환합니다.
+        (옵션이 다른 요청은 결과가 달라질 수 있으므로 합치지 않음)
         """
         logger.info("✅ [JournalService] 깃허브 커밋 일지 생성 함수 진입!!")
-        
-        # 1. 선택된 저장소 확인 (Eager Loading 필요)
-        if not user.selected_repo_id:
-             raise ValueError("No repository selected")
-         
-        # User 객체에 repositories가 로드되지 않았을 수 있으므로 DB에서 조회
-        stmt = select(Repository).where(Repository.id == user.selected_repo_id)
+
+        key = f"{user.id}:{user.selected_repo_id}:{date.isoformat()}:overwrite={overwrite}:force={force}"
+        journal = await journal_flight.run(key, lambda: self._create_daily_journal(user, date, overwrite, force))
+        if journal is None:
+            logger.info(f"🔗 진행 중이던 일지 생성 결과 사용: {key}")
+            journal = await self._get_saved_journal(user, date)
+        return journal
+
+    async def _create_daily_journal(
+        self,
+        user: User,
+        date: date_type,
+        overwrite: bool,
+        force: bool
+    ) -> Journal:
         try:
-            result = await self.db.execute(stmt)
-            repo = result.scalar_one_or_none()
-            
-            if not repo:
-                raise ValueError("Repository not found")
+            # 1. 선택된 저장소 확인
+            repo = await self._get_selected_repo(user)
             
-            # 2. 커밋 수집
-            commits = await fetch_commits(
-                repo_name=repo.repo_name,
-                target_date=date,
-                access_token=user.decrypted_access_token
-            )
+            # 2. 커밋 수집 (로컬 커밋 저장소 우선, 빈틈만 GitHub API로 조회)
+            commits = await self._collect_commits(repo.repo_name, date, user.decrypted_access_token)
             
             # 3. AI 분석
-            ai_data = await self.gemini_service.generate_journal(commits, date)
-            
-            # 통계 추출 (GitHub 커밋 데이터에서 계산)
-            stats = self._calculate_stats(commits)
-            logger.info(f"통계 추출: {stats}")
-            journal_data = JournalCreate(
-                user_id=user.id,
-                repository_id=repo.id,
-                date=date,
-                raw_commits=commits,  # 디버깅용 저장
-                **ai_data,            # summary, main_tasks, learned_things
-                **stats               # commit_count, files_changed 등
-            )
+            ai_data, report = await self.gemini_service.generate_journal(commits, date, force=force, user_id=user.id)
+            _log_budget(user.id, repo.repo_name, date, report)
             
             # 4. DB 저장 (Upsert)
-            # upsert 로직 수행 (add, update 등)
-            journal = await self._upsert_journal(journal_data, overwrite)
-            
-            # ✅ 핵심: 모든 작업이 성공적으로 끝나면 여기서 커밋
-            await self.db.commit()
-            
-            # 커밋 후 객체 리프레시 (DB에서 최신 데이터 로드)
-            await self.db.refresh(journal)
-            return journal
+            return await self._save_journal(user, repo, date, commits, ai_data, overwrite)
         
         except Exception as e:
             # 에러 발생 시 롤백하여 데이터 정합성 유지
             await self.db.rollback()
             raise e
-    
+
+    async def stream_daily_journal(
+        self,
+        user: User,
+        date: date_type,
+        overwrite: bool = True,
+        force: bool = False
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        일지 생성 진행 상황 스트리밍 (create_daily_journal과 같은 단계)
+
+        ("progress", 단계) → ("summary", 부분 텍스트) ... → ("journal", JournalResponse) 순서로 내보냅니다.
+        AI 스트림이 중간에 대체 호출로 바뀌면 ("summary_reset", {})로 지금까지의 summary 폐기를 알립니다.
+        """
+        # 첫 이벤트는 즉시 전송 (커밋 수집 전에 연결 확인)
+        yield "progress", {"stage": "started"}
+        try:
+            repo = await self._get_selected_repo(user)
+            commits = await self._collect_commits(repo.repo_name, date, user.decrypted_access_token)
+            yield "progress", {"stage": "commits_fetched", "commit_count": len(commits)}
+
+            yield "progress", {"stage": "ai_started"}
+            ai_data = None
+            async for event, data in self.gemini_service.stream_journal(commits, date, force=force, user_id=user.id):
+                if event == "summary":
+                    yield "summary", {"text": data}
+                elif event == "summary_reset":
+                    yield "summary_reset", {}
+                elif event == "budget":
+                    _log_budget(user.id, repo.repo_name, date, data)
+                else:
+                    ai_data = data
+
+            journal = await self._save_journal(user, repo, date, commits, ai_data, overwrite)
+        except Exception:
+            await self.db.rollback()
+            raise
+        yield "journal", JournalResponse.model_validate(journal)
+
+    async def _get_selected_repo(self, user: User) -> Repository:
+        """선택된 저장소 조회 (User 객체에 repositories가 로드되지 않았을 수 있으므로 DB에서 조회)"""
+        if not user.selected_repo_id:
+            raise ValueError("No repository selected")
+
+        stmt = select(Repository).where(Repository.id == user.selected_repo_id)
+        result = await self.db.execute(stmt)
+        repo = result.scalar_one_or_none()
+        
+        if not repo:
+            raise ValueError("Repository not found")
+        return repo
+
+    async def _get_saved_journal(self, user: User, date: date_type) -> Journal:
+        """다른 요청이 생성한 일지 조회 (이 세션에 남아 있을 수 있는 이전 상태 대신 DB 값 사용)"""
+        stmt = (
+            select(Journal)
+            .where(
+                Journal.user_id == user.id,
+                Journal.repository_id == user.selected_repo_id,
+                Journal.date == date
+            )
+            .execution_options(populate_existing=True)
+        )
+        journal = (await self.db.execute(stmt)).scalar_one_or_none()
+        if journal is None:
+            raise ValueError("Journal not found")
+        return journal
+
+    async def _save_journal(
+        self,
+        user: User,
+        repo: Repository,
+        date: date_type,
+        commits: list[dict],
+        ai_data: dict,
+        overwrite: bool
+    ) -> Journal:
+        """통계 계산 후 일지 Upsert 및 커밋"""
+        journal_data = self._build_journal_data(user, repo, date, commits, ai_data)
+        
+        # upsert 로직 수행 (RETURNING으로 저장된 값을 바로 받음)
+        journal = await self._upsert_journal(journal_data, overwrite)
+        
+        # ✅ 핵심: 모든 작업이 성공적으로 끝나면 여기서 커밋
+        await self.db.commit()
+        return journal
+        
+    def _build_journal_data(
+        self,
+        user: User,
+        repo: Repository,
+        date: date_type,
+        commits: list[dict],
+        ai_data: dict
+    ) -> JournalCreate:
+        # 통계 추출 (GitHub 커밋 데이터에서 계산)
+        stats = self._calculate_stats(commits)
+        logger.info(f"통계 추출: {stats}")
+        return JournalCreate(
+            user_id=user.id,
+            repository_id=repo.id,
+            date=date,
+            raw_commits=commits,  # 디버깅/재생성용 (journal_raw_commits에 압축 저장)
+            **ai_data,            # summary, main_tasks, learned_things
+            **stats               # commit_count, files_changed 등
+        )
+
+    async def backfill_journals(
+        self,
+        user: User,
+        start_date: date_type,
+        end_date: date_type,
+        overwrite: bool = False,
+        concurrency: int | None = None
+    ) -> BackfillReport:
+        """
+        기간 일지 일괄 생성 (백필)
+
+        1. 이미 일지가 있는 날짜는 제외 (overwrite=False) → 중단 후 다시 실행하면 남은 날짜만 처리
+        2. 기간 전체 커밋 목록을 페이지 단위로 한 번에 조회한 뒤 날짜(UTC)별로 분류
+        3. 날짜별 상세 조회(저장된 커밋 우선) + Gemini 생성을 최대 concurrency개 동시에 수행
+        4. 완료된 날짜를 JOURNAL_BACKFILL_BATCH_SIZE 단위로 일괄 Upsert 및 커밋
+        """
+        started = time.perf_counter()
+        if end_date < start_date:
+            raise ValueError("end_date must be on or after start_date")
+        end_date = min(end_date, date_type.today())
+        days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+        if len(days) > settings.JOURNAL_BACKFILL_MAX_DAYS:
+            raise ValueError(f"Backfill range exceeds {settings.JOURNAL_BACKFILL_MAX_DAYS} days")
+
+        repo = await self._get_selected_repo(user)
+        access_token = user.decrypted_access_token
+        report = BackfillReport(start_date=start_date, end_date=end_date, days_total=len(days))
+
+        existing = set()
+        if not overwrite:
+            stmt = select(Journal.date).where(
+                Journal.user_id == user.id,
+                Journal.repository_id == repo.id,
+                Journal.date.between(start_date, end_date)
+            )
+            existing = set((await self.db.execute(stmt)).scalars().all())
+        pending = [day for day in days if day not in existing]
+        report.days_existing = len(days) - len(pending)
+        if not pending:
+            return self._finish_backfill(report, started)
+
+        # 기간 전체 목록 조회 후 날짜별 분류 (목록은 최신순)
+        listed, report.list_calls = await list_commit_range(repo.repo_name, pending[0], pending[-1], access_token)
+        pending_set = set(pending)
+        by_day: dict[date_type, list[dict]] = {}
+        for commit in listed:
+            if not commit.get("committed_at"):
+                continue
+            day = commit_service._parse_utc(commit["committed_at"]).date()
+            if day in pending_set:
+                by_day.setdefault(day, []).append(commit)
+        report.days_without_commits = len(pending) - len(by_day)
+        # 날짜별 요청이었다면 날짜마다 최소 1회 목록 요청이 필요
+        report.calls_saved = len(pending) - report.list_calls
+
+        stored = await commit_service.load_commits_between(repo.repo_name, pending[0], pending[-1], self.db)
+        semaphore = asyncio.Semaphore(concurrency or settings.JOURNAL_BACKFILL_CONCURRENCY)
+
+        async def generate(day: date_type, entries: list[dict]) -> tuple[date_type, list[dict], dict, dict]:
+            # DB 세션은 동시에 사용할 수 없으므로 작업에서는 GitHub/Gemini 호출만 수행
+            async with semaphore:
+                shas = [entry["sha"] for entry in entries]
+                missing = [sha for sha in shas if sha not in stored]
+                details = await fetch_commit_details(repo.repo_name, missing, access_token)
+                fetched_commits = iter(details.commits)
+                fetched = {
+                    sha: {"committed_at": entry["committed_at"], **next(fetched_commits)}
+                    for sha, entry in zip(shas, entries)
+                    if sha in missing and sha not in details.failed_shas
+                }
+                commits = [stored.get(sha) or fetched.get(sha) for sha in shas]
+                commits = [
+                    {k: v for k, v in commit.items() if k != "committed_at"}
+                    for commit in commits if commit
+                ]
+                if not commits:
+                    raise GithubApiError(f"Failed to fetch commit details for {day}", status_code=502)
+                ai_data, budget = await self.gemini_service.generate_journal(commits, day, user_id=user.id)
+                _log_budget(user.id, repo.repo_name, day, budget)
+                return day, commits, ai_data, fetched
+
+        tasks = [asyncio.create_task(generate(day, entries)) for day, entries in sorted(by_day.items())]
+        batch: list[JournalCreate] = []
+        batch_commits: dict[str, dict] = {}
+        try:
+            for task in asyncio.as_completed(tasks):
+                try:
+                    day, commits, ai_data, fetched = await task
+                except (GithubApiError, GeminiServiceError, ValueError) as e:
+                    logger.warning(f"⚠️ 백필 일지 생성 실패: {e}")
+                    report.failed_days += 1
+                    continue
+                batch.append(self._build_journal_data(user, repo, day, commits, ai_data))
+                batch_commits.update(fetched)
+                if len(batch) >= settings.JOURNAL_BACKFILL_BATCH_SIZE:
+                    report.days_generated += await self._write_backfill_batch(repo.repo_name, batch, batch_commits)
+                    batch, batch_commits = [], {}
+            if batch:
+                report.days_generated += await self._write_backfill_batch(repo.repo_name, batch, batch_commits)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return self._finish_backfill(report, started)
+
+    async def _write_backfill_batch(self, repo_name: str, items: list[JournalCreate], commits: dict[str, dict]) -> int:
+        """백필 결과 일괄 저장 (다중 행 Upsert 1회 + 커밋 1회)"""
+        try:
+            if commits:
+                await commit_service.save_commits(repo_name, commits, self.db)
+            # 덮어쓰지 않을 날짜는 호출 전에 제외되므로 항상 DO UPDATE
+            rows = [item.model_dump(exclude={"raw_commits"}) for item in items]
+            stmt = _upsert(self.db, Journal, rows, _JOURNAL_KEYS, overwrite=True).returning(Journal.id, Journal.date)
+            journal_ids = {row.date: row.id for row in await self.db.execute(stmt)}
+            await self._save_raw_commits({journal_ids[item.date]: item.raw_commits for item in items})
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        logger.info(f"💾 백필 일지 저장: {len(items)}건")
+        return len(items)
+
+    def _finish_backfill(self, report: BackfillReport, started: float) -> BackfillReport:
+        report.elapsed_seconds = round(time.perf_counter() - started, 2)
+        if report.elapsed_seconds > 0:
+            report.days_per_minute = round(report.days_generated / report.elapsed_seconds * 60, 1)
+        logger.info(
+            f"📆 백필 완료: {report.start_date} ~ {report.end_date} | 생성 {report.days_generated}, "
+            f"기존 {report.days_existing}, 커밋 없음 {report.days_without_commits}, 실패 {report.failed_days} "
+            f"| 목록 요청 {report.list_calls}회 (절감 {report.calls_saved}회) | {report.days_per_minute} days/min"
+        )
+        return report
+
+    async def _collect_commits(self, repo_name: str, date: date_type, access_token: str) -> list[dict]:
+        """
+        하루치 커밋 수집
+
+        Webhook 수집 이후의 날짜는 DB만 사용하고, 그 외에는 GitHub 목록을 조회해
+        DB에 없는 커밋만 상세 조회한 뒤 결과를 DB에 저장(write-through)합니다.
+        """
+        stored = await commit_service.load_commits(repo_name, date, self.db)
+        if stored and await commit_service.is_webhook_covered(repo_name, date):
+            logger.info(f"⚡ 저장된 커밋 사용: {repo_name} | {len(stored)}건")
+            return list(stored.values())
+
+        fetched: dict[str, dict] = {}
+        commits = await fetch_commits(
+            repo_name=repo_name,
+            target_date=date,
+            access_token=access_token,
+            known=stored,
+            fetched=fetched,
+            # GraphQL 백엔드: 프롬프트에 파일/patch가 들어갈 커밋만 REST 상세 조회
+            detail_budget=settings.GEMINI_INPUT_TOKEN_BUDGET
+        )
+
+        if fetched:
+            try:
+                async with self.db.begin_nested():
+                    added = await commit_service.save_commits(repo_name, fetched, self.db)
+                await self.db.commit()
+                logger.info(f"💾 커밋 저장: {repo_name} | {added}건")
+            except (SQLAlchemyError, ValueError) as e:
+                # 저장 실패(동시 저장 등)는 일지 생성에 영향을 주지 않음 (savepoint만 롤백)
+                logger.warning(f"커밋 저장 실패: {e}")
+        return commits
+
     def _calculate_stats(self, commits: list[dict]) -> dict:
         """커밋 리스트에서 통계 정보 추출 (Optimized Structure 대응)"""
         files_changed = 0
@@ -138,10 +451,15 @@ class JournalService:
         
         for commit in commits:
             files = commit.get("files", [])
-            files_changed += len(files)
-            for f in files:
-                lines_added += f.get("additions", 0)
-                lines_deleted += f.get("deletions", 0)
+            # 커밋 단위 통계가 있으면 우선 사용 (제외된 파일까지 포함된 정확한 값)
+            files_changed += commit.get("changed_files", len(files))
+            if "additions" in commit:
+                lines_added += commit.get("additions", 0)
+                lines_deleted += commit.get("deletions", 0)
+            else:
+                for f in files:
+                    lines_added += f.get("additions", 0)
+                    lines_deleted += f.get("deletions", 0)
                 
         return {
             "commit_count": len(commits),
@@ -151,37 +469,53 @@ class JournalService:
         }
         
     async def _upsert_journal(self, data: JournalCreate, overwrite: bool) -> Journal:
+        """
+        일지 Upsert (단일 INSERT ... ON CONFLICT ... RETURNING, 조회/refresh 왕복 없음)
+
+        overwrite=False면 DO NOTHING으로 처리하고, 이미 있는 일지면 ValueError를 발생시킵니다.
+        """
         logger.info("[JournalService] 일지 생성 및 덮어씌기 commit함수 진입")
-        
-        # 기존 일지 조회
-        stmt = select(Journal).where(
-            Journal.user_id == data.user_id,
-            Journal.repository_id == data.repository_id,
-            Journal.date == data.date
-        )
+
+        row = data.model_dump(exclude={"raw_commits"})
+        stmt = _upsert(self.db, Journal, [row], _JOURNAL_KEYS, overwrite).returning(Journal)
         try:
-            result = await self.db.execute(stmt)
-            existing = result.scalar_one_or_none()
-            
-            if existing:
-                if not overwrite:
-                    raise ValueError("Journal already exists")
-                
-                # 업데이트
-                for key, value in data.model_dump().items():
-                    setattr(existing, key, value)
-                    
-                return existing
-                
-            # 신규 생성
-            new_journal = Journal(**data.model_dump())
-            self.db.add(new_journal)
-            return new_journal
-        
+            # 같은 세션에 이전 상태의 객체가 있어도 RETURNING 값으로 갱신
+            result = await self.db.execute(stmt, execution_options={"populate_existing": True})
+            journal = result.scalar_one_or_none()
+            if journal is None:
+                raise ValueError("Journal already exists")
+            await self._save_raw_commits({journal.id: data.raw_commits})
+            return journal
+
         except Exception as e:
             await self.db.rollback()
             raise e
     
+    async def _save_raw_commits(self, raw_commits: dict[UUID, list[dict] | None]):
+        """원본 커밋을 압축해 별도 테이블에 Upsert (커밋은 호출자가 수행)"""
+        rows = []
+        for journal_id, commits in raw_commits.items():
+            if commits is None:
+                continue
+            data, original_size = compress_json(commits)
+            rows.append({"journal_id": journal_id, "codec": DEFAULT_CODEC, "data": data, "original_size": original_size})
+        if rows:
+            await self.db.execute(_upsert(self.db, JournalRawCommits, rows, ["journal_id"], overwrite=True))
+
+    async def get_raw_commits(self, user_id: UUID, journal_id: UUID) -> list[dict] | None:
+        """
+        일지 생성에 사용한 원본 커밋 조회 (디버깅/재생성용)
+
+        목록/상세/통계 조회는 이 테이블을 읽지 않으며, 이 메서드로 요청할 때만 압축을 풀어 로드합니다.
+        """
+        stmt = (
+            select(JournalRawCommits.codec, JournalRawCommits.data)
+            .join(Journal, Journal.id == JournalRawCommits.journal_id)
+            .where(Journal.id == journal_id, Journal.user_id == user_id)
+        )
+        row = (await self.db.execute(stmt)).one_or_none()
+        return decompress_json(row.data, row.codec) if row else None
+
     async def get_journals(
         self,
         user_id: UUID,
@@ -190,9 +524,20 @@ class JournalService:
         size: int = 10,
         start_date: date_type | None = None,
         end_date: date_type | None = None,
-    ) -> tuple[list[Journal], int]:
+        fields: list[str] | None = None,
+    ) -> tuple[list[JournalListItem], int]:
+        """
+        일지 목록 조회 (페이지네이션)
+
+        엔티티 대신 응답에 필요한 컬럼만 조회해 JournalListItem으로 바로 변환합니다.
+        fields를 주면 해당 필드(+ id)만 조회하며, 알 수 없는 필드는 ValueError를 발생시킵니다.
+        """
+        fields = list(JOURNAL_LIST_FIELDS) if not fields else ["id", *(f for f in dict.fromkeys(fields) if f != "id")]
+        unknown = [f for f in fields if f not in JOURNAL_LIST_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
         try:
-            """일지 목록 조회 (페이지네이션)"""
             conditions = [Journal.user_id == user_id]
             # 날짜 필터링
             if start_date:
@@ -207,15 +552,15 @@ class JournalService:
             total = (await self.db.execute(count_stmt)).scalar() or 0
             
             stmt = (
-                select(Journal)
-                .options(joinedload(Journal.repository)) # N+1방지
+                select(*(getattr(Journal, f) for f in fields))
                 .where(*conditions)
                 .order_by(Journal.date.desc())
                 .offset((page-1) * size)
                 .limit(size)
             )
             result = await self.db.execute(stmt)
-            items = result.scalars().all()
+            # DB 값은 이미 타입이 맞으므로 검증 없이 생성 (설정한 필드만 fields_set에 포함)
+            items = [JournalListItem.model_construct(**row) for row in result.mappings()]
             
             return items, total
         
@@ -0,0 +1,226 @@
+import json
+import math
+import re
+from dataclasses import dataclass, fields
+
+# 커밋 메시지는 앞부분에 핵심이 있으므로 길면 잘라서 사용
+MAX_MESSAGE_CHARS = 500
+
+# 커밋 헤더(메시지)가 1차로 사용할 수 있는 예산 비율 (나머지는 파일/patch용)
+HEADER_BUDGET_RATIO = 0.5
+
+# Conventional Commits 타입별 가중치 (분석 가치가 높은 작업 우선)
+_MESSAGE_WEIGHTS = {
+    "feat": 3.0, "fix": 2.5, "perf": 2.5, "refactor": 2.0, "test": 1.0,
+    "docs": 0.5, "chore": 0.5, "style": 0.5, "ci": 0.5, "build": 0.5,
+}
+_TYPE_PATTERN = re.compile(r"^(\w+)(\(.+?\))?!?:")
+
+# 설정/문서 파일은 코드보다 낮은 우선순위
+_LOW_SIGNAL_SUFFIXES = (".md", ".txt", ".rst", ".json", ".yml", ".yaml", ".toml", ".ini", ".cfg", ".csv")
+
+# 프롬프트 예산 지표 (누적)
+_budget_stats = {"prompts": 0, "trimmed_prompts": 0, "kept_tokens": 0, "dropped_tokens": 0}
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정 (tokenizer 호출 없이)
+
+    영문/코드는 약 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 약 1토큰으로 계산합니다.
+    (비ASCII 글자 수는 문자 단위 순회 대신 C 구현 인코딩으로 계산)
+    """
+    if text.isascii():
+        return math.ceil(len(text) / 4)
+    non_ascii = len(text) - len(text.encode("ascii", "ignore"))
+    return math.ceil((len(text) - non_ascii) / 4 + non_ascii)
+
+def estimate_json_tokens(value) -> int:
+    """프롬프트에 들어갈 JSON 직렬화 기준 토큰 수 추정"""
+    return estimate_tokens(json.dumps(value, ensure_ascii=False))
+
+def commit_score(commit: dict) -> float:
+    """커밋 우선순위 점수 (메시지 유형 × 변경량)"""
+    message = commit.get("message", "")
+    if message.startswith("Merge "):
+        weight = 0.2
+    else:
+        match = _TYPE_PATTERN.match(message)
+        weight = _MESSAGE_WEIGHTS.get(match.group(1).lower(), 1.5) if match else 1.5
+    churn = commit.get("additions", 0) + commit.get("deletions", 0)
+    return weight * (1 + math.log1p(churn))
+
+def file_score(f: dict) -> float:
+    """파일 우선순위 점수 (파일 유형 × 변경량)"""
+    filename = f["filename"].lower()
+    if filename.endswith(_LOW_SIGNAL_SUFFIXES):
+        weight = 0.5
+    elif "test" in filename:
+        weight = 0.8
+    else:
+        weight = 1.0
+    return weight * (1 + math.log1p(f.get("additions", 0) + f.get("deletions", 0)))
+
+@dataclass
+class BudgetReport:
+    """프롬프트 예산 적용 결과"""
+    budget: int
+    total_tokens: int       # 예산 적용 전 (전체 커밋 JSON 기준)
+    kept_tokens: int
+    commits_total: int
+    commits_kept: int
+    files_dropped: int = 0
+    patches_dropped: int = 0
+
+    @property
+    def dropped_tokens(self) -> int:
+        return max(self.total_tokens - self.kept_tokens, 0)
+
+    @property
+    def trimmed(self) -> bool:
+        return self.commits_kept < self.commits_total or self.files_dropped > 0 or self.patches_dropped > 0
+
+    @classmethod
+    def combine(cls, reports: list["BudgetReport"]) -> "BudgetReport":
+        """여러 프롬프트(map 청크)의 결과를 일지 1건 기준으로 합산"""
+        return cls(**{f.name: sum(getattr(report, f.name) for report in reports) for f in fields(cls)})
+
+    def describe(self) -> str:
+        return (
+            f"예산 {self.budget} | 유지 {self.kept_tokens} / 제외 {self.dropped_tokens} 토큰 "
+            f"| 커밋 {self.commits_kept}/{self.commits_total}, 제외 파일 {self.files_dropped}, "
+            f"제외 patch {self.patches_dropped}"
+        )
+
+def _header(commit: dict) -> dict:
+    return {
+        "message": commit.get("message", "")[:MAX_MESSAGE_CHARS],
+        "additions": commit.get("additions", 0),
+        "deletions": commit.get("deletions", 0),
+        "changed_files": commit.get("changed_files", len(commit.get("files", []))),
+        "files": [],
+    }
+
+def _select_headers(
+    commits: list[dict],
+    scores: list[float],
+    budget: int
+) -> tuple[dict[int, dict], list[tuple[int, dict, int]], int]:
+    """커밋 헤더를 점수순으로 예산의 HEADER_BUDGET_RATIO까지 선택 (유지, 밀린 헤더, 남은 예산)"""
+    remaining = budget
+    kept: dict[int, dict] = {}
+    deferred: list[tuple[int, dict, int]] = []
+    header_limit = budget * HEADER_BUDGET_RATIO
+    for i in sorted(range(len(commits)), key=lambda i: -scores[i]):
+        header = _header(commits[i])
+        cost = estimate_json_tokens(header)
+        if budget - remaining + cost > header_limit:
+            deferred.append((i, header, cost))
+            continue
+        remaining -= cost
+        kept[i] = header
+    return kept, deferred, remaining
+
+def detail_candidates(commits: list[dict], budget: int) -> set[int]:
+    """
+    파일/patch를 받을 수 있는 커밋 인덱스
+
+    fit_commits는 1단계에서 헤더가 유지된 커밋에만 파일 목록/patch를 넣으므로,
+    나머지 커밋은 상세 정보(파일, patch)를 조회해도 프롬프트에 쓰이지 않습니다.
+    """
+    scores = [commit_score(commit) for commit in commits]
+    kept, _, _ = _select_headers(commits, scores, budget)
+    return set(kept)
+
+def fit_commits(commits: list[dict], budget: int) -> tuple[list[dict], BudgetReport]:
+    """
+    입력 토큰 예산 안에서 커밋을 채움
+
+    1. 커밋 헤더(메시지, 변경량): 커밋 점수순, 예산의 HEADER_BUDGET_RATIO까지
+    2. 파일 목록(파일명, 변경량): 커밋 점수 + 파일 점수순
+    3. patch: 같은 순서로 남은 예산만큼
+    4. 1단계에서 밀린 커밋 헤더: 남은 예산만큼
+
+    결과는 원래 커밋 순서를 유지하며, 예산을 넘는 항목은 제외됩니다.
+    """
+    report = BudgetReport(
+        budget=budget,
+        total_tokens=estimate_json_tokens(commits),
+        kept_tokens=0,
+        commits_total=len(commits),
+        commits_kept=0,
+    )
+    scores = [commit_score(commit) for commit in commits]
+    kept, deferred, remaining = _select_headers(commits, scores, budget)
+
+    ranked_files = sorted(
+        (
+            (scores[i] + file_score(f), i, f)
+            for i in kept
+            for f in commits[i].get("files", [])
+        ),
+        key=lambda item: -item[0]
+    )
+    included: list[tuple[dict, dict]] = []
+    for _, i, f in ranked_files:
+        entry = {k: f[k] for k in ("filename", "status", "additions", "deletions") if k in f}
+        cost = estimate_json_tokens(entry)
+        if cost > remaining:
+            report.files_dropped += 1
+            continue
+        remaining -= cost
+        kept[i]["files"].append(entry)
+        included.append((entry, f))
+
+    for entry, f in included:
+        patch = f.get("patch")
+        if not patch:
+            continue
+        cost = estimate_json_tokens(patch)
+        if cost > remaining:
+            report.patches_dropped += 1
+            continue
+        remaining -= cost
+        entry["patch"] = patch
+
+    for i, header, cost in deferred:
+        # 밀린 커밋은 메시지/변경량만 포함 (파일 목록 제외)
+        if cost > remaining:
+            report.files_dropped += len(commits[i].get("files", []))
+            continue
+        remaining -= cost
+        kept[i] = header
+        report.files_dropped += len(commits[i].get("files", []))
+
+    report.commits_kept = len(kept)
+    report.kept_tokens = budget - remaining
+    return [kept[i] for i in sorted(kept)], report
+
+def chunk_commits(commits: list[dict], chunk_budget: int) -> list[list[dict]]:
+    """
+    커밋을 시간 순서를 유지한 채 토큰 예산 단위의 청크로 분할 (map-reduce용)
+
+    단일 커밋이 예산을 넘으면 단독 청크가 되며, 프롬프트 생성 시 fit_commits로 잘립니다.
+    """
+    chunks: list[list[dict]] = []
+    current: list[dict] = []
+    used = 0
+    for commit in commits:
+        cost = estimate_json_tokens(commit)
+        if current and used + cost > chunk_budget:
+            chunks.append(current)
+            current, used = [], 0
+        current.append(commit)
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+def record_report(report: BudgetReport):
+    """프롬프트 예산 지표 누적"""
+    _budget_stats["prompts"] += 1
+    _budget_stats["trimmed_prompts"] += report.trimmed
+    _budget_stats["kept_tokens"] += report.kept_tokens
+    _budget_stats["dropped_tokens"] += report.dropped_tokens
+
+def get_prompt_stats() -> dict:
+    return dict(_budget_stats)
@@ -0,0 +1,233 @@
+import asyncio
+import json
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+from loguru import logger
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_shared_redis
+from app.schemas.repository import IndexedRepo, RepositorySearchResponse
+from app.services.github_service import GithubApiError, get_all_repositories
+from app.services.repository_service import get_selected_repo_name
+
+# 사용자별 전체 저장소 인덱스 (JSON: built_at + 정렬/필터용 필드만 남긴 목록)
+REPO_INDEX_KEY = "repos:index:{user_id}"
+BUILD_LOCK_SECONDS = 120
+
+# 이름 토큰 분리 (owner/repo-name_v2.js → owner, repo, name, v2, js)
+_TOKEN_SPLIT = re.compile(r"[\s/\-_.]+")
+
+# 백그라운드 생성 태스크 참조 유지 (완료 전 GC 방지)
+_build_tasks: dict[UUID, asyncio.Task] = {}
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+@dataclass
+class RepoIndex:
+    """검색용 인메모리 인덱스 (Redis에서 읽은 목록 + 트라이그램/토큰 역색인)"""
+    built_at: float
+    repos: list[dict]
+    texts: list[str] = field(default_factory=list)
+    trigrams: dict[str, set[int]] = field(default_factory=dict)
+    tokens: list[list[str]] = field(default_factory=list)
+
+    def __post_init__(self):
+        for i, repo in enumerate(self.repos):
+            name = repo["full_name"].lower()
+            text = f"{name} {(repo.get('description') or '').lower()}"
+            self.texts.append(text)
+            self.tokens.append([token for token in _TOKEN_SPLIT.split(name) if token])
+            for gram in _trigrams(text):
+                self.trigrams.setdefault(gram, set()).add(i)
+
+    def match(self, query: str) -> list[tuple[int, int]]:
+        """
+        (저장소 위치, 점수) 목록
+
+        3글자 이상은 트라이그램 후보를 좁힌 뒤 부분 문자열로 확인하고,
+        그보다 짧으면 이름 토큰 접두어로 매칭합니다.
+        """
+        query = query.lower()
+        if len(query) >= 3:
+            grams = sorted(_trigrams(query), key=lambda g: len(self.trigrams.get(g, ())))
+            candidates = set(self.trigrams.get(grams[0], ()))
+            for gram in grams[1:]:
+                candidates &= self.trigrams.get(gram, set())
+                if not candidates:
+                    break
+            candidates = {i for i in candidates if query in self.texts[i]}
+        else:
+            candidates = set(range(len(self.repos)))
+
+        results = []
+        for i in candidates:
+            name = self.repos[i]["name"].lower()
+            if name.startswith(query):
+                score = 3
+            elif any(token.startswith(query) for token in self.tokens[i]):
+                score = 2
+            elif len(query) >= 3:
+                score = 1  # 설명 등에서 부분 일치
+            else:
+                continue
+            results.append((i, score))
+        return results
+
+# 프로세스 로컬 인덱스 캐시 (역색인 재구성 비용 절감)
+_local: OrderedDict[UUID, RepoIndex] = OrderedDict()
+
+def _remember(user_id: UUID, index: RepoIndex):
+    _local[user_id] = index
+    _local.move_to_end(user_id)
+    while len(_local) > settings.REPO_INDEX_LOCAL_MAX_USERS:
+        _local.popitem(last=False)
+
+def _compact(repo: dict) -> dict:
+    """인덱스에 필요한 필드만 추출"""
+    return {
+        "id": repo["id"],
+        "name": repo["name"],
+        "full_name": repo["full_name"],
+        "html_url": repo["html_url"],
+        "description": repo["description"],
+        "private": repo["private"],
+        "language": repo.get("language"),
+        "stargazers_count": repo.get("stargazers_count", 0),
+        "updated_at": repo.get("updated_at"),
+    }
+
+async def build_repo_index(user_id: UUID, access_token: str) -> RepoIndex:
+    """GitHub 전체 저장소를 조회해 인덱스 생성 및 저장"""
+    started = time.perf_counter()
+    repos = [_compact(repo) for repo in await get_all_repositories(access_token)]
+    index = RepoIndex(built_at=time.time(), repos=repos)
+    _remember(user_id, index)
+
+    redis = get_shared_redis()
+    if redis:
+        try:
+            await redis.set(
+                REPO_INDEX_KEY.format(user_id=user_id),
+                json.dumps({"built_at": index.built_at, "repos": repos}),
+                ex=settings.REPO_INDEX_HARD_TTL_SECONDS
+            )
+        except RedisError as e:
+            logger.warning(f"Redis set error (repo index): {e}")
+
+    logger.info(f"📚 저장소 인덱스 생성: {len(repos)}개 | {(time.perf_counter() - started) * 1000:.0f}ms")
+    return index
+
+async def _build_in_background(user_id: UUID, access_token: str):
+    redis = get_shared_redis()
+    lock_key = f"{REPO_INDEX_KEY.format(user_id=user_id)}:lock"
+    token = uuid4().hex
+    locked = False
+    try:
+        if redis:
+            # 다른 워커가 생성 중이면 생략
+            locked = await redis.set(lock_key, token, nx=True, ex=BUILD_LOCK_SECONDS)
+            if not locked:
+                return
+        await build_repo_index(user_id, access_token)
+    except (GithubApiError, RedisError) as e:
+        logger.warning(f"⚠️ 저장소 인덱스 생성 실패: {e}")
+    finally:
+        if locked:
+            try:
+                # 직접 잡은 락만 해제 (생략한 경우나 만료 후 다른 워커가 잡은 락은 유지)
+                if await redis.get(lock_key) == token:
+                    await redis.delete(lock_key)
+            except RedisError as e:
+                logger.warning(f"Redis delete error (repo index): {e}")
+
+def schedule_index_build(user_id: UUID, access_token: str):
+    """인덱스 백그라운드 생성 (이미 진행 중이면 생략)"""
+    task = _build_tasks.get(user_id)
+    if task and not task.done():
+        return
+    task = asyncio.create_task(_build_in_background(user_id, access_token))
+    _build_tasks[user_id] = task
+    task.add_done_callback(lambda _: _build_tasks.pop(user_id, None))
+
+async def _load_index(user_id: UUID) -> RepoIndex | None:
+    """
+    로컬 캐시 → Redis 순으로 인덱스 조회 (hard TTL 경과분은 무시)
+
+    로컬 사본이 soft TTL을 지났으면 Redis를 다시 읽어, 다른 워커가 새로 만든 인덱스가 있으면 그것을 사용합니다.
+    """
+    index = _local.get(user_id)
+    redis = get_shared_redis()
+    if redis and (index is None or time.time() - index.built_at > settings.REPO_INDEX_SOFT_TTL_SECONDS):
+        try:
+            cached = await redis.get(REPO_INDEX_KEY.format(user_id=user_id))
+        except RedisError as e:
+            logger.warning(f"Redis get error (repo index): {e}")
+            cached = None
+        if cached:
+            data = json.loads(cached)
+            if index is None or data["built_at"] > index.built_at:
+                index = RepoIndex(built_at=data["built_at"], repos=data["repos"])
+                _remember(user_id, index)
+
+    if index and time.time() - index.built_at > settings.REPO_INDEX_HARD_TTL_SECONDS:
+        return None
+    return index
+
+async def search_repositories(
+    user_id: UUID,
+    access_token: str,
+    db: AsyncSession,
+    query: str = "",
+    private: bool | None = None,
+    language: str | None = None,
+    sort: str = "relevance",
+    page: int = 1,
+    size: int = 20
+) -> RepositorySearchResponse:
+    """
+    전체 저장소 인덱스 검색/필터/정렬
+
+    인덱스가 없으면 백그라운드 생성을 시작하고 status="building"을 반환합니다.
+    soft TTL이 지난 인덱스는 그대로 사용하면서 백그라운드에서 다시 생성합니다.
+    """
+    index = await _load_index(user_id)
+    if index is None:
+        schedule_index_build(user_id, access_token)
+        return RepositorySearchResponse(status="building", total=0, items=[])
+    if time.time() - index.built_at > settings.REPO_INDEX_SOFT_TTL_SECONDS:
+        schedule_index_build(user_id, access_token)
+
+    query = query.strip()
+    matches = index.match(query) if query else [(i, 0) for i in range(len(index.repos))]
+
+    repos = index.repos
+    if private is not None:
+        matches = [(i, score) for i, score in matches if repos[i]["private"] == private]
+    if language:
+        language = language.lower()
+        matches = [(i, score) for i, score in matches if (repos[i]["language"] or "").lower() == language]
+
+    # 인덱스는 최근 업데이트순으로 저장되어 있으므로 위치(i)가 곧 updated 순서
+    if sort == "name":
+        matches.sort(key=lambda m: repos[m[0]]["full_name"].lower())
+    elif sort == "stars":
+        matches.sort(key=lambda m: (-repos[m[0]]["stargazers_count"], m[0]))
+    elif sort == "updated":
+        matches.sort(key=lambda m: m[0])
+    else:
+        matches.sort(key=lambda m: (-m[1], m[0]))
+
+    selected = await get_selected_repo_name(user_id, db)
+    offset = (page - 1) * size
+    items = [
+        IndexedRepo(**repos[i], is_selected=repos[i]["full_name"] == selected)
+        for i, _ in matches[offset:offset + size]
+    ]
+    return RepositorySearchResponse(status="ready", total=len(matches), items=items)
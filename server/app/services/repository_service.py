@@ -1,44 +1,175 @@
-from uuid import UUID
+import asyncio
+import json
+import time
+from uuid import UUID, uuid4
+from loguru import logger
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
+from app.core.config import settings
+from app.core.redis import get_shared_redis
 from app.models import User, Repository
 from app.schemas.repository import GithubRepo
+from app.services.github_service import GithubApiError, get_repositories as fetch_github_repos
 
-async def get_merged_repositories(
-    user_id: UUID, 
-    github_repos: list[dict], 
-    db: AsyncSession
-) -> list[GithubRepo]:
-    """GitHub API 결과와 DB의 선택 상태를 병합하여 반환"""
-    
-    # 1. DB에서 현재 선택된 저장소 조회
-    stmt = select(Repository).where(
+# 사용자별 저장소 목록 캐시 (Hash: "page:{page}:{per_page}" → 목록, "selected" → 선택된 저장소명)
+REPO_CACHE_KEY = "repos:{user_id}"
+SELECTED_FIELD = "selected"
+REFRESH_LOCK_SECONDS = 60
+
+# 백그라운드 갱신 태스크 참조 유지 (완료 전 GC 방지)
+_refresh_tasks: set[asyncio.Task] = set()
+
+def _compact(repo: dict) -> dict:
+    """GitHub 응답에서 선택 목록에 필요한 필드만 추출"""
+    return {
+        "id": repo["id"],
+        "name": repo["name"],
+        "full_name": repo["full_name"],
+        "html_url": repo["html_url"],
+        "description": repo["description"],
+        "private": repo["private"],
+    }
+
+async def _fetch_page(user_id: UUID, access_token: str, page: int, per_page: int) -> list[dict]:
+    """GitHub에서 목록을 조회하고 캐시에 저장"""
+    repos = [_compact(repo) for repo in await fetch_github_repos(access_token, page, per_page)]
+
+    redis = get_shared_redis()
+    if redis:
+        key = REPO_CACHE_KEY.format(user_id=user_id)
+        entry = json.dumps({"fetched_at": time.time(), "repos": repos})
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, f"page:{page}:{per_page}", entry)
+                pipe.expire(key, settings.REPO_CACHE_HARD_TTL_SECONDS)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Redis set error (repo cache): {e}")
+    return repos
+
+async def _refresh_page(user_id: UUID, access_token: str, page: int, per_page: int):
+    """
+    soft TTL이 지난 페이지 백그라운드 갱신
+
+    워커 간 중복 갱신은 락으로 방지하고, 갱신이 끝나면 락을 바로 풀어 다음 soft TTL 경과 시 다시 갱신되도록 합니다.
+    """
+    redis = get_shared_redis()
+    lock_key = f"{REPO_CACHE_KEY.format(user_id=user_id)}:refresh:{page}:{per_page}"
+    token = uuid4().hex
+    locked = False
+    try:
+        if redis:
+            locked = await redis.set(lock_key, token, nx=True, ex=REFRESH_LOCK_SECONDS)
+            if not locked:
+                return
+        await _fetch_page(user_id, access_token, page, per_page)
+    except (GithubApiError, RedisError) as e:
+        logger.warning(f"⚠️ 저장소 목록 백그라운드 갱신 실패: {e}")
+    finally:
+        if locked:
+            try:
+                # 락 만료 후 다른 워커가 잡은 락은 지우지 않음
+                if await redis.get(lock_key) == token:
+                    await redis.delete(lock_key)
+            except RedisError as e:
+                logger.warning(f"Redis delete error (repo cache): {e}")
+
+def _schedule_refresh(user_id: UUID, access_token: str, page: int, per_page: int):
+    task = asyncio.create_task(_refresh_page(user_id, access_token, page, per_page))
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+async def _get_selected_repo_name(user_id: UUID, db: AsyncSession) -> str | None:
+    """DB에서 현재 선택된 저장소명 조회"""
+    stmt = select(Repository.repo_name).where(
         Repository.user_id == user_id,
         Repository.is_selected
     )
     result = await db.execute(stmt)
-    selected_repo = result.scalar_one_or_none()
-    
-    # 2. 병합 로직
-    response_data = []
-    
-    for repo in github_repos:
-        is_selected = False
-        
-        if selected_repo and repo["full_name"] == selected_repo.repo_name:
-            is_selected = True
-            
-        response_data.append(GithubRepo(
-            id=repo["id"],
-            name=repo["name"],
-            full_name=repo["full_name"],
-            html_url=repo["html_url"],
-            description=repo["description"],
-            private=repo["private"],
-            is_selected=is_selected
-        ))
-        
-    return response_data
+    return result.scalar_one_or_none()
+
+async def get_repositories(
+    user_id: UUID,
+    access_token: str,
+    page: int,
+    per_page: int,
+    db: AsyncSession
+) -> list[GithubRepo]:
+    """
+    선택 상태가 병합된 GitHub 저장소 목록 (Stale-While-Revalidate)
+
+    - 캐시 적중: 즉시 반환, soft TTL이 지났으면 백그라운드에서 갱신
+    - 캐시 미스(또는 hard TTL 경과): GitHub 조회 후 저장
+    - 선택된 저장소명도 같은 Hash에 캐시하여 조회마다 DB를 타지 않음
+    """
+    redis = get_shared_redis()
+    key = REPO_CACHE_KEY.format(user_id=user_id)
+    cached_page, selected = None, None
+    if redis:
+        try:
+            cached_page, selected = await redis.hmget(key, f"page:{page}:{per_page}", SELECTED_FIELD)
+        except RedisError as e:
+            logger.warning(f"Redis get error (repo cache): {e}")
+
+    entry = json.loads(cached_page) if cached_page else None
+    age = time.time() - entry["fetched_at"] if entry else None
+
+    if entry is None or age > settings.REPO_CACHE_HARD_TTL_SECONDS:
+        repos = await _fetch_page(user_id, access_token, page, per_page)
+    else:
+        repos = entry["repos"]
+        if age > settings.REPO_CACHE_SOFT_TTL_SECONDS:
+            _schedule_refresh(user_id, access_token, page, per_page)
+
+    if selected is None:
+        selected = await _cache_selected_repo_name(user_id, db)
+
+    return merge_selection(repos, selected or None)
+
+async def _cache_selected_repo_name(user_id: UUID, db: AsyncSession) -> str:
+    """DB에서 선택된 저장소명을 조회해 캐시 (없으면 빈 문자열)"""
+    selected = await _get_selected_repo_name(user_id, db) or ""
+    redis = get_shared_redis()
+    if redis:
+        key = REPO_CACHE_KEY.format(user_id=user_id)
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.hset(key, SELECTED_FIELD, selected)
+                pipe.expire(key, settings.REPO_CACHE_HARD_TTL_SECONDS)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Redis set error (repo cache): {e}")
+    return selected
+
+async def get_selected_repo_name(user_id: UUID, db: AsyncSession) -> str | None:
+    """선택된 저장소명 (캐시 우선)"""
+    redis = get_shared_redis()
+    selected = None
+    if redis:
+        try:
+            selected = await redis.hget(REPO_CACHE_KEY.format(user_id=user_id), SELECTED_FIELD)
+        except RedisError as e:
+            logger.warning(f"Redis get error (repo cache): {e}")
+    if selected is None:
+        selected = await _cache_selected_repo_name(user_id, db)
+    return selected or None
+
+def merge_selection(github_repos: list[dict], selected_repo_name: str | None) -> list[GithubRepo]:
+    """GitHub 목록과 선택 상태를 병합하여 반환"""
+    return [
+        GithubRepo(**repo, is_selected=repo["full_name"] == selected_repo_name)
+        for repo in github_repos
+    ]
+
+async def invalidate_repository_cache(user_id: UUID):
+    """사용자 저장소 목록 캐시 무효화 (저장소 선택 변경 시)"""
+    redis = get_shared_redis()
+    if redis:
+        try:
+            await redis.delete(REPO_CACHE_KEY.format(user_id=user_id))
+        except RedisError as e:
+            logger.warning(f"Redis delete error (repo cache): {e}")
 
 async def select_repository(
     user_id: UUID,
@@ -89,6 +220,7 @@ async def select_repository(
         
         await db.commit()
         await db.refresh(repo)
+        await invalidate_repository_cache(user_id)
         return repo
 
     except Exception as e:
@@ -0,0 +1,195 @@
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+from uuid import uuid4
+
+from loguru import logger
+from redis.exceptions import RedisError
+
+from app.core.redis import get_shared_redis
+from app.services.gemini_service import GeminiServiceError
+from app.services.github_service import GithubApiError
+
+T = TypeVar("T")
+
+# 다른 워커의 결과 대기 중 락 상태 확인 주기
+POLL_SECONDS = 0.5
+# 결과 메시지를 놓친 대기자를 위한 결과 보관 시간
+RESULT_TTL_SECONDS = 30
+
+def _encode_error(error: Exception) -> dict:
+    """다른 워커에 전달할 에러 정보 (같은 HTTP 응답으로 이어지도록 유형/상태 코드/Retry-After 유지)"""
+    if isinstance(error, (GithubApiError, GeminiServiceError)):
+        return {
+            "ok": False,
+            "kind": "github" if isinstance(error, GithubApiError) else "gemini",
+            "message": error.message,
+            "status_code": error.status_code,
+            "retry_after": getattr(error, "retry_after", None),
+        }
+    if isinstance(error, ValueError):
+        return {"ok": False, "kind": "value", "message": str(error)}
+    return {"ok": False, "kind": "other", "message": str(error) or type(error).__name__}
+
+def _raise_shared(payload: dict):
+    kind = payload.get("kind")
+    if kind in ("github", "gemini"):
+        error_class = GithubApiError if kind == "github" else GeminiServiceError
+        error = error_class(payload["message"], payload["status_code"])
+        if payload.get("retry_after") is not None:
+            error.retry_after = payload["retry_after"]
+        raise error
+    if kind == "value":
+        raise ValueError(payload["message"])
+    raise RuntimeError(payload["message"])
+
+class SingleFlight:
+    """
+    같은 키의 동시 작업을 한 번만 수행 (single-flight)
+
+    - 프로세스 내: 먼저 시작한 작업의 Future를 공유
+    - 워커 간: Redis 락(SET NX)을 잡은 워커만 수행하고, 완료 시 결과 채널(Pub/Sub)과
+      결과 키로 완료/실패를 알림. 대기하던 워커는 같은 에러를 다시 발생시키거나 완료만 전달받음
+      (결과에는 락 토큰을 담아, 결과 키에 남은 이전 수행의 결과는 대기자가 무시)
+
+    run()은 직접 수행한 경우 작업 결과를, 다른 작업의 완료를 기다린 경우 None을 반환합니다.
+    (결과 객체는 세션/프로세스에 묶일 수 있으므로 대기자는 완료 후 직접 다시 조회)
+    """
+    def __init__(self, namespace: str, lock_seconds: int):
+        self.namespace = namespace
+        self.lock_seconds = lock_seconds
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._stats = {"leaders": 0, "local_waits": 0, "remote_waits": 0, "remote_timeouts": 0}
+
+    def _keys(self, key: str) -> tuple[str, str, str]:
+        base = f"{self.namespace}:flight:{key}"
+        return f"{base}:lock", f"{base}:result", f"{base}:channel"
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T | None:
+        future = self._inflight.get(key)
+        if future is not None:
+            self._stats["local_waits"] += 1
+            await asyncio.shield(future)
+            return None
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._run_distributed(key, fn)
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없어도 "exception was never retrieved" 경고가 나지 않도록 확인 처리
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(None)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _run_distributed(self, key: str, fn: Callable[[], Awaitable[T]]) -> T | None:
+        redis = get_shared_redis()
+        if redis is None:
+            self._stats["leaders"] += 1
+            return await fn()
+
+        lock_key, result_key, channel = self._keys(key)
+        token = uuid4().hex
+        while True:
+            try:
+                acquired = await redis.set(lock_key, token, nx=True, ex=self.lock_seconds)
+            except RedisError as e:
+                logger.warning(f"Redis lock error (single-flight): {e}")
+                self._stats["leaders"] += 1
+                return await fn()
+            if acquired:
+                break
+            payload = await self._wait_remote(redis, lock_key, result_key, channel)
+            if payload is not None:
+                if not payload["ok"]:
+                    _raise_shared(payload)
+                return None
+            # 수행하던 워커가 결과 없이 사라짐 → 직접 수행 시도
+
+        self._stats["leaders"] += 1
+        try:
+            result = await fn()
+        except Exception as e:
+            await self._publish(redis, result_key, channel, {**_encode_error(e), "token": token})
+            raise
+        else:
+            await self._publish(redis, result_key, channel, {"ok": True, "token": token})
+            return result
+        finally:
+            try:
+                if await redis.get(lock_key) == token:
+                    await redis.delete(lock_key)
+            except RedisError as e:
+                logger.warning(f"Redis delete error (single-flight): {e}")
+
+    async def _publish(self, redis, result_key: str, channel: str, payload: dict):
+        message = json.dumps(payload, ensure_ascii=False)
+        try:
+            await redis.set(result_key, message, ex=RESULT_TTL_SECONDS)
+            await redis.publish(channel, message)
+        except RedisError as e:
+            logger.warning(f"Redis publish error (single-flight): {e}")
+
+    async def _wait_remote(self, redis, lock_key: str, result_key: str, channel: str) -> dict | None:
+        """
+        다른 워커의 결과 대기
+
+        지금 락을 가진 수행의 결과(같은 토큰)만 받습니다.
+
+        Returns:
+            결과 메시지, 락이 결과 없이 풀렸거나 다른 워커로 넘어갔거나 대기 시간이 지나면 None
+        """
+        self._stats["remote_waits"] += 1
+        deadline = time.monotonic() + self.lock_seconds
+        pubsub = redis.pubsub()
+        try:
+            # 구독 후 결과 키를 확인해야 구독 직전에 끝난 결과도 놓치지 않음
+            await pubsub.subscribe(channel)
+            owner = await redis.get(lock_key)
+            if owner is None:
+                return None
+            while time.monotonic() < deadline:
+                payload = await self._owned_result(redis, result_key, owner)
+                if payload is not None:
+                    return payload
+                if await redis.get(lock_key) != owner:
+                    # 결과 기록 직후 락이 풀렸을 수 있으므로 한 번 더 확인
+                    return await self._owned_result(redis, result_key, owner)
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=POLL_SECONDS)
+                if message:
+                    payload = json.loads(message["data"])
+                    if payload.get("token") == owner:
+                        return payload
+            self._stats["remote_timeouts"] += 1
+            return None
+        except RedisError as e:
+            logger.warning(f"Redis pubsub error (single-flight): {e}")
+            return None
+        finally:
+            try:
+                await pubsub.unsubscribe(channel)
+                await pubsub.aclose()
+            except RedisError as e:
+                logger.debug(f"Redis pubsub close error (single-flight): {e}")
+
+    @staticmethod
+    async def _owned_result(redis, result_key: str, owner: str) -> dict | None:
+        """결과 키의 결과 (owner 토큰의 수행 결과가 아니면 None)"""
+        cached = await redis.get(result_key)
+        if not cached:
+            return None
+        payload = json.loads(cached)
+        return payload if payload.get("token") == owner else None
+
+    def stats(self) -> dict:
+        return {**self._stats, "in_flight": len(self._inflight)}
@@ -0,0 +1,25 @@
+import json
+import zlib
+from typing import Any
+
+# 저장 행마다 codec을 기록하므로 기본 방식이 바뀌어도 기존 데이터는 그대로 읽을 수 있음
+DEFAULT_CODEC = "zlib"
+ZLIB_LEVEL = 6
+
+def compress_json(value: Any, codec: str = DEFAULT_CODEC) -> tuple[bytes, int]:
+    """
+    JSON 직렬화 후 압축
+
+    Returns:
+        (압축 데이터, 압축 전 바이트 수)
+    """
+    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+    if codec == "zlib":
+        return zlib.compress(raw, ZLIB_LEVEL), len(raw)
+    raise ValueError(f"Unsupported codec: {codec}")
+
+def decompress_json(data: bytes, codec: str) -> Any:
+    """compress_json으로 저장한 데이터 복원"""
+    if codec == "zlib":
+        return json.loads(zlib.decompress(data))
+    raise ValueError(f"Unsupported codec: {codec}")
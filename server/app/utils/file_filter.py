@@ -0,0 +1,26 @@
+import fnmatch
+import re
+from collections.abc import Callable, Iterable
+
+
+def compile_ignore_matcher(
+    extensions: Iterable[str],
+    globs: Iterable[str] = ()
+) -> Callable[[str], bool]:
+    """
+    분석 제외 파일 판별 함수 생성
+
+    확장자는 튜플 하나로 str.endswith에 넘기고, glob 패턴은 하나의 정규식으로 합쳐
+    파일마다 패턴 목록을 순회하지 않도록 미리 컴파일합니다.
+    (fnmatch 규칙이므로 '*'는 '/'도 매칭: "vendor/*"는 vendor 하위 전체)
+    """
+    suffixes = tuple(ext.lower() for ext in extensions)
+    patterns = [fnmatch.translate(glob) for glob in globs]
+    glob_regex = re.compile("|".join(patterns)) if patterns else None
+
+    def is_ignored(filename: str) -> bool:
+        if suffixes and filename.lower().endswith(suffixes):
+            return True
+        return bool(glob_regex and glob_regex.match(filename))
+
+    return is_ignored
@@ -0,0 +1,303 @@
+import json
+import re
+from collections.abc import AsyncIterator, Iterable
+from typing import Any
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+# 스칼라 값(숫자, true/false/null)의 끝을 판단하는 구분자
+_SCALAR_END = ",}] \t\n\r"
+# 중첩 값 스캔: 문자열 밖에서는 구조 문자까지, 문자열 안에서는 이스케이프를 포함한 본문 전체를 정규식으로 한 번에 건너뜀
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+class JsonStreamError(ValueError):
+    """스트림이 올바른 JSON 객체가 아니거나 중간에 끊긴 경우"""
+
+class ObjectStreamParser:
+    """
+    최상위 JSON 객체를 청크 단위로 읽는 증분 파서
+
+    - keep_keys: 값 전체를 디코딩해 (key, value)로 반환
+    - stream_keys: 배열 값을 원소 단위로 디코딩해 (key, item)으로 하나씩 반환
+    - 그 외 키: 값을 스캔만 하고 버림
+
+    버퍼에는 아직 끝나지 않은 값 하나만 남기고, 버리는 값은 스캔한 부분부터 바로 비웁니다.
+    max_item_string을 주면 stream 원소 안의 문자열을 스캔 중에 그 길이로 잘라
+    (예: 커밋 상세의 거대한 patch) 원소 하나의 메모리 사용량도 제한합니다.
+    """
+    def __init__(
+        self,
+        keep_keys: Iterable[str] = (),
+        stream_keys: Iterable[str] = (),
+        max_item_string: int | None = None
+    ):
+        self.keep_keys = set(keep_keys)
+        self.stream_keys = set(stream_keys)
+        self.max_item_string = max_item_string
+        self._buf = ""
+        self._pos = 0
+        self._state = "start"
+        self._key: str | None = None
+        # 중첩 값 스캔 상태 (재개 위치, 깊이, 문자열 내부 여부, 이스케이프 여부, 문자열 시작, 잘린 문자열 끝)
+        self._scan: list | None = None
+        self.done = False
+
+    def feed(self, text: str) -> list[tuple[str, Any]]:
+        """청크를 추가하고 완성된 이벤트 목록 반환"""
+        self._buf += text
+        events = self._parse(eof=False)
+        # 처리한 앞부분은 버려 버퍼가 누적되지 않도록 유지
+        self._buf = self._buf[self._pos:]
+        if self._scan:
+            for field in (0, 4, 5):
+                if self._scan[field] is not None:
+                    self._scan[field] -= self._pos
+        self._pos = 0
+        return events
+
+    def close(self) -> list[tuple[str, Any]]:
+        """스트림 종료 (객체가 닫히지 않았으면 JsonStreamError)"""
+        events = self._parse(eof=True)
+        if not self.done:
+            raise JsonStreamError("Unexpected end of JSON stream")
+        return events
+
+    def _skip_ws(self) -> bool:
+        """공백을 건너뛰고 다음 문자가 있으면 True"""
+        buf = self._buf
+        while self._pos < len(buf) and buf[self._pos] in _WHITESPACE:
+            self._pos += 1
+        return self._pos < len(buf)
+
+    def _expect(self, char: str):
+        found = self._buf[self._pos]
+        if found != char:
+            raise JsonStreamError(f"Expected {char!r} at offset {self._pos}, got {found!r}")
+        self._pos += 1
+
+    def _value_end(self, eof: bool, max_string: int | None = None) -> int | None:
+        """
+        현재 위치에서 시작하는 값의 끝 인덱스 (아직 완성되지 않았으면 None)
+
+        max_string을 주면 완성되지 않은 문자열이 그보다 길어질 때 스캔한 뒷부분을 버퍼에서 제거합니다.
+        """
+        buf = self._buf
+        if self._scan is None and buf[self._pos] not in '{["':
+            end = self._pos
+            while end < len(buf) and buf[end] not in _SCALAR_END:
+                end += 1
+            if end == len(buf) and not eof:
+                return None
+            return end
+
+        if self._scan is None:
+            self._scan = [self._pos, 0, False, False, None, None]
+        i, depth, in_string, escaped, string_start, cut = self._scan
+        size = len(buf)
+        while i < size:
+            if in_string:
+                if escaped:
+                    escaped = False
+                    i += 1
+                    continue
+                i = _STRING_BODY.match(buf, i).end()
+                if i == size:
+                    break
+                if buf[i] == "\\":
+                    # 청크가 백슬래시로 끝남: 다음 청크의 첫 문자는 이스케이프된 문자
+                    escaped = True
+                    i = size
+                    break
+                i += 1
+                if cut is not None:
+                    # 잘린 문자열은 앞부분만 남기고 닫는 따옴표까지의 나머지를 제거
+                    buf = self._buf = buf[:cut] + buf[i - 1:]
+                    size = len(buf)
+                    i = cut + 1
+                in_string, cut = False, None
+                if depth == 0:
+                    self._scan = None
+                    return i
+            else:
+                match = _STRUCTURAL.search(buf, i)
+                if match is None:
+                    i = size
+                    break
+                i = match.end()
+                char = match.group()
+                if char == '"':
+                    in_string, string_start = True, i
+                elif char in "{[":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        self._scan = None
+                        return i
+
+        if in_string and max_string is not None and i - string_start > max_string:
+            if cut is None:
+                cut = _escape_boundary(buf, string_start, string_start + max_string)
+            # 스캔을 마친 뒷부분은 버림 (이스케이프 상태는 스캔 위치 기준이라 그대로 유지)
+            self._buf = buf[:cut] + buf[i:]
+            i = cut
+        self._scan = [i, depth, in_string, escaped, string_start, cut]
+        return None
+
+    def _take_value(self, eof: bool, decode: bool, max_string: int | None = None) -> tuple[bool, Any]:
+        """완성된 값을 소비 (decode=False면 파싱 없이 건너뜀)"""
+        end = self._value_end(eof, max_string)
+        if end is None:
+            if not decode and self._scan:
+                # 버릴 값은 스캔한 부분까지 소비 처리해 버퍼에 쌓이지 않도록 함
+                self._pos = self._scan[0]
+                self._scan[4] = self._scan[5] = None
+            return False, None
+        value = None
+        if decode:
+            try:
+                value = _decoder.decode(self._buf[self._pos:end])
+            except json.JSONDecodeError as e:
+                raise JsonStreamError(str(e)) from e
+        self._pos = end
+        return True, value
+
+    def _parse(self, eof: bool) -> list[tuple[str, Any]]:
+        events: list[tuple[str, Any]] = []
+        while not self.done and self._skip_ws():
+            state = self._state
+            char = self._buf[self._pos]
+
+            if state == "start":
+                self._expect("{")
+                self._state = "key_or_end"
+
+            elif state in ("key_or_end", "key"):
+                if char == "}" and state == "key_or_end":
+                    self._pos += 1
+                    self.done = True
+                    continue
+                if char != '"':
+                    raise JsonStreamError(f"Expected object key at offset {self._pos}")
+                complete, key = self._take_value(eof, decode=True)
+                if not complete:
+                    break
+                self._key = key
+                self._state = "colon"
+
+            elif state == "colon":
+                self._expect(":")
+                self._state = "value"
+
+            elif state == "value":
+                if self._key in self.stream_keys and char == "[":
+                    self._pos += 1
+                    self._state = "item_or_end"
+                    continue
+                complete, value = self._take_value(eof, decode=self._key in self.keep_keys)
+                if not complete:
+                    break
+                if self._key in self.keep_keys:
+                    events.append((self._key, value))
+                self._state = "after_value"
+
+            elif state == "after_value":
+                if char == "}":
+                    self._pos += 1
+                    self.done = True
+                else:
+                    self._expect(",")
+                    self._state = "key"
+
+            elif state in ("item_or_end", "item"):
+                if char == "]" and state == "item_or_end":
+                    self._pos += 1
+                    self._state = "after_value"
+                    continue
+                complete, item = self._take_value(eof, decode=True, max_string=self.max_item_string)
+                if not complete:
+                    break
+                events.append((self._key, item))
+                self._state = "after_item"
+
+            elif state == "after_item":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "after_value"
+                else:
+                    self._expect(",")
+                    self._state = "item"
+
+        return events
+
+def _escape_boundary(buf: str, start: int, limit: int) -> int:
+    """
+    문자열 본문 [start, limit) 안에서 이스케이프 시퀀스를 가르지 않는 가장 먼 자르기 위치
+
+    ensure_ascii로 인코딩된 서로게이트 쌍(\\uD83D\\uDE00)도 가르지 않도록, 자르기 위치 바로 앞이
+    상위 서로게이트 이스케이프면 그 앞에서 자릅니다. (홀로 남은 서로게이트는 UTF-8 인코딩 불가)
+    """
+    cut = limit
+    high_start = high_end = None
+    i = buf.find("\\", start, limit)
+    while i != -1:
+        end = i + (6 if buf[i + 1:i + 2] == "u" else 2)
+        if end > limit:
+            cut = i
+            break
+        if _is_high_surrogate(buf, i):
+            high_start, high_end = i, end
+        i = buf.find("\\", end, limit)
+    return high_start if high_end == cut else cut
+
+def _is_high_surrogate(buf: str, i: int) -> bool:
+    """buf[i]에서 시작하는 이스케이프가 상위 서로게이트(\\uD800-\\uDBFF)인지 확인"""
+    return buf[i + 1:i + 2] == "u" and "d800" <= buf[i + 2:i + 6].lower() <= "dbff"
+
+async def iter_object_events(
+    chunks: AsyncIterator[str],
+    keep_keys: Iterable[str] = (),
+    stream_keys: Iterable[str] = (),
+    max_item_string: int | None = None
+) -> AsyncIterator[tuple[str, Any]]:
+    """텍스트 청크 스트림을 ObjectStreamParser로 파싱하며 이벤트를 순서대로 yield"""
+    parser = ObjectStreamParser(keep_keys, stream_keys, max_item_string)
+    async for chunk in chunks:
+        for event in parser.feed(chunk):
+            yield event
+    for event in parser.close():
+        yield event
+
+def partial_string_value(text: str, key: str) -> str | None:
+    """
+    완성되지 않은 JSON 텍스트에서 key의 문자열 값을 현재까지 받은 만큼 디코딩 (스트리밍 미리보기용)
+
+    처음 나오는 "key": "..." 를 기준으로 하며, 끝이 잘린 이스케이프 시퀀스는 다음 청크까지 보류합니다.
+    """
+    match = re.search(rf'"{re.escape(key)}"\s*:\s*"', text)
+    if not match:
+        return None
+    raw = []
+    i = match.end()
+    while i < len(text):
+        char = text[i]
+        if char == '"':
+            break
+        if char == "\\":
+            size = 6 if text[i + 1:i + 2] == "u" else 2
+            if i + size > len(text):
+                break
+            raw.append(text[i:i + size])
+            i += size
+            continue
+        raw.append(char)
+        i += 1
+    try:
+        value = json.loads(f'"{"".join(raw)}"', strict=False)
+    except ValueError:
+        return None
+    # 서로게이트 쌍이 청크 경계에서 잘린 경우 다음 청크까지 보류
+    if value and "\ud800" <= value[-1] <= "\udbff":
+        value = value[:-1]
+    return value
@@ -0,0 +1,44 @@
+"""
+일지 생성 작업 워커
+
+    python -m app.worker [--concurrency N]
+
+API 서버와 별도 프로세스로 실행하며, POST /journals?async=true로 등록된 작업을 처리합니다.
+"""
+import argparse
+import asyncio
+import signal
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.github_client import close_github_client, init_github_client
+from app.core.redis import close_shared_redis, init_shared_redis
+from app.services.journal_job_service import run_worker
+
+
+async def main(concurrency: int):
+    await init_github_client()
+    redis = await init_shared_redis()
+    if redis is None:
+        logger.error("❌ 작업 큐(Redis)에 연결할 수 없어 워커를 종료합니다.")
+        await close_github_client()
+        return
+
+    # SIGTERM/SIGINT 수신 시 진행 중인 작업을 마치고 종료
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await run_worker(concurrency, stop)
+    finally:
+        await close_github_client()
+        await close_shared_redis()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DevLog AI 일지 생성 워커")
+    parser.add_argument("--concurrency", type=int, default=settings.JOURNAL_JOB_CONCURRENCY)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency))
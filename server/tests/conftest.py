@@ -7,7 +7,11 @@ from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, Asyn
 from datetime import date
 from uuid import uuid4
 
+from app.core import redis as redis_module
 from app.core.redis import get_redis_client
+from app.core.github_client import close_github_client
+from app.services.github_cache import commit_detail_cache
+from app.services import repo_index_service
 from app.core.database import Base, get_db
 from app.core.security import create_access_token
 from app.models import User, Repository, Journal
@@ -37,6 +41,14 @@ async def engine():
         await conn.run_sync(Base.metadata.drop_all)
     await engine.dispose()
 
+# 공용 GitHub 클라이언트는 이벤트 루프에 묶이므로 테스트마다 정리 (프로세스 캐시 포함)
+@pytest_asyncio.fixture(autouse=True)
+async def github_state_cleanup():
+    yield
+    await close_github_client()
+    commit_detail_cache.clear_local()
+    repo_index_service._local.clear()
+
 # 테스트용 DB 세션 (함수 스코프: 각 테스트마다 독립적)
 @pytest_asyncio.fixture
 async def db_session(engine):
@@ -74,6 +86,12 @@ async def mock_redis():
     redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
     yield redis
     await redis.close()
+
+@pytest_asyncio.fixture
+async def shared_redis(mock_redis, monkeypatch):
+    """서비스 계층 공용 Redis를 테스트용 In-Memory Redis로 교체"""
+    monkeypatch.setattr(redis_module, "_shared_redis", mock_redis)
+    yield mock_redis
    
 # 테스트용 사용자 데이터
 @pytest_asyncio.fixture
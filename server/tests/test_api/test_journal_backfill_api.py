@@ -0,0 +1,102 @@
+from datetime import date
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import respx
+from httpx import AsyncClient, Response
+from sqlalchemy import select
+
+from app.core.security import encrypt_token
+from app.models import Journal
+from app.services.gemini_service import GeminiService
+
+MOCK_GEMINI_RESPONSE = {
+    "summary": "백필로 생성한 일지입니다.",
+    "main_tasks": ["기간 일지 생성"],
+    "learned_things": ["목록 요청 일괄화"],
+}
+
+# 목록은 최신순, 두 페이지에 걸쳐 반환 (06-05는 커밋 없음, 06-02는 이미 일지 존재)
+LIST_PAGES = [
+    [
+        {"sha": "b" * 40, "commit": {"committer": {"date": "2025-06-04T09:00:00Z"}}},
+        {"sha": "c" * 40, "commit": {"committer": {"date": "2025-06-03T18:00:00Z"}}},
+    ],
+    [
+        {"sha": "d" * 40, "commit": {"committer": {"date": "2025-06-03T08:00:00Z"}}},
+        {"sha": "e" * 40, "commit": {"committer": {"date": "2025-06-02T08:00:00Z"}}},
+        {"sha": "f" * 40, "commit": {"committer": {"date": "2025-06-01T08:00:00Z"}}},
+    ],
+]
+
+def _detail(request, sha):
+    return Response(200, json={
+        "sha": sha,
+        "commit": {"message": f"feat: {sha[0]}"},
+        "stats": {"total": 3, "additions": 2, "deletions": 1},
+        "files": [{"filename": f"app/{sha[0]}.py", "status": "modified", "additions": 2, "deletions": 1, "patch": "+x"}],
+    })
+
+@pytest.mark.asyncio
+async def test_backfill_generates_missing_days_and_resumes(
+    async_client: AsyncClient,
+    db_session,
+    test_user,
+    test_repo,
+    access_token_header
+):
+    """기간 목록을 한 번에 조회해 빠진 날짜만 생성하고, 다시 실행하면 생성된 날짜는 건너뜀"""
+    test_user.access_token_encrypted = encrypt_token("gh_backfill_token")
+    test_user.selected_repo_id = test_repo.id
+    db_session.add(Journal(
+        user_id=test_user.id, repository_id=test_repo.id, date=date(2025, 6, 2),
+        summary="기존 일지", main_tasks=[], learned_things=[]
+    ))
+    await db_session.commit()
+
+    generate = AsyncMock(return_value=(MOCK_GEMINI_RESPONSE, None))
+    with respx.mock, patch.object(GeminiService, "generate_journal", generate):
+        list_route = respx.get("https://api.github.com/repos/test/repo/commits").mock(side_effect=[
+            Response(200, json=LIST_PAGES[0], headers={
+                "Link": '<https://api.github.com/repos/test/repo/commits?page=2>; rel="next"'
+            }),
+            Response(200, json=LIST_PAGES[1]),
+        ])
+        detail_route = respx.get(url__regex=r".*/repos/test/repo/commits/(?P<sha>[0-9a-f]{40})$").mock(side_effect=_detail)
+        response = await async_client.post(
+            "/api/v1/journals/backfill",
+            json={"start_date": "2025-06-01", "end_date": "2025-06-05"},
+            headers=access_token_header
+        )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert report["days_total"] == 5
+    assert report["days_existing"] == 1
+    assert report["days_without_commits"] == 1
+    assert report["days_generated"] == 3
+    assert report["list_calls"] == 2
+    assert report["calls_saved"] == 2
+    assert list_route.call_count == 2
+    # 이미 일지가 있는 06-02의 커밋은 상세 조회하지 않음
+    assert detail_route.call_count == 4
+    assert generate.await_count == 3
+
+    result = await db_session.execute(
+        select(Journal).where(Journal.repository_id == test_repo.id, Journal.date == date(2025, 6, 3))
+    )
+    journal = result.scalar_one()
+    assert journal.commit_count == 2
+    assert journal.summary == MOCK_GEMINI_RESPONSE["summary"]
+
+    # 재실행: 남은 날짜(커밋 없는 06-05)만 다시 확인
+    with respx.mock, patch.object(GeminiService, "generate_journal", generate):
+        list_route = respx.get("https://api.github.com/repos/test/repo/commits").mock(return_value=Response(200, json=[]))
+        response = await async_client.post(
+            "/api/v1/journals/backfill",
+            json={"start_date": "2025-06-01", "end_date": "2025-06-05"},
+            headers=access_token_header
+        )
+    assert response.json()["days_existing"] == 4
+    assert response.json()["days_generated"] == 0
+    assert generate.await_count == 3
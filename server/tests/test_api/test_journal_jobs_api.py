@@ -0,0 +1,144 @@
+import asyncio
+import time
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.services import journal_job_service
+from app.services.github_service import GithubApiError
+from app.services.journal_service import JournalService
+
+
+async def _take_job(redis) -> str:
+    """워커와 같은 방식으로 대기열에서 작업 하나를 꺼냄"""
+    return await redis.blmove(journal_job_service.QUEUE_KEY, journal_job_service.PROCESSING_KEY, 1, "RIGHT", "LEFT")
+
+@pytest.mark.asyncio
+async def test_async_journal_job_completes(
+    async_client: AsyncClient,
+    engine,
+    shared_redis,
+    test_user,
+    access_token_header,
+    monkeypatch
+):
+    """async=true면 202 + 작업 ID를 반환하고, 워커 처리 후 상태 조회에 일지 ID가 포함"""
+    monkeypatch.setattr(journal_job_service, "AsyncSessionLocal", async_sessionmaker(engine, expire_on_commit=False))
+
+    response = await async_client.post(
+        "/api/v1/journals",
+        params={"date": "2025-05-01", "async": "true"},
+        headers=access_token_header
+    )
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+    assert response.json()["status"] == "queued"
+
+    journal_id = uuid4()
+    with patch.object(JournalService, "create_daily_journal", AsyncMock(return_value=SimpleNamespace(id=journal_id))) as mock_create:
+        await journal_job_service.process_job(await _take_job(shared_redis))
+    assert mock_create.await_args.args[0].id == test_user.id
+
+    response = await async_client.get(f"/api/v1/journals/jobs/{job_id}", headers=access_token_header)
+    assert response.status_code == 200
+    assert response.json()["status"] == "succeeded"
+    assert response.json()["journal_id"] == str(journal_id)
+    assert await shared_redis.llen(journal_job_service.PROCESSING_KEY) == 0
+
+@pytest.mark.asyncio
+async def test_async_journal_job_retries_then_dead_letters(engine, shared_redis, test_user, monkeypatch):
+    """재시도 가능한 실패는 백오프 후 재시도, 최대 횟수를 넘기면 dead-letter로 이동"""
+    monkeypatch.setattr(journal_job_service, "AsyncSessionLocal", async_sessionmaker(engine, expire_on_commit=False))
+    monkeypatch.setattr(settings, "JOURNAL_JOB_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr(settings, "JOURNAL_JOB_RETRY_BASE_SECONDS", 0)
+
+    job = await journal_job_service.enqueue_journal_job(test_user.id, date(2025, 5, 2))
+    failing = AsyncMock(side_effect=GithubApiError("upstream down", status_code=502))
+    with patch.object(JournalService, "create_daily_journal", failing):
+        await journal_job_service.process_job(await _take_job(shared_redis))
+        retried = await journal_job_service.get_journal_job(test_user.id, job.id)
+        assert retried.status == "queued" and retried.attempts == 1
+        assert await shared_redis.zscore(journal_job_service.DELAYED_KEY, job.id) <= time.time()
+
+        await journal_job_service._promote_delayed(shared_redis)
+        await journal_job_service.process_job(await _take_job(shared_redis))
+
+    failed = await journal_job_service.get_journal_job(test_user.id, job.id)
+    assert failed.status == "failed"
+    assert failed.error == "upstream down"
+    assert await shared_redis.lrange(journal_job_service.DEAD_LETTER_KEY, 0, -1) == [job.id]
+    # 다른 사용자는 조회 불가
+    assert await journal_job_service.get_journal_job(uuid4(), job.id) is None
+
+@pytest.mark.asyncio
+async def test_recover_stalled_jobs_respects_lease_and_finished_jobs(engine, shared_redis, test_user, monkeypatch):
+    """리스가 살아 있는 장시간 작업은 두고, 완료된 작업은 목록에서만 제거하며, 리스가 끊긴 작업만 대기열로 복구"""
+    monkeypatch.setattr(journal_job_service, "AsyncSessionLocal", async_sessionmaker(engine, expire_on_commit=False))
+    monkeypatch.setattr(settings, "JOURNAL_JOB_HEARTBEAT_SECONDS", 0.01)
+    monkeypatch.setattr(journal_job_service, "CLAIM_GRACE_SECONDS", 0)
+
+    long_job = await journal_job_service.enqueue_journal_job(test_user.id, date(2025, 5, 3))
+    done_job = await journal_job_service.enqueue_journal_job(test_user.id, date(2025, 5, 4))
+    lost_job = await journal_job_service.enqueue_journal_job(test_user.id, date(2025, 5, 5))
+    for _ in range(3):
+        await _take_job(shared_redis)
+    for job_id, status in ((done_job.id, "succeeded"), (lost_job.id, "running")):
+        job = await journal_job_service._load_job(shared_redis, job_id)
+        job.update(status=status, started_at=time.time())
+        await journal_job_service._save_job(shared_redis, job)
+
+    async def slow_create(*args, **kwargs):
+        # 타임아웃보다 오래 실행 중인 작업 (하트비트가 리스를 갱신하는 동안 복구 실행)
+        job = await journal_job_service._load_job(shared_redis, long_job.id)
+        job["started_at"] = time.time() - settings.JOURNAL_JOB_TIMEOUT_SECONDS * 2
+        await journal_job_service._save_job(shared_redis, job)
+        await asyncio.sleep(0.05)
+        await journal_job_service.recover_stalled_jobs()
+        return SimpleNamespace(id=uuid4())
+
+    with patch.object(JournalService, "create_daily_journal", AsyncMock(side_effect=slow_create)):
+        await journal_job_service.process_job(long_job.id)
+
+    assert await shared_redis.lrange(journal_job_service.QUEUE_KEY, 0, -1) == [lost_job.id]
+    assert await shared_redis.llen(journal_job_service.PROCESSING_KEY) == 0
+    assert (await journal_job_service.get_journal_job(test_user.id, long_job.id)).status == "succeeded"
+    assert not await shared_redis.exists(journal_job_service.LEASE_KEY.format(job_id=long_job.id))
+
+@pytest.mark.asyncio
+async def test_worker_recovers_unleased_jobs_periodically_after_grace(engine, shared_redis, test_user, monkeypatch):
+    """방금 꺼내 리스를 잡기 전인 작업은 두고, 리스 없이 유예 시간을 넘긴 작업은 실행 중인 워커가 주기적으로 복구"""
+    monkeypatch.setattr(journal_job_service, "AsyncSessionLocal", async_sessionmaker(engine, expire_on_commit=False))
+    monkeypatch.setattr(settings, "JOURNAL_JOB_RECOVERY_INTERVAL_SECONDS", 0.01)
+
+    job = await journal_job_service.enqueue_journal_job(test_user.id, date(2025, 5, 6))
+    await _take_job(shared_redis)
+    # 리스를 잡기 전: 복구하지 않음
+    await journal_job_service.recover_stalled_jobs()
+    assert await shared_redis.lrange(journal_job_service.PROCESSING_KEY, 0, -1) == [job.id]
+    assert await shared_redis.llen(journal_job_service.QUEUE_KEY) == 0
+
+    stop = asyncio.Event()
+    journal_id = uuid4()
+
+    async def create(*args, **kwargs):
+        stop.set()
+        return SimpleNamespace(id=journal_id)
+
+    with patch.object(JournalService, "create_daily_journal", AsyncMock(side_effect=create)):
+        worker = asyncio.create_task(journal_job_service.run_worker(concurrency=1, stop=stop))
+        await asyncio.sleep(0.05)
+        assert await shared_redis.lrange(journal_job_service.PROCESSING_KEY, 0, -1) == [job.id]
+        # 리스 없이 유예 시간이 지남 (리스를 잡기 전에 워커가 종료됨): 시작 시가 아닌 주기적 복구로 처리
+        monkeypatch.setattr(journal_job_service, "CLAIM_GRACE_SECONDS", 0)
+        await asyncio.wait_for(worker, timeout=5)
+
+    recovered = await journal_job_service.get_journal_job(test_user.id, job.id)
+    assert recovered.status == "succeeded"
+    assert recovered.journal_id == journal_id
+    assert await shared_redis.zcard(journal_job_service.SUSPECT_KEY) == 0
@@ -1,5 +1,7 @@
+import json
 import pytest
 from datetime import date
+from types import SimpleNamespace
 from unittest.mock import patch
 from httpx import AsyncClient
 
@@ -38,7 +40,7 @@ async def test_create_journal_success(
     
     # 1. Service Mocking
     with patch("app.services.journal_service.fetch_commits", return_value=MOCK_COMMITS) as mock_fetch, \
-         patch("app.services.gemini_service.GeminiService.generate_journal", return_value=MOCK_GEMINI_RESPONSE) as mock_generate:
+         patch("app.services.gemini_service.GeminiService.generate_journal", return_value=(MOCK_GEMINI_RESPONSE, None)) as mock_generate:
         # 2. API 호출
         today = date.today().isoformat()
         response = await async_client.post(
@@ -70,4 +72,96 @@ async def test_create_journal_no_commits(
             headers=access_token_header
         )
         assert response.status_code == 400
-        assert "No commits found" in response.json()["detail"]
\ No newline at end of file
+        assert "No commits found" in response.json()["detail"]
+
+class FakeStreamModel:
+    """generate_content_async(stream=True) 응답을 작은 청크로 흉내 (fail_after개 청크 뒤 스트림 실패)"""
+    def __init__(self, text: str, size: int = 7, fail_after: int | None = None, fallback: str | None = None):
+        self.chunks = [SimpleNamespace(text=text[i:i + size]) for i in range(0, len(text), size)]
+        self.fail_after = fail_after
+        self.fallback = fallback
+
+    async def generate_content_async(self, prompt, stream=False):
+        if not stream:
+            return SimpleNamespace(text=self.fallback)
+
+        async def iterate():
+            for index, chunk in enumerate(self.chunks):
+                if index == self.fail_after:
+                    raise ConnectionError("stream dropped")
+                yield chunk
+        return iterate()
+
+def _sse_events(text: str) -> list[tuple[str, dict]]:
+    """SSE 응답 본문을 (이벤트, 데이터) 목록으로 변환"""
+    return [
+        (block.split("\n")[0].removeprefix("event: "), json.loads(block.split("\n")[1].removeprefix("data: ")))
+        for block in text.strip().split("\n\n")
+    ]
+
+@pytest.mark.asyncio
+async def test_stream_journal_emits_progress_summary_and_journal(
+    async_client: AsyncClient,
+    db_session,
+    test_user,
+    test_repo,
+    access_token_header
+):
+    """SSE 스트리밍: 진행 이벤트 → summary 부분 텍스트 → 저장된 일지 순서로 전송"""
+    test_user.selected_repo_id = test_repo.id
+    await db_session.commit()
+    model = FakeStreamModel(json.dumps(MOCK_GEMINI_RESPONSE, ensure_ascii=False))
+
+    with patch("app.services.journal_service.fetch_commits", return_value=MOCK_COMMITS), \
+         patch("app.services.gemini_service.get_gemini_model", return_value=model):
+        response = await async_client.post(
+            "/api/v1/journals/stream",
+            params={"date": "2025-04-02", "force": True},
+            headers=access_token_header
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(response.text)
+    names = [name for name, _ in events]
+    assert names[:3] == ["progress", "progress", "progress"]
+    assert events[1][1] == {"stage": "commits_fetched", "commit_count": 1}
+    assert names.count("summary") > 1
+    assert "".join(data["text"] for name, data in events if name == "summary") == MOCK_GEMINI_RESPONSE["summary"]
+    assert names[-1] == "journal"
+    assert events[-1][1]["summary"] == MOCK_GEMINI_RESPONSE["summary"]
+    assert events[-1][1]["commit_count"] == 1
+
+@pytest.mark.asyncio
+async def test_stream_journal_resets_summary_before_fallback(
+    async_client: AsyncClient,
+    db_session,
+    test_user,
+    test_repo,
+    access_token_header
+):
+    """스트림이 summary 일부를 보낸 뒤 실패하면 summary_reset 후 대체 호출 결과로 일지 저장"""
+    test_user.selected_repo_id = test_repo.id
+    await db_session.commit()
+    fallback = {**MOCK_GEMINI_RESPONSE, "summary": "대체 호출로 생성된 요약"}
+    model = FakeStreamModel(
+        json.dumps(MOCK_GEMINI_RESPONSE, ensure_ascii=False),
+        fail_after=4,
+        fallback=json.dumps(fallback, ensure_ascii=False)
+    )
+
+    with patch("app.services.journal_service.fetch_commits", return_value=MOCK_COMMITS), \
+         patch("app.services.gemini_service.get_gemini_model", return_value=model):
+        response = await async_client.post(
+            "/api/v1/journals/stream",
+            params={"date": "2025-04-03", "force": True},
+            headers=access_token_header
+        )
+
+    events = _sse_events(response.text)
+    names = [name for name, _ in events]
+    assert "summary" in names
+    reset = names.index("summary_reset")
+    assert "summary" not in names[reset + 1:]
+    assert names[-1] == "journal"
+    assert events[-1][1]["summary"] == fallback["summary"]
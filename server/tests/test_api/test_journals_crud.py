@@ -42,6 +42,31 @@ async def test_read_journals_pagination(
     # 조회된 일지 중 테스트 일지가 포함되어 있는지 확인
     assert any(j["id"] == str(journal_id) for j in items)
     
+@pytest.mark.asyncio
+async def test_read_journals_selected_fields(
+    async_client: AsyncClient,
+    test_user_token: str,
+    test_journal: Journal,
+):
+    """?fields=로 요청한 필드(+ id)만 응답, 기본값은 전체 필드, 알 수 없는 필드는 400"""
+    headers = {"Authorization": f"Bearer {test_user_token}"}
+    params = {"repository_id": str(test_journal.repository_id)}
+
+    response = await async_client.get("/api/v1/journals", params={**params, "fields": "date,summary"}, headers=headers)
+    assert response.status_code == 200
+    item = next(j for j in response.json()["items"] if j["id"] == str(test_journal.id))
+    assert item == {"id": str(test_journal.id), "date": test_journal.date.isoformat(), "summary": test_journal.summary}
+    assert response.json()["total"] >= 1
+
+    response = await async_client.get("/api/v1/journals", params=params, headers=headers)
+    item = next(j for j in response.json()["items"] if j["id"] == str(test_journal.id))
+    assert item["main_tasks"] == test_journal.main_tasks
+    assert item["commit_count"] == test_journal.commit_count
+    assert "created_at" in item
+
+    response = await async_client.get("/api/v1/journals", params={**params, "fields": "raw_commits"}, headers=headers)
+    assert response.status_code == 400
+
 @pytest.mark.asyncio
 async def test_read_journal_detail(
     async_client: AsyncClient,
@@ -1,8 +1,14 @@
+import asyncio
+import json
+import time
 import pytest
 import respx
 from httpx import AsyncClient, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.services import repository_service, repo_index_service
+
 
 # GitHub API Mock 응답 데이터
 MOCK_GITHUB_REPOS = [
@@ -107,4 +113,144 @@ async def test_select_repository(
         repo1 = next(r for r in list_data if r["full_name"] == "octocat/Hello-World")
         repo2 = next(r for r in list_data if r["full_name"] == "octocat/DevLog-AI")
         assert repo1["is_selected"] is False
-        assert repo2["is_selected"] is True
\ No newline at end of file
+        assert repo2["is_selected"] is True
+
+@pytest.mark.asyncio
+async def test_get_repositories_stale_while_revalidate(
+    async_client: AsyncClient,
+    test_user,
+    test_user_token: str,
+    shared_redis,
+    monkeypatch
+):
+    """
+    [GET /repositories] 캐시 적중 시 GitHub 호출 없이 응답하고,
+    soft TTL이 지나면 기존 값을 반환한 뒤 백그라운드에서 갱신
+    """
+    headers = {"Authorization": f"Bearer {test_user_token}"}
+    renamed = [{**MOCK_GITHUB_REPOS[0], "description": "updated"}]
+
+    async with respx.mock:
+        route = respx.get("https://api.github.com/user/repos").mock(
+            side_effect=[Response(200, json=MOCK_GITHUB_REPOS), Response(200, json=renamed)]
+        )
+        first = await async_client.get("/api/v1/repositories", headers=headers)
+        second = await async_client.get("/api/v1/repositories", headers=headers)
+        assert route.call_count == 1
+        assert first.json() == second.json()
+
+        # soft TTL 경과: 기존(stale) 값 즉시 반환 + 백그라운드 갱신
+        monkeypatch.setattr(settings, "REPO_CACHE_SOFT_TTL_SECONDS", -1)
+        stale = await async_client.get("/api/v1/repositories", headers=headers)
+        assert len(stale.json()) == 2
+        await asyncio.gather(*repository_service._refresh_tasks)
+        assert route.call_count == 2
+        # 갱신이 끝나면 락을 풀어 다음 soft TTL 경과 시 다시 갱신 가능
+        assert not await shared_redis.keys("repos:*:refresh:*")
+
+    monkeypatch.setattr(settings, "REPO_CACHE_SOFT_TTL_SECONDS", 300)
+    async with respx.mock:
+        refreshed = await async_client.get("/api/v1/repositories", headers=headers)
+    assert refreshed.json()[0]["description"] == "updated"
+
+    # 저장소 선택 시 캐시 무효화
+    await async_client.post(
+        "/api/v1/repositories/select",
+        json={"repo_name": "octocat/Hello-World", "repo_url": "https://github.com/octocat/Hello-World"},
+        headers=headers
+    )
+    assert not await shared_redis.exists(repository_service.REPO_CACHE_KEY.format(user_id=test_user.id))
+
+@pytest.mark.asyncio
+async def test_search_repositories_builds_full_index(
+    async_client: AsyncClient,
+    test_user,
+    test_user_token: str,
+    shared_redis
+):
+    """
+    [GET /repositories/search] 전체 페이지를 동시에 조회해 인덱스를 만든 뒤
+    인덱스에서 검색/필터/정렬
+    """
+    headers = {"Authorization": f"Bearer {test_user_token}"}
+    pages = {
+        "1": [{**MOCK_GITHUB_REPOS[0], "language": "Python", "stargazers_count": 3}],
+        "2": [{**MOCK_GITHUB_REPOS[1], "language": "Python", "stargazers_count": 10}],
+        "3": [{
+            **MOCK_GITHUB_REPOS[0], "id": 1, "name": "dotfiles", "full_name": "octocat/dotfiles",
+            "description": "Shell config for devlog", "language": "Shell",
+        }],
+    }
+
+    def user_repos(request):
+        page = request.url.params["page"]
+        link = '<https://api.github.com/user/repos?page=3&per_page=100>; rel="last"' if page == "1" else ""
+        return Response(200, json=pages[page], headers={"Link": link} if link else {})
+
+    async with respx.mock:
+        route = respx.get("https://api.github.com/user/repos").mock(side_effect=user_repos)
+        building = await async_client.get("/api/v1/repositories/search", headers=headers)
+        assert building.json()["status"] == "building"
+        await asyncio.gather(*repo_index_service._build_tasks.values())
+        assert route.call_count == 3
+
+        # 트라이그램(이름 + 설명) 매칭: 이름 접두어 일치가 먼저
+        found = await async_client.get(
+            "/api/v1/repositories/search", params={"q": "devlog"}, headers=headers
+        )
+        data = found.json()
+        assert data["status"] == "ready"
+        assert [r["full_name"] for r in data["items"]] == ["octocat/DevLog-AI", "octocat/dotfiles"]
+
+        # 짧은 검색어는 이름 토큰 접두어 + 필터/정렬
+        filtered = await async_client.get(
+            "/api/v1/repositories/search",
+            params={"q": "he", "language": "python", "sort": "stars"},
+            headers=headers
+        )
+        assert [r["full_name"] for r in filtered.json()["items"]] == ["octocat/Hello-World"]
+
+        # 인덱스는 Redis에도 저장되어 다른 워커가 재사용
+        repo_index_service._local.clear()
+        ranked = await async_client.get(
+            "/api/v1/repositories/search", params={"sort": "stars"}, headers=headers
+        )
+        assert ranked.json()["total"] == 3
+        assert ranked.json()["items"][0]["full_name"] == "octocat/DevLog-AI"
+        assert route.call_count == 3
+
+@pytest.mark.asyncio
+async def test_index_build_keeps_lock_held_by_another_worker(test_user, shared_redis):
+    """다른 워커가 인덱스를 생성 중이면 생략하고 그 워커의 락은 지우지 않음"""
+    lock_key = f"{repo_index_service.REPO_INDEX_KEY.format(user_id=test_user.id)}:lock"
+    await shared_redis.set(lock_key, "other-worker", ex=60)
+
+    async with respx.mock:
+        route = respx.get("https://api.github.com/user/repos").mock(return_value=Response(200, json=[]))
+        await repo_index_service._build_in_background(test_user.id, "gh_token")
+
+    assert route.call_count == 0
+    assert await shared_redis.get(lock_key) == "other-worker"
+
+@pytest.mark.asyncio
+async def test_search_uses_index_rebuilt_by_another_worker(
+    async_client: AsyncClient,
+    test_user,
+    test_user_token: str,
+    shared_redis
+):
+    """로컬 인덱스가 soft TTL을 지나면 Redis를 다시 읽어 다른 워커가 새로 만든 인덱스를 사용"""
+    stale_repo, fresh_repo = (repo_index_service._compact(repo) for repo in MOCK_GITHUB_REPOS)
+    stale_built_at = time.time() - 2 * settings.REPO_INDEX_SOFT_TTL_SECONDS
+    repo_index_service._remember(test_user.id, repo_index_service.RepoIndex(built_at=stale_built_at, repos=[stale_repo]))
+    index_key = repo_index_service.REPO_INDEX_KEY.format(user_id=test_user.id)
+    await shared_redis.set(index_key, json.dumps({"built_at": time.time(), "repos": [fresh_repo]}))
+
+    async with respx.mock:
+        route = respx.get("https://api.github.com/user/repos").mock(return_value=Response(200, json=[]))
+        response = await async_client.get(
+            "/api/v1/repositories/search", headers={"Authorization": f"Bearer {test_user_token}"}
+        )
+    assert [r["full_name"] for r in response.json()["items"]] == ["octocat/DevLog-AI"]
+    assert route.call_count == 0
+    assert not repo_index_service._build_tasks
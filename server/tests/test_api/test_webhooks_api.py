@@ -0,0 +1,172 @@
+import hashlib
+import hmac
+import json
+from datetime import date
+
+import pytest
+import respx
+from httpx import AsyncClient, Response
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.core.security import encrypt_token
+from app.services import commit_service
+from app.services.journal_service import JournalService
+
+WEBHOOK_SECRET = "test-webhook-secret"
+COMMIT_SHA = "a1b2c3d4e5f60718293a4b5c6d7e8f9012345678"
+
+PUSH_PAYLOAD = {
+    "ref": "refs/heads/main",
+    "forced": False,
+    "size": 1,
+    "repository": {"full_name": "test/repo", "default_branch": "main"},
+    "commits": [
+        {
+            "id": COMMIT_SHA,
+            "distinct": True,
+            "message": "feat: webhook",
+            # KST 10시 = UTC 01시 (같은 날짜)
+            "timestamp": "2025-03-01T10:00:00+09:00",
+        }
+    ],
+}
+
+MOCK_COMMIT_DETAIL = {
+    "sha": COMMIT_SHA,
+    "commit": {"message": "feat: webhook", "committer": {"date": "2025-03-01T01:00:00Z"}},
+    "stats": {"total": 5, "additions": 4, "deletions": 1},
+    "files": [
+        {"filename": "app/hooks.py", "status": "modified", "additions": 4, "deletions": 1, "patch": "+hook"}
+    ],
+}
+
+def _sign(body: bytes) -> str:
+    return "sha256=" + hmac.new(WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+
+@pytest.mark.asyncio
+async def test_webhook_rejects_invalid_signature(async_client: AsyncClient, monkeypatch):
+    """서명이 맞지 않으면 401"""
+    monkeypatch.setattr(settings, "GITHUB_WEBHOOK_SECRET", WEBHOOK_SECRET)
+    response = await async_client.post(
+        "/api/v1/webhooks/github",
+        content=json.dumps(PUSH_PAYLOAD),
+        headers={"X-GitHub-Event": "push", "X-Hub-Signature-256": "sha256=deadbeef"},
+    )
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_webhook_push_stores_commits_for_journal(
+    async_client: AsyncClient,
+    engine,
+    db_session,
+    shared_redis,
+    test_user,
+    test_repo,
+    monkeypatch
+):
+    """push는 대기열에 저장 후 응답하고, 백그라운드에서 상세 정보와 함께 저장한 커밋을 일지 생성 시 재사용하는지 검증"""
+    monkeypatch.setattr(settings, "GITHUB_WEBHOOK_SECRET", WEBHOOK_SECRET)
+    monkeypatch.setattr(commit_service, "AsyncSessionLocal", async_sessionmaker(engine, expire_on_commit=False))
+    test_user.access_token_encrypted = encrypt_token("gh_webhook_token")
+    test_user.selected_repo_id = test_repo.id
+    await db_session.commit()
+
+    body = json.dumps(PUSH_PAYLOAD).encode()
+    async with respx.mock:
+        detail_route = respx.get(f"https://api.github.com/repos/test/repo/commits/{COMMIT_SHA}").mock(
+            return_value=Response(200, json=MOCK_COMMIT_DETAIL)
+        )
+        response = await async_client.post(
+            "/api/v1/webhooks/github",
+            content=body,
+            headers={"X-GitHub-Event": "push", "X-Hub-Signature-256": _sign(body)},
+        )
+    assert response.status_code == 202
+    assert response.json()["queued"] is True
+    assert detail_route.call_count == 1
+    assert await shared_redis.llen(commit_service.PUSH_QUEUE_KEY) == 0
+    assert await shared_redis.scard(commit_service.PENDING_PUSHES_KEY.format(repo_name="test/repo")) == 0
+
+    service = JournalService(db_session)
+    target_date = date(2025, 3, 1)
+
+    # 1. daily-status: 저장된 커밋으로 판단 (GitHub 호출 없음)
+    async with respx.mock:
+        status = await service.check_daily_status(test_user, target_date)
+    assert status.has_commits is True
+
+    # 2. Webhook 수집 이전 날짜: 목록만 조회하고 저장된 커밋은 상세 조회 생략
+    async with respx.mock:
+        list_route = respx.get("https://api.github.com/repos/test/repo/commits").mock(
+            return_value=Response(200, json=[{"sha": COMMIT_SHA}])
+        )
+        commits = await service._collect_commits("test/repo", target_date, "gh_webhook_token")
+    assert list_route.call_count == 1
+    assert commits[0]["message"] == "feat: webhook"
+    assert commits[0]["files"][0]["filename"] == "app/hooks.py"
+
+    # 3. Webhook 수집 이후 날짜: DB만 사용
+    await shared_redis.set(commit_service.WEBHOOK_SINCE_KEY.format(repo_name="test/repo"), "0")
+    async with respx.mock:
+        commits = await service._collect_commits("test/repo", target_date, "gh_webhook_token")
+    assert commits[0]["additions"] == 4
+
+@pytest.mark.asyncio
+async def test_webhook_coverage_is_not_trusted_while_incomplete(engine, shared_redis, monkeypatch):
+    """보강 대기 중인 push가 있거나, 보강할 토큰이 없어 커밋을 버린 경우 DB만으로 응답하지 않음"""
+    monkeypatch.setattr(commit_service, "AsyncSessionLocal", async_sessionmaker(engine, expire_on_commit=False))
+    payload = {**PUSH_PAYLOAD, "repository": {"full_name": "test/unregistered", "default_branch": "main"}}
+    target_date = date(2025, 3, 1)
+    since_key = commit_service.WEBHOOK_SINCE_KEY.format(repo_name="test/unregistered")
+    await shared_redis.set(since_key, "0")
+    assert await commit_service.is_webhook_covered("test/unregistered", target_date) is True
+
+    # 1. 대기열에 저장된 push는 보강 전까지 커버리지 무효
+    assert await commit_service.enqueue_push(payload) is True
+    assert await commit_service.is_webhook_covered("test/unregistered", target_date) is False
+
+    # 2. 저장소를 등록한 사용자가 없어 보강하지 못하면 커버리지를 지금부터 다시 시작 (만료 시간 포함)
+    assert await commit_service.process_push_queue() == 0
+    assert float(await shared_redis.get(since_key)) > 0
+    assert 0 < await shared_redis.ttl(since_key) <= settings.GITHUB_WEBHOOK_COVERAGE_SECONDS
+    assert await commit_service.is_webhook_covered("test/unregistered", target_date) is False
+
+@pytest.mark.asyncio
+async def test_ingest_push_stores_non_distinct_commits_by_committer_date(
+    db_session,
+    shared_redis,
+    test_user,
+    test_repo
+):
+    """머지로 들어온 distinct=false 커밋도 저장하고, 날짜는 push timestamp(author date)가 아닌 committer date 기준"""
+    test_user.access_token_encrypted = encrypt_token("gh_webhook_token")
+    test_user.selected_repo_id = test_repo.id
+    await db_session.commit()
+    merged_sha = "9e" * 20
+    since_key = commit_service.WEBHOOK_SINCE_KEY.format(repo_name="test/repo")
+    await shared_redis.set(since_key, "0")
+    payload = {
+        **PUSH_PAYLOAD,
+        "commits": [
+            {**PUSH_PAYLOAD["commits"][0], "id": merged_sha, "distinct": False, "timestamp": "2025-02-20T10:00:00+09:00"}
+        ],
+    }
+    merged_detail = {
+        **MOCK_COMMIT_DETAIL,
+        "sha": merged_sha,
+        "commit": {"message": "feat: rebased", "committer": {"date": "2025-03-02T01:00:00Z"}},
+    }
+
+    async with respx.mock:
+        respx.get(f"https://api.github.com/repos/test/repo/commits/{merged_sha}").mock(
+            return_value=Response(200, json=merged_detail)
+        )
+        assert await commit_service.ingest_push(payload, db_session) == 1
+
+    assert list(await commit_service.load_commits("test/repo", date(2025, 2, 20), db_session)) == []
+    merged = await commit_service.load_commits("test/repo", date(2025, 3, 2), db_session)
+    assert merged[merged_sha]["message"] == "feat: rebased"
+    assert "committed_at" not in merged[merged_sha]
+    # 모든 커밋을 저장했으므로 커버리지는 재시작하지 않음
+    assert await shared_redis.get(since_key) == "0"
@@ -0,0 +1,296 @@
+import asyncio
+import json
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from app.core.config import settings
+from app.services import gemini_limiter, gemini_service
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.gemini_limiter import GeminiLimiter
+from app.services.gemini_service import (
+    GeminiQuotaError,
+    GeminiService,
+    GeminiUnavailableError,
+    generation_cache_key,
+)
+from app.services.prompt_builder import BudgetReport, estimate_tokens, fit_commits
+
+COMMITS = [
+    {
+        "message": "feat: add cache",
+        "additions": 10,
+        "deletions": 2,
+        "changed_files": 1,
+        "files": [{"filename": "app/cache.py", "status": "added", "additions": 10, "deletions": 2, "patch": "+x"}],
+    }
+]
+
+AI_RESULT = {"summary": "캐시를 추가했습니다.", "main_tasks": ["캐시 도입"], "learned_things": ["TTL 설계"]}
+
+def test_generation_cache_key_is_stable():
+    """키 순서가 달라도 같은 키, 프롬프트 버전이 바뀌면 다른 키"""
+    reordered = [{k: COMMITS[0][k] for k in reversed(list(COMMITS[0]))}]
+    key = generation_cache_key(COMMITS, "2025-01-19")
+    assert key == generation_cache_key(reordered, "2025-01-19")
+
+    with patch.object(gemini_service, "PROMPT_VERSION", gemini_service.PROMPT_VERSION + 1):
+        assert generation_cache_key(COMMITS, "2025-01-19") != key
+
+@pytest.mark.asyncio
+async def test_generate_journal_uses_cache_unless_forced(shared_redis):
+    """동일 입력 재생성은 모델을 호출하지 않고, force=True면 다시 호출"""
+    service = GeminiService()
+    before = gemini_service.get_generation_cache_stats()
+
+    report = BudgetReport(budget=100, total_tokens=50, kept_tokens=50, commits_total=1, commits_kept=1)
+    with patch.object(GeminiService, "_generate", AsyncMock(return_value=(AI_RESULT, report))) as mock_generate:
+        first, first_report = await service.generate_journal(COMMITS, "2025-01-19")
+        second, second_report = await service.generate_journal(COMMITS, "2025-01-19")
+        assert mock_generate.await_count == 1
+        assert first == second == AI_RESULT
+        # 캐시 적중은 프롬프트를 만들지 않으므로 예산 결과 없음
+        assert first_report is report and second_report is None
+
+        await service.generate_journal(COMMITS, "2025-01-19", force=True)
+        assert mock_generate.await_count == 2
+
+    stats = gemini_service.get_generation_cache_stats()
+    assert stats["lookups"] - before["lookups"] == 2
+    assert stats["hits"] - before["hits"] == 1
+    assert 0 < stats["hit_ratio"] <= 1
+
+def test_fit_commits_respects_budget_and_ranks_by_signal():
+    """예산을 넘지 않고, 중요도 높은 커밋/파일/patch를 우선 유지"""
+    big_patch = "+" + "x" * 4000
+    commits = [
+        {"message": "chore: bump deps", "additions": 1, "deletions": 1, "changed_files": 1,
+         "files": [{"filename": "package.json", "status": "modified", "additions": 1, "deletions": 1, "patch": "+1"}]},
+        {"message": "feat: add search index", "additions": 300, "deletions": 20, "changed_files": 2,
+         "files": [
+             {"filename": "app/search.py", "status": "added", "additions": 280, "deletions": 0, "patch": big_patch},
+             {"filename": "README.md", "status": "modified", "additions": 20, "deletions": 20, "patch": "+docs"},
+         ]},
+    ] + [
+        {"message": f"wip {i}", "additions": 1, "deletions": 0, "changed_files": 0, "files": []}
+        for i in range(200)
+    ]
+
+    selected, report = fit_commits(commits, budget=600)
+
+    assert report.kept_tokens <= 600
+    assert report.dropped_tokens > 0
+    assert report.commits_kept < report.commits_total
+    assert estimate_tokens(json.dumps(selected, ensure_ascii=False)) <= 600 + report.commits_kept
+    # feat 커밋과 그 코드 파일은 유지, 큰 patch는 예산 초과로 제외
+    feat = next(c for c in selected if c["message"].startswith("feat"))
+    assert feat["files"][0]["filename"] == "app/search.py"
+    assert "patch" not in feat["files"][0]
+    assert report.patches_dropped >= 1
+
+def test_estimate_tokens_counts_non_ascii_per_char():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcdefgh") == 2
+    # 한글 4글자 + ASCII 5글자(공백 포함) → 4 + ceil(5 / 4)
+    assert estimate_tokens("캐시 추가 fix") == 6
+    text = "feat: 검색 인덱스 추가 🚀 " * 1000
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    assert estimate_tokens(text) == non_ascii + (len(text) - non_ascii + 3) // 4
+
+def test_fit_commits_keeps_everything_within_budget():
+    selected, report = fit_commits(COMMITS, budget=10_000)
+    assert selected[0]["files"][0]["patch"] == "+x"
+    assert report.trimmed is False
+
+@pytest.mark.asyncio
+async def test_large_day_uses_bounded_map_reduce(monkeypatch):
+    """임계치를 넘으면 청크별 요약을 제한된 동시성으로 수행한 뒤 통합"""
+    monkeypatch.setattr(settings, "GEMINI_MAP_REDUCE_THRESHOLD_TOKENS", 500)
+    monkeypatch.setattr(settings, "GEMINI_MAP_CHUNK_TOKENS", 200)
+    monkeypatch.setattr(settings, "GEMINI_MAP_CONCURRENCY", 2)
+    commits = [
+        {"message": f"feat: step {i}", "additions": i, "deletions": 0, "changed_files": 1,
+         "files": [{"filename": f"app/step_{i}.py", "status": "added", "additions": i, "deletions": 0, "patch": "+" * 200}]}
+        for i in range(20)
+    ]
+    service = GeminiService()
+    prompts, running, peak = [], 0, 0
+
+    async def fake_generate(prompt):
+        nonlocal running, peak
+        prompts.append(prompt)
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return SimpleNamespace(text=json.dumps(AI_RESULT, ensure_ascii=False))
+
+    with patch.object(service.model, "generate_content_async", side_effect=fake_generate):
+        result, report = await service._generate(commits, "2025-01-20")
+
+    assert result == AI_RESULT
+    assert len(prompts) > 2
+    # 청크별 예산 결과를 일지 1건 기준으로 합산
+    assert report.commits_total == len(commits)
+    assert report.budget == settings.GEMINI_MAP_CHUNK_TOKENS * (len(prompts) - 1)
+    assert peak <= 2
+    assert all("구간입니다" in prompt for prompt in prompts[:-1])
+    assert "Partial Summaries" in prompts[-1]
+
+@pytest.mark.asyncio
+async def test_map_chunks_take_limiter_slots_and_cancel_on_failure(monkeypatch):
+    """청크 호출마다 limiter 슬롯을 확보하고, 한 청크가 실패하면 남은 청크 호출은 취소"""
+    monkeypatch.setattr(settings, "GEMINI_MAP_CHUNK_TOKENS", 200)
+    monkeypatch.setattr(settings, "GEMINI_MAP_CONCURRENCY", 4)
+    monkeypatch.setattr(settings, "GEMINI_MAX_CONCURRENCY", 2)
+    monkeypatch.setattr(gemini_service, "gemini_circuit", CircuitBreaker("gemini-test", failure_threshold=100, recovery_seconds=30))
+    monkeypatch.setattr(settings, "GEMINI_RETRY_ATTEMPTS", 1)
+    commits = [
+        {"message": f"feat: step {i}", "additions": i, "deletions": 0, "changed_files": 1,
+         "files": [{"filename": f"app/step_{i}.py", "status": "added", "additions": i, "deletions": 0, "patch": "+" * 200}]}
+        for i in range(12)
+    ]
+    service = GeminiService()
+    calls, running, peak, cancelled = 0, 0, 0, 0
+
+    async def fake_generate(prompt):
+        nonlocal calls, running, peak, cancelled
+        calls += 1
+        running += 1
+        peak = max(peak, running)
+        try:
+            if calls == 1:
+                raise google_exceptions.InvalidArgument("bad request")
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        finally:
+            running -= 1
+        return SimpleNamespace(text=json.dumps(AI_RESULT, ensure_ascii=False))
+
+    with patch.object(service.model, "generate_content_async", side_effect=fake_generate):
+        with pytest.raises(gemini_service.GeminiServiceError):
+            await service._map(commits, "2025-01-20")
+        await asyncio.sleep(0)
+
+    assert peak <= 2
+    assert calls < len(commits)
+    assert cancelled >= 1
+    assert running == 0
+
+@pytest.mark.asyncio
+async def test_limiter_round_robins_users_and_rejects_when_full(monkeypatch):
+    """슬롯은 사용자 간 라운드로빈으로 넘겨주고, 대기열이 가득 차면 즉시 거절"""
+    monkeypatch.setattr(settings, "GEMINI_MAX_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "GEMINI_MAX_QUEUE", 3)
+    limiter = GeminiLimiter()
+    order, gate = [], asyncio.Event()
+
+    async def call(user: str, label: str):
+        async with limiter.slot(user):
+            order.append(label)
+            await gate.wait()
+
+    tasks = [asyncio.create_task(call("a", "a1"))]
+    await asyncio.sleep(0)
+    for user, label in [("a", "a2"), ("a", "a3"), ("b", "b1")]:
+        tasks.append(asyncio.create_task(call(user, label)))
+        await asyncio.sleep(0)
+
+    with pytest.raises(asyncio.QueueFull):
+        async with limiter.slot("c"):
+            pass
+    assert limiter.stats()["waiting_users"] == 2
+
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert order == ["a1", "a2", "b1", "a3"]
+    assert limiter.stats()["active"] == 0
+    assert limiter.stats()["rejected"] == 1
+
+@pytest.mark.asyncio
+async def test_global_slot_is_kept_while_call_outlives_lease(shared_redis, monkeypatch):
+    """리스보다 오래 걸리는 호출도 하트비트로 전역 슬롯을 유지해 다른 워커가 회수하지 못함"""
+    monkeypatch.setattr(settings, "GEMINI_GLOBAL_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "GEMINI_QUEUE_TIMEOUT_SECONDS", 0.3)
+    monkeypatch.setattr(gemini_limiter, "GLOBAL_LEASE_SECONDS", 0.1)
+    monkeypatch.setattr(gemini_limiter, "GLOBAL_HEARTBEAT_SECONDS", 0.02)
+    worker_a, worker_b = GeminiLimiter(), GeminiLimiter()
+    started, gate = asyncio.Event(), asyncio.Event()
+
+    async def long_call():
+        async with worker_a.slot("a"):
+            started.set()
+            await gate.wait()
+
+    task = asyncio.create_task(long_call())
+    await started.wait()
+    with pytest.raises(asyncio.TimeoutError):
+        async with worker_b.slot("b"):
+            pass
+
+    gate.set()
+    await task
+    assert await shared_redis.zcard(gemini_limiter.GLOBAL_SLOTS_KEY) == 0
+    async with worker_b.slot("b"):
+        pass
+
+def test_gemini_sdk_is_imported_lazily():
+    """앱 import만으로는 SDK를 로드하지 않고, 모델은 프로세스에서 한 번만 생성"""
+    code = (
+        "import sys, app.main; "
+        "assert 'google.generativeai' not in sys.modules; "
+        "from app.services.gemini_service import GeminiService; "
+        "assert GeminiService().model is GeminiService().model; "
+        "assert 'google.generativeai' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[2])
+
+@pytest.mark.asyncio
+async def test_quota_error_without_short_hint_is_not_retried():
+    """할당량 초과는 서버 힌트가 길거나 없으면 재시도 없이 429로 실패"""
+    service = GeminiService()
+    error = google_exceptions.ResourceExhausted("Quota exceeded. Please retry in 42s.")
+    with (
+        patch.object(service.model, "generate_content_async", AsyncMock(side_effect=error)) as mock_call,
+        pytest.raises(GeminiQuotaError) as exc_info,
+    ):
+        await service._call("prompt")
+    assert mock_call.await_count == 1
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after == 42
+
+@pytest.mark.asyncio
+async def test_transient_errors_trip_circuit_breaker(monkeypatch):
+    """연속 일시 장애로 서킷이 열리면 호출 없이 즉시 실패하고, 복구 후 시험 호출 성공 시 닫힘"""
+    circuit = CircuitBreaker("gemini-test", failure_threshold=2, recovery_seconds=30)
+    monkeypatch.setattr(gemini_service, "gemini_circuit", circuit)
+    monkeypatch.setattr(gemini_service, "_backoff", lambda retry_state: 0)
+    monkeypatch.setattr(settings, "GEMINI_RETRY_ATTEMPTS", 3)
+    service = GeminiService()
+
+    failing = AsyncMock(side_effect=google_exceptions.ServiceUnavailable("down"))
+    with patch.object(service.model, "generate_content_async", failing):
+        with pytest.raises(GeminiUnavailableError):
+            await service._call("prompt")
+        assert failing.await_count == 2  # 두 번째 실패에서 서킷 오픈 → 재시도 중단
+        with pytest.raises(GeminiUnavailableError) as exc_info:
+            await service._call("prompt")
+        assert failing.await_count == 2
+        assert exc_info.value.retry_after > 0
+
+    circuit.opened_at -= 30
+    ok = AsyncMock(return_value=SimpleNamespace(text=json.dumps(AI_RESULT)))
+    with patch.object(service.model, "generate_content_async", ok):
+        assert await service._call("prompt") == AI_RESULT
+
+    stats = circuit.stats()
+    assert stats["state"] == "closed"
+    assert stats["rejected"] == 1
+    assert stats["transitions"] == {"closed_to_open": 1, "open_to_half_open": 1, "half_open_to_closed": 1}
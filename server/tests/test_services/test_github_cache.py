@@ -0,0 +1,93 @@
+from datetime import date
+
+import pytest
+import respx
+from httpx import Response
+
+from app.core.config import settings
+from app.services import github_cache
+from app.services.github_cache import commit_detail_cache
+from app.services.github_service import fetch_commits, get_repositories, has_commits
+
+MOCK_REPOS = [{"id": 1, "name": "repo", "full_name": "octocat/repo"}]
+
+MOCK_COMMIT_DETAIL = {
+    "sha": "123456",
+    "commit": {"message": "feat: init project"},
+    "files": [{"filename": "app/main.py", "status": "modified", "patch": "+ print('hello')"}]
+}
+
+@pytest.mark.asyncio
+async def test_repositories_use_etag_and_replay_304(shared_redis):
+    """두 번째 호출은 If-None-Match로 요청하고 304 시 캐시 본문을 반환"""
+    before = github_cache.get_etag_stats()
+
+    async with respx.mock:
+        route = respx.get("https://api.github.com/user/repos").mock(
+            side_effect=[
+                Response(200, json=MOCK_REPOS, headers={"ETag": '"v1"'}),
+                Response(304, headers={"ETag": '"v1"'}),
+            ]
+        )
+        first = await get_repositories("test_token")
+        second = await get_repositories("test_token")
+
+    assert first == second == MOCK_REPOS
+    assert "if-none-match" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["if-none-match"] == '"v1"'
+
+    after = github_cache.get_etag_stats()
+    assert after["not_modified"] == before["not_modified"] + 1
+
+@pytest.mark.asyncio
+async def test_etag_cache_is_scoped_per_token(shared_redis):
+    """다른 토큰은 캐시된 ETag를 공유하지 않음"""
+    async with respx.mock:
+        route = respx.get("https://api.github.com/user/repos").mock(
+            return_value=Response(200, json=MOCK_REPOS, headers={"ETag": '"v1"'})
+        )
+        await get_repositories("token_a")
+        await get_repositories("token_b")
+
+    assert "if-none-match" not in route.calls[1].request.headers
+
+@pytest.mark.asyncio
+async def test_regenerating_unchanged_day_skips_detail_calls(shared_redis):
+    """같은 날짜를 다시 조회하면 커밋 상세 API를 호출하지 않음 (LRU/Redis 모두)"""
+    repo_name = "octocat/Hello-World"
+    list_url = f"https://api.github.com/repos/{repo_name}/commits"
+
+    async with respx.mock:
+        respx.get(list_url).mock(return_value=Response(200, json=[{"sha": "123456"}]))
+        detail_route = respx.get(f"{list_url}/123456").mock(
+            return_value=Response(200, json=MOCK_COMMIT_DETAIL)
+        )
+
+        first = await fetch_commits(repo_name, date(2025, 1, 19), "token_a")
+        # 다른 팀원(토큰) + 다른 워커(LRU 비어 있음)라도 Redis 캐시를 공유
+        commit_detail_cache.clear_local()
+        second = await fetch_commits(repo_name, date(2025, 1, 19), "token_b")
+
+    assert first == second
+    assert detail_route.call_count == 1
+    assert commit_detail_cache.stats()["redis_hits"] >= 1
+
+@pytest.mark.asyncio
+async def test_has_commits_probe_is_single_call_and_cached(shared_redis):
+    """daily-status 확인은 per_page=1 요청 한 번, 이후에는 캐시 사용"""
+    repo_name = "octocat/Hello-World"
+    past_day = date(2025, 1, 19)
+
+    async with respx.mock:
+        route = respx.get(f"https://api.github.com/repos/{repo_name}/commits").mock(
+            return_value=Response(200, json=[{"sha": "123456"}])
+        )
+        assert await has_commits(repo_name, past_day, "token_a") is True
+        assert await has_commits(repo_name, past_day, "token_b") is True
+
+    assert route.call_count == 1
+    assert route.calls[0].request.url.params["per_page"] == "1"
+
+    # 지난 날짜는 긴 TTL 적용
+    ttl = await shared_redis.ttl(f"github:probe:{repo_name.lower()}:{past_day.isoformat()}")
+    assert ttl > settings.GITHUB_PROBE_TTL_SECONDS
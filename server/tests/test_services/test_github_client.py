@@ -0,0 +1,34 @@
+import pytest
+import respx
+from httpx import Response
+
+from app.core import github_client
+from app.services.github_service import get_user_info
+
+
+@pytest.mark.asyncio
+async def test_github_calls_share_pooled_client():
+    """모든 GitHub 호출이 하나의 공용 클라이언트를 재사용하는지 검증"""
+    client = github_client.get_github_client()
+
+    async with respx.mock:
+        respx.get("https://api.github.com/user").mock(
+            return_value=Response(200, json={"id": 1, "login": "octocat"})
+        )
+        await get_user_info("test_token")
+        await get_user_info("test_token")
+
+    # 호출 후에도 동일한 클라이언트가 유지되어야 함 (요청마다 새로 만들지 않음)
+    assert github_client.get_github_client() is client
+
+@pytest.mark.asyncio
+async def test_pool_stats_lifecycle():
+    """lifespan 시작/종료에 따른 풀 상태 노출 검증"""
+    await github_client.init_github_client()
+    stats = github_client.get_pool_stats()
+    assert stats["started"] is True
+    assert stats["open_connections"] == 0
+    assert {"idle_connections", "queued_requests", "wait_ms_avg", "wait_ms_max"} <= stats.keys()
+
+    await github_client.close_github_client()
+    assert github_client.get_pool_stats()["started"] is False
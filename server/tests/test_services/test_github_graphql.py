@@ -0,0 +1,118 @@
+import json
+from datetime import date
+
+import pytest
+import respx
+from httpx import Response
+from pydantic import ValidationError
+
+from app.core.config import Settings, settings
+from app.services.github_service import GithubResourceNotFoundError, fetch_commits
+
+# 로컬 GraphQL 대역 엔드포인트
+GRAPHQL_URL = "http://localhost:8787/graphql"
+REPO_NAME = "octocat/Hello-World"
+
+def _history_page(nodes: list[dict], end_cursor: str | None) -> dict:
+    return {
+        "data": {
+            "repository": {
+                "defaultBranchRef": {
+                    "target": {
+                        "history": {
+                            "pageInfo": {"hasNextPage": end_cursor is not None, "endCursor": end_cursor},
+                            "nodes": nodes,
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+NODE_1 = {"oid": "aaa111", "message": "feat: a", "additions": 10, "deletions": 2, "changedFilesIfAvailable": 3}
+NODE_2 = {"oid": "bbb222", "message": "fix: b", "additions": 1, "deletions": 1, "changedFilesIfAvailable": 1}
+
+@pytest.fixture
+def graphql_backend(monkeypatch):
+    monkeypatch.setattr(settings, "GITHUB_COMMIT_BACKEND", "graphql")
+    monkeypatch.setattr(settings, "GITHUB_GRAPHQL_URL", GRAPHQL_URL)
+
+def _paged_graphql(request):
+    variables = json.loads(request.content)["variables"]
+    if variables["after"] is None:
+        return Response(200, json=_history_page([NODE_1], "cursor-1"))
+    return Response(200, json=_history_page([NODE_2], None))
+
+@pytest.mark.asyncio
+async def test_graphql_backend_without_patches_makes_no_rest_calls(graphql_backend):
+    """patch가 필요 없으면 GraphQL 페이지 요청만으로 하루치 히스토리를 수집"""
+    async with respx.mock:
+        graphql_route = respx.post(GRAPHQL_URL).mock(side_effect=_paged_graphql)
+        rest_route = respx.get(url__startswith="https://api.github.com/repos/")
+
+        commits = await fetch_commits(REPO_NAME, date(2025, 1, 19), "test_token", include_patches=False)
+
+    assert graphql_route.call_count == 2
+    assert not rest_route.called
+    assert [c["message"] for c in commits] == ["feat: a", "fix: b"]
+    assert commits[0]["additions"] == 10
+    assert commits[0]["changed_files"] == 3
+
+@pytest.mark.asyncio
+async def test_graphql_backend_fetches_patches_only_when_needed(graphql_backend):
+    """patch가 필요하면 GraphQL 목록 SHA에 대해서만 REST 상세 조회"""
+    detail = {
+        "commit": {"message": "feat: a"},
+        "stats": {"additions": 10, "deletions": 2},
+        "files": [{"filename": "a.py", "status": "modified", "additions": 10, "deletions": 2, "patch": "+a"}],
+    }
+    async with respx.mock:
+        respx.post(GRAPHQL_URL).mock(return_value=Response(200, json=_history_page([NODE_1], None)))
+        detail_route = respx.get(f"https://api.github.com/repos/{REPO_NAME}/commits/aaa111").mock(
+            return_value=Response(200, json=detail)
+        )
+
+        commits = await fetch_commits(REPO_NAME, date(2025, 1, 19), "test_token")
+
+    assert detail_route.call_count == 1
+    assert commits[0]["files"][0]["patch"] == "+a"
+
+@pytest.mark.asyncio
+async def test_graphql_backend_skips_details_outside_prompt_budget(graphql_backend):
+    """프롬프트 예산에서 파일/patch를 받지 못할 커밋은 REST 상세 조회 없이 GraphQL 메타데이터만 사용"""
+    detail = {
+        "commit": {"message": "feat: a"},
+        "stats": {"additions": 10, "deletions": 2},
+        "files": [{"filename": "a.py", "status": "modified", "additions": 10, "deletions": 2, "patch": "+a"}],
+    }
+    async with respx.mock:
+        respx.post(GRAPHQL_URL).mock(side_effect=_paged_graphql)
+        detail_route = respx.get(f"https://api.github.com/repos/{REPO_NAME}/commits/aaa111").mock(
+            return_value=Response(200, json=detail)
+        )
+        skipped_route = respx.get(f"https://api.github.com/repos/{REPO_NAME}/commits/bbb222")
+        fetched: dict[str, dict] = {}
+
+        commits = await fetch_commits(REPO_NAME, date(2025, 1, 19), "test_token", fetched=fetched, detail_budget=50)
+
+    assert detail_route.call_count == 1
+    assert not skipped_route.called
+    assert commits[0]["files"][0]["patch"] == "+a"
+    assert commits[1] == {"message": "fix: b", "additions": 1, "deletions": 1, "changed_files": 1, "files": []}
+    # 메타데이터만 있는 커밋은 로컬 커밋 저장소에 기록하지 않음
+    assert list(fetched) == ["aaa111"]
+
+def test_commit_backend_rejects_unknown_value():
+    """잘못된 백엔드 이름은 조용히 REST로 대체하지 않고 시작 시 실패"""
+    with pytest.raises(ValidationError):
+        Settings(GITHUB_COMMIT_BACKEND="grpahql")
+
+@pytest.mark.asyncio
+async def test_graphql_backend_maps_not_found(graphql_backend):
+    """GraphQL NOT_FOUND 오류를 GithubResourceNotFoundError로 변환"""
+    async with respx.mock:
+        respx.post(GRAPHQL_URL).mock(
+            return_value=Response(200, json={"data": {"repository": None}, "errors": [{"type": "NOT_FOUND", "message": "nope"}]})
+        )
+        with pytest.raises(GithubResourceNotFoundError):
+            await fetch_commits(REPO_NAME, date(2025, 1, 19), "test_token")
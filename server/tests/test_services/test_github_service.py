@@ -1,8 +1,27 @@
+import asyncio
+import json
+import time
 import pytest
 import respx
-from httpx import Response
+from httpx import AsyncByteStream, Response
 from datetime import date
-from app.services.github_service import fetch_commits, GithubNoCommitsError
+from app.core.config import settings
+from app.services.github_scheduler import github_scheduler, token_key
+from app.services.github_service import (
+    fetch_commits, fetch_commit_details, iter_commits, get_repositories, get_user_info,
+    GithubNoCommitsError, GithubRateLimitError,
+)
+from app.utils.json_stream import ObjectStreamParser
+
+class ChunkedStream(AsyncByteStream):
+    """응답 본문을 작은 청크로 나눠 전달하는 스트림"""
+    def __init__(self, body: bytes, size: int):
+        self.body = body
+        self.size = size
+
+    async def __aiter__(self):
+        for i in range(0, len(self.body), self.size):
+            yield self.body[i:i + self.size]
 
 # Mock 데이터
 MOCK_COMMITS = [
@@ -71,4 +90,208 @@ async def test_fetch_commits_empty():
         )
         # 예외 발생 확인
         with pytest.raises(GithubNoCommitsError):
-            await fetch_commits(repo_name, target_date, "test_token")
\ No newline at end of file
+            await fetch_commits(repo_name, target_date, "test_token")
+
+@pytest.mark.asyncio
+async def test_fetch_commit_details_reports_failed_shas():
+    """상세 조회 실패 SHA를 누락 없이 보고하는지 검증"""
+    repo_name = "octocat/Hello-World"
+    base_url = f"https://api.github.com/repos/{repo_name}/commits"
+
+    async with respx.mock:
+        respx.get(f"{base_url}/123456").mock(return_value=Response(200, json=MOCK_COMMIT_DETAIL))
+        respx.get(f"{base_url}/badsha").mock(return_value=Response(500))
+
+        result = await fetch_commit_details(repo_name, ["123456", "badsha"], "test_token")
+
+    assert len(result.commits) == 1
+    assert list(result.failed_shas) == ["badsha"]
+
+@pytest.mark.asyncio
+async def test_fetch_commit_details_respects_concurrency_and_retry_after(monkeypatch):
+    """토큰별 동시성 상한 및 Retry-After 재시도 검증"""
+    monkeypatch.setattr(settings, "GITHUB_PER_TOKEN_CONCURRENCY", 2)
+    repo_name = "octocat/Hello-World"
+    shas = [f"sha{i}" for i in range(6)]
+    in_flight = 0
+    max_in_flight = 0
+    throttled = {"sha0": True}
+
+    async def detail(request, sha):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if throttled.pop(sha, False):
+            return Response(429, headers={"Retry-After": "0"})
+        return Response(200, json=MOCK_COMMIT_DETAIL)
+
+    async with respx.mock:
+        respx.get(url__regex=rf"https://api.github.com/repos/{repo_name}/commits/(?P<sha>\w+)").mock(
+            side_effect=detail
+        )
+        result = await fetch_commit_details(repo_name, shas, "limited_token")
+
+    assert max_in_flight <= 2
+    assert len(result.commits) == 6
+    assert result.failed_shas == {}
+
+@pytest.mark.asyncio
+async def test_scheduler_defers_low_priority_when_quota_reserved():
+    """잔여 할당량이 예약분 이하이면 LOW(저장소 목록)는 거절되고 HIGH는 계속 처리되는지 검증"""
+    token = "quota_token"
+    reset_at = int(time.time()) + 600
+    quota_headers = {
+        "X-RateLimit-Limit": "5000",
+        "X-RateLimit-Remaining": str(settings.GITHUB_QUOTA_RESERVE - 1),
+        "X-RateLimit-Reset": str(reset_at),
+    }
+
+    async with respx.mock:
+        user_route = respx.get("https://api.github.com/user").mock(
+            return_value=Response(200, json={"login": "octocat"}, headers=quota_headers)
+        )
+        repos_route = respx.get("https://api.github.com/user/repos").mock(
+            return_value=Response(200, json=[])
+        )
+
+        await get_user_info(token)
+        with pytest.raises(GithubRateLimitError) as exc_info:
+            await get_repositories(token)
+        await get_user_info(token)
+
+    assert repos_route.call_count == 0
+    assert user_route.call_count == 2
+    assert exc_info.value.retry_after > settings.GITHUB_LOW_PRIORITY_MAX_WAIT
+
+    stats = github_scheduler.stats()
+    assert stats["rejected_low"] >= 1
+    snapshot = stats["tokens"][token_key(token)]
+    assert snapshot["remaining"] == settings.GITHUB_QUOTA_RESERVE - 1
+    assert snapshot["reset_at"] == reset_at
+
+@pytest.mark.asyncio
+async def test_iter_commits_follows_link_pagination():
+    """Link 헤더를 따라 모든 페이지의 커밋을 수집하는지 검증"""
+    repo_name = "octocat/Hello-World"
+    list_url = f"https://api.github.com/repos/{repo_name}/commits"
+    page2_url = f"{list_url}?page=2"
+
+    async with respx.mock:
+        respx.get(list_url, params={"page": "2"}).mock(
+            return_value=Response(200, json=[{"sha": "abcdef"}])
+        )
+        respx.get(list_url).mock(
+            return_value=Response(200, json=MOCK_COMMITS, headers={"Link": f'<{page2_url}>; rel="next"'})
+        )
+        respx.get(f"{list_url}/123456").mock(return_value=Response(200, json=MOCK_COMMIT_DETAIL))
+        respx.get(f"{list_url}/abcdef").mock(return_value=Response(200, json=MOCK_COMMIT_DETAIL))
+
+        commits = await fetch_commits(repo_name, date(2025, 1, 19), "test_token")
+
+    assert len(commits) == 2
+
+@pytest.mark.asyncio
+async def test_iter_commits_stops_early():
+    """소비자가 중간에 멈추면 다음 페이지를 요청하지 않는지 검증"""
+    repo_name = "octocat/Hello-World"
+    list_url = f"https://api.github.com/repos/{repo_name}/commits"
+
+    async with respx.mock:
+        next_page = respx.get(list_url, params={"page": "2"}).mock(
+            return_value=Response(200, json=[{"sha": "abcdef"}])
+        )
+        respx.get(list_url).mock(
+            return_value=Response(200, json=MOCK_COMMITS, headers={"Link": f'<{list_url}?page=2>; rel="next"'})
+        )
+        respx.get(f"{list_url}/123456").mock(return_value=Response(200, json=MOCK_COMMIT_DETAIL))
+
+        stream = iter_commits(repo_name, date(2025, 1, 19), "test_token")
+        first = await anext(stream)
+        await stream.aclose()
+
+    assert first["message"] == "feat: init project"
+    assert not next_page.called
+
+def test_object_stream_parser_handles_split_tokens():
+    """문자열/이스케이프/숫자가 청크 경계에서 잘려도 동일하게 파싱되는지 검증"""
+    payload = {
+        "sha": "abc",
+        "commit": {"message": "fix: \"quoted\" {brace} [bracket] 한글"},
+        "stats": {"additions": 12345, "deletions": 0},
+        "files": [{"filename": "a.py", "patch": "x\\y"}, {"filename": "b.py", "n": -1.5e3}, []],
+        "empty": [],
+        "flag": True,
+    }
+    parser = ObjectStreamParser(keep_keys=("commit", "stats", "flag"), stream_keys=("files", "empty"))
+    events = []
+    for char in json.dumps(payload, ensure_ascii=False):
+        events.extend(parser.feed(char))
+    events.extend(parser.close())
+
+    assert events == [
+        ("commit", payload["commit"]),
+        ("stats", payload["stats"]),
+        ("files", payload["files"][0]),
+        ("files", payload["files"][1]),
+        ("files", []),
+        ("flag", True),
+    ]
+
+def test_object_stream_parser_truncates_item_strings_while_scanning():
+    """stream 원소의 긴 문자열은 스캔 중에 잘라 버퍼가 원소 크기만큼 커지지 않는지 검증"""
+    patch = '+say("hi")\\n한글 \u00e9' * 20000
+    payload = {"files": [{"filename": "big.py", "patch": patch}, {"filename": "small.py", "patch": "+x"}], "tail": 1}
+    body = json.dumps(payload)
+    parser = ObjectStreamParser(stream_keys=("files",), max_item_string=100)
+    events, peak = [], 0
+    for i in range(0, len(body), 1000):
+        events.extend(parser.feed(body[i:i + 1000]))
+        peak = max(peak, len(parser._buf))
+    events.extend(parser.close())
+
+    assert peak < 1200
+    big, small = (item for _, item in events)
+    assert big["filename"] == "big.py"
+    assert 0 < len(big["patch"]) <= 100
+    assert patch.startswith(big["patch"])
+    assert small == payload["files"][1]
+
+def test_object_stream_parser_keeps_surrogate_pairs_when_truncating():
+    """ensure_ascii로 인코딩된 이모지(서로게이트 쌍)가 자르기 경계에 걸려도 반으로 가르지 않는지 검증"""
+    patch = "+ok \U0001F600\\n" * 50
+    body = json.dumps({"files": [{"patch": patch}]})
+    for limit in range(1, 60):
+        parser = ObjectStreamParser(stream_keys=("files",), max_item_string=limit)
+        events = parser.feed(body[:len(body) // 2]) + parser.feed(body[len(body) // 2:]) + parser.close()
+        truncated = events[0][1]["patch"]
+        assert patch.startswith(truncated)
+        truncated.encode()
+
+@pytest.mark.asyncio
+async def test_fetch_commit_details_streams_large_payload(monkeypatch):
+    """큰 커밋 응답을 스트리밍으로 읽으며 제외 패턴 적용 및 patch 절단"""
+    repo_name = "octocat/Hello-World"
+    files = [
+        {"filename": f"vendor/lib/mod{i}.go", "status": "added", "additions": 1, "deletions": 0, "patch": "+" * 5000}
+        for i in range(200)
+    ]
+    files += [
+        {"filename": "yarn.lock", "status": "modified", "additions": 1, "deletions": 1, "patch": "+x"},
+        {"filename": "app/service.py", "status": "modified", "additions": 2, "deletions": 1, "patch": "+" * 2000},
+    ]
+    body = json.dumps({**MOCK_COMMIT_DETAIL, "files": files}).encode()
+
+    async with respx.mock:
+        respx.get(f"https://api.github.com/repos/{repo_name}/commits/bigsha").mock(
+            return_value=Response(200, stream=ChunkedStream(body, 4096))
+        )
+        result = await fetch_commit_details(repo_name, ["bigsha"], "stream_token")
+
+    detail = result.commits[0]
+    assert detail["message"] == "feat: init project"
+    assert detail["changed_files"] == 202
+    assert [f["filename"] for f in detail["files"]] == ["app/service.py"]
+    assert detail["files"][0]["patch"].endswith("...(truncated)")
+    assert len(detail["files"][0]["patch"]) < 600
@@ -0,0 +1,82 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.journal import Journal
+from app.models.journal_raw_commits import JournalRawCommits
+from app.schemas.journal import JournalCreate
+from app.services.journal_service import JournalService
+
+
+@pytest.mark.asyncio
+async def test_upsert_journal_inserts_updates_and_skips(db_session, test_user, test_repo):
+    """ON CONFLICT 기준으로 신규 생성 → 덮어쓰기(같은 행) → overwrite=False면 거절"""
+    service = JournalService(db_session)
+    target_date = date(2025, 7, 1)
+    # 실패 시 rollback으로 세션 객체가 만료되므로 ID를 미리 보관
+    user_id, repo_id = test_user.id, test_repo.id
+
+    def journal_data(summary: str) -> JournalCreate:
+        return JournalCreate(
+            user_id=user_id,
+            repository_id=repo_id,
+            date=target_date,
+            summary=summary,
+            main_tasks=["task"],
+            learned_things=["thing"],
+            commit_count=1,
+        )
+
+    created = await service._upsert_journal(journal_data("first"), overwrite=True)
+    await db_session.commit()
+    assert created.summary == "first"
+    assert created.created_at is not None
+
+    updated = await service._upsert_journal(journal_data("second"), overwrite=True)
+    await db_session.commit()
+    assert updated.id == created.id
+    assert updated.summary == "second"
+
+    with pytest.raises(ValueError, match="already exists"):
+        await service._upsert_journal(journal_data("third"), overwrite=False)
+
+    count = await db_session.scalar(
+        select(func.count()).select_from(Journal).where(
+            Journal.user_id == user_id,
+            Journal.repository_id == repo_id,
+            Journal.date == target_date,
+        )
+    )
+    assert count == 1
+
+@pytest.mark.asyncio
+async def test_raw_commits_stored_compressed_and_loaded_on_demand(db_session, test_user, test_repo):
+    """원본 커밋은 journals 행이 아닌 별도 테이블에 압축 저장되고, 명시적 조회 시에만 복원"""
+    service = JournalService(db_session)
+    commits = [
+        {"sha": f"{i:040x}", "message": "feat: 일지 압축 저장", "files": [{"filename": "app/main.py", "patch": "+x" * 200}]}
+        for i in range(20)
+    ]
+    journal = await service._upsert_journal(
+        JournalCreate(
+            user_id=test_user.id,
+            repository_id=test_repo.id,
+            date=date(2025, 7, 2),
+            summary="raw",
+            main_tasks=[],
+            learned_things=[],
+            raw_commits=commits,
+        ),
+        overwrite=True,
+    )
+    await db_session.commit()
+
+    assert "raw_commits" not in Journal.__table__.columns
+    stored = await db_session.get(JournalRawCommits, journal.id)
+    assert stored.codec == "zlib"
+    assert len(stored.data) < stored.original_size
+
+    assert await service.get_raw_commits(test_user.id, journal.id) == commits
+    assert await service.get_raw_commits(uuid4(), journal.id) is None
@@ -0,0 +1,161 @@
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.services.gemini_service import GeminiBusyError, GeminiServiceError
+from app.services.github_service import GithubApiError
+from app.services.journal_service import JournalService
+from app.services.single_flight import SingleFlight
+
+
+async def _follow(flight: SingleFlight, started: asyncio.Event, key: str, fn):
+    """먼저 시작한 작업이 진행 중일 때 같은 키로 요청"""
+    await started.wait()
+    return await flight.run(key, fn)
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_within_worker(monkeypatch):
+    """같은 키의 동시 요청은 한 번만 수행되고, 나머지는 완료를 기다린 뒤 None을 받음"""
+    monkeypatch.setattr("app.services.single_flight.get_shared_redis", lambda: None)
+    flight = SingleFlight("test", lock_seconds=5)
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "journal"
+
+    results = await asyncio.gather(*(flight.run("u:r:2025-06-01", work) for _ in range(3)))
+
+    assert calls == 1
+    assert results == ["journal", None, None]
+    assert flight.stats()["local_waits"] == 2
+    assert flight.stats()["in_flight"] == 0
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_result_across_workers(shared_redis):
+    """다른 워커(인스턴스)는 Redis 락을 잡은 쪽의 결과 채널로 완료/에러를 전달받음"""
+    leader, follower = SingleFlight("test", lock_seconds=5), SingleFlight("test", lock_seconds=5)
+    started = asyncio.Event()
+    follower_calls = 0
+
+    async def slow_work():
+        started.set()
+        await asyncio.sleep(0.2)
+        return "journal"
+
+    async def duplicate_work():
+        nonlocal follower_calls
+        follower_calls += 1
+
+    results = await asyncio.gather(
+        leader.run("u:r:2025-06-02", slow_work),
+        _follow(follower, started, "u:r:2025-06-02", duplicate_work),
+    )
+    assert results == ["journal", None]
+    assert follower_calls == 0
+    assert follower.stats()["remote_waits"] == 1
+
+    # 실패도 같은 에러(유형/상태 코드)로 전달
+    started.clear()
+
+    async def failing_work():
+        started.set()
+        await asyncio.sleep(0.2)
+        raise GithubApiError("GitHub API rate limit exceeded", 429)
+
+    leader_result, follower_result = await asyncio.gather(
+        leader.run("u:r:2025-06-03", failing_work),
+        _follow(follower, started, "u:r:2025-06-03", duplicate_work),
+        return_exceptions=True,
+    )
+    assert isinstance(leader_result, GithubApiError)
+    assert isinstance(follower_result, GithubApiError)
+    assert follower_result.status_code == 429
+    assert follower_calls == 0
+
+@pytest.mark.asyncio
+async def test_single_flight_keeps_retry_after_across_workers(shared_redis):
+    """다른 워커에 전달된 할당량/대기열 에러도 Retry-After 힌트를 유지"""
+    leader, follower = SingleFlight("test", lock_seconds=5), SingleFlight("test", lock_seconds=5)
+    started = asyncio.Event()
+
+    async def busy_work():
+        started.set()
+        await asyncio.sleep(0.2)
+        raise GeminiBusyError(retry_after=12.5)
+
+    async def duplicate_work():
+        raise AssertionError("follower must not run the work")
+
+    leader_result, follower_result = await asyncio.gather(
+        leader.run("u:r:2025-06-04", busy_work),
+        _follow(follower, started, "u:r:2025-06-04", duplicate_work),
+        return_exceptions=True,
+    )
+    assert isinstance(leader_result, GeminiBusyError)
+    assert isinstance(follower_result, GeminiServiceError)
+    assert follower_result.status_code == 503
+    assert follower_result.retry_after == 12.5
+
+@pytest.mark.asyncio
+async def test_single_flight_ignores_previous_run_result(shared_redis):
+    """결과 키에 남은 이전 수행의 결과(에러)는 무시하고 지금 수행의 완료를 기다림"""
+    leader, follower = SingleFlight("test", lock_seconds=5), SingleFlight("test", lock_seconds=5)
+    started = asyncio.Event()
+    finished = False
+
+    async def failing_work():
+        raise GithubApiError("upstream down", 502)
+
+    with pytest.raises(GithubApiError):
+        await leader.run("u:r:2025-06-06", failing_work)
+
+    async def slow_work():
+        nonlocal finished
+        started.set()
+        await asyncio.sleep(0.2)
+        finished = True
+        return "journal"
+
+    async def duplicate_work():
+        raise AssertionError("follower must not run the work")
+
+    async def follow():
+        result = await _follow(follower, started, "u:r:2025-06-06", duplicate_work)
+        assert finished
+        return result
+
+    assert await asyncio.gather(leader.run("u:r:2025-06-06", slow_work), follow()) == ["journal", None]
+
+@pytest.mark.asyncio
+async def test_journal_generation_does_not_coalesce_different_options(monkeypatch):
+    """force/overwrite가 다른 요청은 진행 중인 생성에 합치지 않고 각각 수행"""
+    monkeypatch.setattr("app.services.single_flight.get_shared_redis", lambda: None)
+    calls = []
+
+    async def create(self, user, date, overwrite, force):
+        calls.append((overwrite, force))
+        await asyncio.sleep(0.05)
+        return SimpleNamespace(id=uuid4())
+
+    async def saved(self, user, date):
+        return SimpleNamespace(id=None)
+
+    monkeypatch.setattr(JournalService, "_create_daily_journal", create)
+    monkeypatch.setattr(JournalService, "_get_saved_journal", saved)
+    service = JournalService(db=None)
+    user = SimpleNamespace(id=uuid4(), selected_repo_id=uuid4())
+    day = date(2025, 6, 5)
+
+    await asyncio.gather(
+        service.create_daily_journal(user, day, overwrite=True, force=False),
+        service.create_daily_journal(user, day, overwrite=True, force=False),
+        service.create_daily_journal(user, day, overwrite=True, force=True),
+        service.create_daily_journal(user, day, overwrite=False, force=False),
+    )
+    assert sorted(calls) == [(False, False), (True, False), (True, True)]